@@ -0,0 +1,206 @@
+"""
+Asset-Pack: vorgebackene Sprites in Spielgröße
+Alle Bilder aus assets.MANIFEST werden einmalig auf ihre Zielgröße skaliert und
+als rohe BGRA-Pixel in eine Datei geschrieben. Zur Laufzeit wird die Datei per
+mmap eingeblendet und die Surfaces entstehen mit pygame.image.frombuffer direkt
+aus dem gemappten Speicher - ohne PNG-Dekodieren. Bilder mit Alpha-Kanal bleiben
+ohne Kopie im gemappten Speicher (sofern das Displayformat passt); deckende und
+Colorkey-Bilder werden per convert() bzw. Colorkey-Umwandlung kopiert.
+
+Backen: python asset_pack.py
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import pygame
+import assets
+from settings import ASSET_PACK_FILE
+
+MAGIC = b"FDFPACK1"
+VERSION = 3                      # 3: Alpha-Klasse pro Eintrag für alpha=None (automatisch)
+HEADER = struct.Struct("<8sI")   # Magic + Länge des JSON-Index
+ALIGNMENT = 16                   # Pixeldaten auf 16 Byte ausrichten
+PIXEL_FORMAT = "BGRA"            # Entspricht dem 32-Bit-Displayformat (ARGB8888)
+
+
+def _file_hash(path):
+    """SHA1 über den Dateiinhalt (nur nötig, wenn sich die mtime geändert hat)"""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _source_info(path):
+    """Merkmale einer Quelldatei für die Aktualitätsprüfung"""
+    stat = os.stat(path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha1": _file_hash(path)}
+
+
+def _key_to_json(key):
+    path, size, alpha, max_size = key
+    return [path, list(size) if size is not None else None, alpha, max_size]
+
+
+def _key_from_json(data):
+    path, size, alpha, max_size = data
+    return (path, tuple(size) if size is not None else None, alpha, max_size)
+
+
+def bake(manifest=None, pack_path=ASSET_PACK_FILE):
+    """Schreibt alle Bilder des Manifests in Spielgröße in das Asset-Pack"""
+    manifest = manifest if manifest is not None else assets.MANIFEST
+
+    entries = []
+    sources = {}
+    blobs = []
+    offset = 0
+    for path, size, alpha, max_size in manifest:
+        path = os.path.normpath(path)
+        try:
+            raw = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Überspringe {path}: {e}")
+            continue
+
+        target = assets.target_size(raw.get_width(), raw.get_height(), size, max_size)
+        if target is not None:
+            raw = pygame.transform.scale(raw, target)
+        pixels = pygame.image.tobytes(raw, PIXEL_FORMAT)
+
+        entries.append({
+            "key": _key_to_json((path, size, alpha, max_size)),
+            "offset": offset,
+            "width": raw.get_width(),
+            "height": raw.get_height(),
+            # Für alpha=None: Blit-Modus beim Laden ohne erneute Pixelanalyse wählen
+            "alpha_kind": assets.classify_alpha(raw),
+        })
+        if path not in sources:
+            sources[path] = _source_info(path)
+
+        padding = (-len(pixels)) % ALIGNMENT
+        blobs.append(pixels + b"\0" * padding)
+        offset += len(pixels) + padding
+
+    index = json.dumps({
+        "version": VERSION,
+        "format": PIXEL_FORMAT,
+        "sources": sources,
+        "entries": entries,
+    }).encode("utf-8")
+    # Index so auffüllen, dass die Pixeldaten ausgerichtet beginnen
+    index += b" " * ((-(HEADER.size + len(index))) % ALIGNMENT)
+
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, pack_path)  # Atomar ersetzen, falls das Spiel gerade läuft
+
+    print(f"Asset-Pack geschrieben: {pack_path} ({len(entries)} Bilder, {offset // 1024} KB Pixel)")
+    return len(entries)
+
+
+class AssetPack:
+    """Per mmap eingeblendetes Asset-Pack mit Index"""
+
+    def __init__(self, pack_path):
+        self.path = pack_path
+        self._file = open(pack_path, "rb")
+        # ACCESS_COPY: Lesen ohne Kopie, versehentliches Zeichnen landet in privaten Seiten
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._view = memoryview(self._mmap)
+
+        magic, index_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Kein Asset-Pack: {pack_path}")
+        index = json.loads(bytes(self._view[HEADER.size:HEADER.size + index_len]))
+        if index.get("version") != VERSION or index.get("format") != PIXEL_FORMAT:
+            raise ValueError(f"Veraltete Asset-Pack-Version: {pack_path}")
+
+        data_start = HEADER.size + index_len
+        self.stale_sources = self._find_stale_sources(index["sources"])
+
+        # Nur Einträge mit aktueller Quelldatei verwenden, der Rest fällt auf PNG zurück
+        self._entries = {}
+        for entry in index["entries"]:
+            key = _key_from_json(entry["key"])
+            if key[0] in self.stale_sources:
+                continue
+            self._entries[key] = (data_start + entry["offset"], entry["width"], entry["height"],
+                                  entry["alpha_kind"])
+
+    def _find_stale_sources(self, sources):
+        """Findet Quelldateien, die sich seit dem Backen geändert haben"""
+        stale = set()
+        for path, info in sources.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stale.add(path)
+                continue
+            if stat.st_size != info["size"]:
+                stale.add(path)
+            elif stat.st_mtime_ns != info["mtime_ns"] and _file_hash(path) != info["sha1"]:
+                # mtime allein ist unzuverlässig (z.B. nach git checkout) - Inhalt vergleichen
+                stale.add(path)
+        return stale
+
+    def lookup(self, key):
+        """Gibt die Surface für einen Cache-Schlüssel zurück oder None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        offset, width, height, alpha_kind = entry
+        pixels = self._view[offset:offset + width * height * 4]
+        surface = pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+        alpha = key[2]
+        if alpha is None:
+            if alpha_kind != assets.ALPHA_TRANSLUCENT:
+                # Automatisch: deckend oder Colorkey (erzeugt eine Kopie)
+                return assets.convert_for_kind(surface, alpha_kind)
+        elif not alpha:
+            # Deckende Bilder ins Displayformat ohne Alpha-Kanal bringen (schnelleres Blitten)
+            return surface.convert()
+        display = pygame.display.get_surface()
+        if display is not None and surface.get_masks() != display.get_masks()[:3] + (0xFF000000,):
+            # Anderes Displayformat als beim Backen angenommen
+            return surface.convert_alpha()
+        return surface
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def open_pack(pack_path=ASSET_PACK_FILE):
+    """Öffnet das Asset-Pack oder gibt None zurück (fehlt, kaputt oder veraltet)"""
+    if not os.path.exists(pack_path):
+        print(f"Kein Asset-Pack gefunden ({pack_path}), lade PNGs")
+        return None
+    try:
+        pack = AssetPack(pack_path)
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        print(f"Asset-Pack unbrauchbar ({e}), lade PNGs")
+        return None
+
+    if pack.stale_sources:
+        print(f"Asset-Pack teilweise veraltet ({len(pack.stale_sources)} Quellen geändert) - "
+              f"diese Bilder werden aus den PNGs geladen. Neu backen: python asset_pack.py")
+    return pack
+
+
+if __name__ == "__main__":
+    # Backen braucht kein Fenster, nur die Bild-Dekodierung
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    pygame.init()
+    count = bake()
+    pygame.quit()
+    sys.exit(0 if count else 1)
@@ -0,0 +1,391 @@
+"""
+Asset-Registry für das Spiel
+Jedes Bild wird pro Prozess genau einmal dekodiert, skaliert und konvertiert.
+Alle Loader (Sprites, PowerUps, Collectibles, Plattformen, Projektile) holen
+ihre Surfaces hier ab, statt selbst pygame.image.load aufzurufen.
+"""
+
+import os
+import time
+import pygame
+import startup_profiler
+import surface_audit
+from concurrent.futures import ThreadPoolExecutor
+from settings import IMAGE_FOLDER, WIDTH, HEIGHT
+
+# Cache: (pfad, zielgröße, alpha, max_size) -> konvertierte Surface
+# alpha=None heißt automatisch: Alpha-Kanal nur, wenn das Bild durchsichtige Pixel hat
+_cache = {}
+
+# Pfade, die nicht geladen werden konnten (verhindert wiederholte Dateizugriffe)
+_failed = {}
+
+# Alpha-Klassen, nach denen der Loader den Blit-Modus wählt
+ALPHA_OPAQUE = "opaque"            # Keine durchsichtigen Pixel -> convert()
+ALPHA_BINARY = "binary"            # Nur ganz durchsichtig oder ganz deckend -> Colorkey mit RLEACCEL
+ALPHA_TRANSLUCENT = "translucent"  # Halbtransparente Pixel -> convert_alpha(), normaler Blit
+
+# Mögliche Colorkeys (der erste, der im Bild nicht vorkommt, wird verwendet)
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (1, 2, 3))
+
+# Optionales vorgebackenes Asset-Pack (siehe asset_pack.py)
+_pack = None
+
+# Statistiken zur Kontrolle (z.B. 0 Dekodierungen nach dem Warm-up)
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "decodes": 0,
+    "decoded_bytes": 0,
+    "pack_hits": 0,
+}
+
+# Alle Bilder, die das Spiel in dieser Form lädt: (pfad, zielgröße, alpha, max_size)
+# Wird vom Asset-Pack zum Vorbacken verwendet - neue Loader hier eintragen!
+MANIFEST = [
+    # Projektile
+    (os.path.join(IMAGE_FOLDER, "bubble.png"), (20, 20), None, None),
+    (os.path.join(IMAGE_FOLDER, "bubble.png"), (30, 30), None, None),
+    (os.path.join(IMAGE_FOLDER, "red_pen.png"), (30, 15), None, None),
+    # PowerUps
+    (os.path.join(IMAGE_FOLDER, "doppelter_espresso.png"), (40, 40), None, None),
+    (os.path.join(IMAGE_FOLDER, "cheatsheet_scroll.png"), (40, 40), None, None),
+    (os.path.join(IMAGE_FOLDER, "semesterbreak_aura.png"), (40, 40), None, None),
+    (os.path.join(IMAGE_FOLDER, "motivation_fishbread.png"), (40, 40), None, None),
+    # Collectibles
+    (os.path.join(IMAGE_FOLDER, "Cp.png"), (30, 30), None, None),
+    (os.path.join(IMAGE_FOLDER, "1,0_ Note.png"), (35, 35), None, None),
+    # Plattformen und Boden
+    (os.path.join(IMAGE_FOLDER, "platforms.png"), None, None, 64),
+    (os.path.join(IMAGE_FOLDER, "ground.png"), None, None, None),
+    # Spieler
+    (os.path.join(IMAGE_FOLDER, "player.png"), (50, 50), None, None),
+    (os.path.join(IMAGE_FOLDER, "player_jump.png"), (50, 50), None, None),
+    (os.path.join(IMAGE_FOLDER, "player_run.png"), (50, 50), None, None),
+    # Gegner
+    (os.path.join(IMAGE_FOLDER, "enemy_multiple_choice.png"), (50, 50), None, None),
+    (os.path.join(IMAGE_FOLDER, "enemy_python.png"), (50, 50), None, None),
+    (os.path.join(IMAGE_FOLDER, "enemy_programming_task.png"), (50, 50), None, None),
+    (os.path.join(IMAGE_FOLDER, "enemy_boss.png"), (80, 80), None, None),
+    # Hintergründe und Bildschirme
+    (os.path.join(IMAGE_FOLDER, "foerde_background.png"), (None, HEIGHT), False, None),
+    (os.path.join(IMAGE_FOLDER, "startscreen.png"), (WIDTH, HEIGHT), False, None),
+    (os.path.join(IMAGE_FOLDER, "game_over.png"), (WIDTH, HEIGHT), False, None),
+]
+
+# Teilmenge, die vor dem ersten Menü-Frame gebraucht wird (der Rest lädt mit dem Level)
+MENU_MANIFEST = [
+    (os.path.join(IMAGE_FOLDER, "startscreen.png"), (WIDTH, HEIGHT), False, None),
+]
+
+
+def target_size(src_w, src_h, size, max_size):
+    """Berechnet die Zielgröße aus Quellgröße und Größenvorgabe"""
+    if size is not None:
+        width, height = size
+        # Eine fehlende Seite wird proportional ergänzt
+        if width is None:
+            width = int(src_w * height / src_h)
+        elif height is None:
+            height = int(src_h * width / src_w)
+        return (width, height)
+
+    if max_size is not None and (src_w > max_size or src_h > max_size):
+        # Proportional verkleinern, bis die längste Seite max_size ist
+        scale_factor = min(max_size / src_w, max_size / src_h)
+        return (int(src_w * scale_factor), int(src_h * scale_factor))
+
+    return None
+
+
+def classify_alpha(surface):
+    """Ordnet eine Surface einer Alpha-Klasse zu (opaque, binary oder translucent)"""
+    if not surface_audit.has_pixel_alpha(surface):
+        return ALPHA_OPAQUE
+    width, height = surface.get_size()
+    # Schwelle 254: nur ganz deckende Pixel, Schwelle 0: alle sichtbaren Pixel
+    opaque = pygame.mask.from_surface(surface, 254).count()
+    if opaque == width * height:
+        return ALPHA_OPAQUE
+    visible = pygame.mask.from_surface(surface, 0).count()
+    return ALPHA_BINARY if visible == opaque else ALPHA_TRANSLUCENT
+
+
+def _to_colorkey(surface):
+    """Wandelt eine Surface mit 0/255-Alpha in eine deckende Surface mit Colorkey und RLE um"""
+    alpha_surface = surface.convert_alpha()
+    width, height = surface.get_size()
+    transparent = width * height - pygame.mask.from_surface(alpha_surface, 0).count()
+    for key in COLORKEY_CANDIDATES:
+        result = pygame.Surface((width, height)).convert()
+        result.fill(key)
+        result.blit(alpha_surface, (0, 0))
+        # Die Schlüsselfarbe darf nur in den durchsichtigen Pixeln vorkommen
+        if pygame.mask.from_threshold(result, key, (1, 1, 1, 255)).count() == transparent:
+            result.set_colorkey(key, pygame.RLEACCEL)
+            return result
+    return alpha_surface  # Keine freie Farbe gefunden: normales Alpha
+
+
+def find_colorkey(surfaces):
+    """Sucht eine Colorkey-Farbe, die in keiner der deckenden Surfaces vorkommt (oder None)"""
+    for key in COLORKEY_CANDIDATES:
+        if all(pygame.mask.from_threshold(surface, key, (1, 1, 1, 255)).count() == 0
+               for surface in surfaces):
+            return key
+    return None
+
+
+def convert_for_kind(surface, kind):
+    """Konvertiert eine Surface passend zu ihrer Alpha-Klasse (deckend, Colorkey mit RLE oder Alpha-Kanal)"""
+    if kind == ALPHA_OPAQUE:
+        return surface.convert()
+    if kind == ALPHA_BINARY:
+        return _to_colorkey(surface)
+    return surface.convert_alpha()
+
+
+def to_display_format(surface, alpha=None):
+    """Bringt eine Surface ins Displayformat (schnellster Blit ohne Umrechnung)
+
+    alpha: True = convert_alpha(), False = convert(),
+           None = automatisch nach Alpha-Klasse (deckend, Colorkey oder Alpha-Kanal)
+    Ohne Display (z.B. beim Backen) bleibt die Surface unverändert.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if alpha is None:
+        return convert_for_kind(surface, classify_alpha(surface))
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def load_image(path, size=None, alpha=None, max_size=None):
+    """Lädt ein Bild über den Cache (dekodiert nur beim ersten Aufruf)
+
+    size:     (breite, höhe) - eine Seite darf None sein (proportional)
+    alpha:    True = convert_alpha(), False = convert(), None = automatisch (siehe to_display_format)
+    max_size: Verkleinert proportional, falls eine Seite größer ist
+
+    Wirft pygame.error bzw. FileNotFoundError wie pygame.image.load,
+    damit die bestehenden Fallbacks der Aufrufer weiter funktionieren.
+    """
+    path = os.path.normpath(path)
+    key = (path, size, alpha, max_size)
+    surface = _cache.get(key)
+    if surface is not None:
+        _stats["hits"] += 1
+        return surface
+
+    if path in _failed:
+        _stats["hits"] += 1
+        raise _failed[path]
+
+    _stats["misses"] += 1
+    start = time.perf_counter()
+
+    # Vorgebackene Pixel aus dem Asset-Pack bevorzugen (kein PNG-Dekodieren)
+    if _pack is not None:
+        surface = _pack.lookup(key)
+        if surface is not None:
+            _stats["pack_hits"] += 1
+            _cache[key] = surface_audit.register(surface, f"Asset-Pack {path}")
+            startup_profiler.record_asset(path, time.perf_counter() - start, "pack")
+            return surface
+    try:
+        raw = pygame.image.load(path)
+    except (pygame.error, FileNotFoundError) as e:
+        _failed[path] = e
+        raise
+
+    _stats["decodes"] += 1
+    _stats["decoded_bytes"] += raw.get_width() * raw.get_height() * raw.get_bytesize()
+
+    # Erst skalieren, dann konvertieren (konvertiert nur die kleinen Pixel)
+    target = target_size(raw.get_width(), raw.get_height(), size, max_size)
+    if target is not None:
+        raw = pygame.transform.scale(raw, target)
+    surface = to_display_format(raw, alpha)
+
+    _cache[key] = surface_audit.register(surface, f"assets.load_image {path}")
+    startup_profiler.record_asset(path, time.perf_counter() - start, "png")
+    print(f"Asset geladen: {path} ({surface.get_width()}x{surface.get_height()})")
+    return surface
+
+
+def _decode(path, specs):
+    """Dekodiert eine Datei und skaliert sie auf alle benötigten Größen
+
+    Läuft im Worker-Thread: SDL_image gibt beim Dekodieren den GIL frei.
+    Konvertiert wird erst in install() im Hauptthread, nicht parallel.
+    """
+    start = time.perf_counter()
+    raw = pygame.image.load(path)
+    decoded_bytes = raw.get_width() * raw.get_height() * raw.get_bytesize()
+    results = []
+    for size, alpha, max_size in specs:
+        target = target_size(raw.get_width(), raw.get_height(), size, max_size)
+        scaled = pygame.transform.scale(raw, target) if target is not None else raw
+        results.append(((size, alpha, max_size), scaled))
+    return results, decoded_bytes, time.perf_counter() - start
+
+
+def plan(manifest=None):
+    """Was von einem Manifest noch fehlt (Hauptthread, ohne etwas zu laden)
+
+    Gibt {"pack": [schlüssel aus dem Asset-Pack], "jobs": {pfad: [(size, alpha, max_size), ...]}} zurück.
+    """
+    manifest = manifest if manifest is not None else MANIFEST
+    pack_keys = []
+    jobs = {}
+    for path, size, alpha, max_size in manifest:
+        path = os.path.normpath(path)
+        key = (path, size, alpha, max_size)
+        if key in _cache or path in _failed:
+            continue
+        if _pack is not None and key in _pack:
+            pack_keys.append(key)
+            continue
+        jobs.setdefault(path, []).append((size, alpha, max_size))
+    return {"pack": pack_keys, "jobs": jobs}
+
+
+def decode(planned, workers=None):
+    """Dekodiert die PNGs eines Plans parallel im Thread-Pool
+
+    Fasst weder den Cache noch das Displayformat an und darf deshalb in einem
+    Hintergrund-Thread laufen (siehe LevelLoader). Übernommen werden die Bilder
+    erst mit install() im Hauptthread.
+    Gibt einen Bericht zurück: Wandzeit, Summe der Einzelzeiten, Zeit pro Datei
+    und die noch zu übernehmenden Einträge ("pending").
+    """
+    start = time.perf_counter()
+    jobs = planned["jobs"]
+    pending = [("pack", key) for key in planned["pack"]]
+
+    file_times = {}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs) or 1))
+
+    if jobs:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {path: pool.submit(_decode, path, specs) for path, specs in jobs.items()}
+            for path, future in futures.items():
+                try:
+                    results, decoded_bytes, elapsed = future.result()
+                except (pygame.error, FileNotFoundError) as e:
+                    pending.append(("failed", path, e))
+                    continue
+                file_times[path] = elapsed
+                pending.append(("png", path, results, decoded_bytes, elapsed, workers))
+
+    return {
+        "workers": workers,
+        "wall_time": time.perf_counter() - start,
+        "decode_time_sum": sum(file_times.values()),
+        "file_times": file_times,
+        "pending": pending,
+    }
+
+
+def install(report, limit=None):
+    """Übernimmt dekodierte Bilder aus einem decode()-Bericht in den Cache (nur im Hauptthread)
+
+    Erst hier werden die Bilder ins Displayformat konvertiert bzw. aus dem Pack geholt.
+    limit: höchstens so viele Einträge (der Rest bleibt in report["pending"]).
+    Gibt die Anzahl der noch offenen Einträge zurück.
+    """
+    pending = report["pending"]
+    count = len(pending) if limit is None else min(limit, len(pending))
+    for entry in pending[:count]:
+        if entry[0] == "pack":
+            key = entry[1]
+            lookup_start = time.perf_counter()
+            surface = _pack.lookup(key) if _pack is not None else None
+            if surface is not None and key not in _cache:
+                _stats["pack_hits"] += 1
+                _cache[key] = surface_audit.register(surface, f"Asset-Pack {key[0]}")
+                startup_profiler.record_asset(key[0], time.perf_counter() - lookup_start, "pack")
+        elif entry[0] == "failed":
+            _failed[entry[1]] = entry[2]
+        else:
+            _, path, results, decoded_bytes, elapsed, workers = entry
+            _stats["misses"] += len(results)
+            _stats["decodes"] += 1
+            _stats["decoded_bytes"] += decoded_bytes
+            startup_profiler.record_asset(path, elapsed, f"png, {workers} Threads")
+            for (size, alpha, max_size), surface in results:
+                surface = to_display_format(surface, alpha)
+                _cache[(path, size, alpha, max_size)] = surface_audit.register(surface, f"assets.preload {path}")
+    del pending[:count]
+    return len(pending)
+
+
+def preload(manifest=None, workers=None):
+    """Lädt alle Bilder des Manifests vorab, Dekodierung parallel im Thread-Pool
+
+    Bilder, die schon im Cache oder im Asset-Pack liegen, werden nicht dekodiert.
+    Gibt den Bericht von decode() zurück (Wandzeit inklusive Übernahme in den Cache).
+    """
+    start = time.perf_counter()
+    report = decode(plan(manifest), workers)
+    install(report)
+    report["wall_time"] = time.perf_counter() - start
+    return report
+
+
+def print_preload_report(report):
+    """Gibt den Bericht von preload() als Tabelle aus"""
+    if not report["file_times"]:
+        print("Vorladen: keine PNGs dekodiert (alles im Cache bzw. Asset-Pack)")
+        return
+    print(f"Vorladen mit {report['workers']} Threads: "
+          f"{report['wall_time'] * 1000:.0f} ms (seriell wären es ~{report['decode_time_sum'] * 1000:.0f} ms)")
+    for path, elapsed in sorted(report["file_times"].items(), key=lambda item: -item[1]):
+        print(f"  {elapsed * 1000:7.1f} ms  {path}")
+
+
+def load_first(paths, size=None, alpha=None, max_size=None):
+    """Lädt das erste vorhandene Bild aus einer Liste von Kandidaten
+
+    Gibt (surface, pfad) zurück oder (None, None), wenn keiner ladbar ist.
+    """
+    for path in paths:
+        try:
+            return load_image(path, size, alpha, max_size), path
+        except (pygame.error, FileNotFoundError):
+            continue
+    return None, None
+
+
+def image_path(filename):
+    """Baut den Pfad zu einer Datei im Bilder-Ordner"""
+    return os.path.join(IMAGE_FOLDER, filename)
+
+
+def use_pack(pack):
+    """Setzt das Asset-Pack, aus dem fehlende Bilder bevorzugt geladen werden
+
+    None schaltet das Pack ab (alle Bilder werden wieder aus den PNGs dekodiert).
+    """
+    global _pack
+    _pack = pack
+
+
+def get_stats():
+    """Gibt eine Kopie der Cache-Statistiken zurück"""
+    stats = dict(_stats)
+    stats["cached_surfaces"] = len(_cache)
+    return stats
+
+
+def reset_stats():
+    """Setzt die Zähler zurück (der Cache selbst bleibt erhalten)"""
+    for key in _stats:
+        _stats[key] = 0
+
+
+def clear():
+    """Leert den Cache (z.B. nach einem Wechsel des Display-Formats)"""
+    _cache.clear()
+    _failed.clear()
@@ -0,0 +1,2223 @@
+"""
+Benchmarks für Performance-Messungen
+Läuft ohne Fenster (SDL-Dummy-Treiber) und gibt die Ergebnisse als Tabelle aus.
+
+Aufruf: python benchmark.py [name ...]   (ohne Namen laufen alle Benchmarks)
+Exit-Code 1, wenn eine Prüfung fehlschlägt (z.B. Pixelvergleich bisher/neu)
+"""
+
+import os
+import sys
+import time
+import contextlib
+import io
+import json
+import subprocess
+
+# Ohne sichtbares Fenster laufen (muss vor pygame.init gesetzt werden)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import WIDTH, HEIGHT
+
+# Relative Bildpfade ("images/...") gelten ab dem Spielordner
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+@contextlib.contextmanager
+def quiet():
+    """Unterdrückt die Debug-Ausgaben des Spiels während einer Messung"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def init_display():
+    """Initialisiert pygame mit einem Dummy-Display (nötig für convert())"""
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+def print_table(title, rows):
+    """Gibt eine einfache Tabelle mit (bezeichnung, wert) aus"""
+    print(f"\n== {title} ==")
+    width = max(len(label) for label, _ in rows)
+    for label, value in rows:
+        print(f"  {label.ljust(width)}  {value}")
+
+
+def new_level():
+    """Level 1 ohne Debug-Ausgaben"""
+    from level import Level
+
+    init_display()
+    with quiet():
+        return Level(1)
+
+
+def new_game(start=False, **kwargs):
+    """Frisches Game wie beim Programmstart, erstes Level fertig gebaut; start=True: gleich im Spiel"""
+    import pygame_FoerdeDerFurcht as game_module
+
+    # Display schließen, damit jeder Lauf wie ein frischer Start beginnt
+    pygame.quit()
+    with quiet():
+        game = game_module.Game(**kwargs)
+        game.draw()
+        # Das Menü startet den Aufbau des ersten Levels: fertig bauen, bevor gemessen wird
+        game.level_loader.wait()
+        if start:
+            game.start_game()
+    return game
+
+
+class DrawComparison:
+    """Zeichnet jedes Bild bisher und neu auf je eine Surface, misst beide Zeiten und vergleicht die Pixel"""
+
+    def __init__(self, background=(0, 0, 0)):
+        # Im Format des Bildschirms, wie game.screen
+        self.screens = (pygame.Surface((WIDTH, HEIGHT)).convert(), pygame.Surface((WIDTH, HEIGHT)).convert())
+        self.background = background
+        self.legacy_time = 0.0
+        self.new_time = 0.0
+        self.worst = 0  # Größte Abweichung eines Farbkanals (siehe _max_difference)
+
+    def frame(self, legacy, new):
+        """legacy(screen) und new(screen) zeichnen dasselbe Bild; gibt zurück, was legacy zurückgibt"""
+        legacy_screen, new_screen = self.screens
+        legacy_screen.fill(self.background)
+        start = time.perf_counter()
+        result = legacy(legacy_screen)
+        self.legacy_time += time.perf_counter() - start
+
+        new_screen.fill(self.background)
+        start = time.perf_counter()
+        new(new_screen)
+        self.new_time += time.perf_counter() - start
+        self.worst = max(self.worst, _max_difference(legacy_screen, new_screen))
+        return result
+
+
+#########################################################################
+# Asset-Registry: Blasen feuern ohne erneutes Dekodieren
+#########################################################################
+
+def bench_asset_cache(shots=1000):
+    """Feuert viele Blasen und prüft, dass nach dem Warm-up nichts dekodiert wird"""
+    import assets
+    from weapons import Bubble, RedPen
+
+    init_display()
+
+    class Target:
+        rect = pygame.Rect(400, 300, 10, 10)
+
+    with quiet():
+        # Warm-up: erste Blase und erster Stift laden die Bilder
+        Bubble(0, 0)
+        RedPen(0, 0, Target())
+        assets.reset_stats()
+
+        start = time.perf_counter()
+        for i in range(shots):
+            Bubble(i, 100, direction=1)
+            RedPen(i, 100, Target())
+        elapsed = time.perf_counter() - start
+
+    stats = assets.get_stats()
+    print_table(f"Asset-Cache ({shots} Blasen + {shots} Stifte)", [
+        ("Zeit gesamt", f"{elapsed * 1000:.1f} ms"),
+        ("Zeit pro Schuss", f"{elapsed / (2 * shots) * 1e6:.1f} us"),
+        ("Cache-Treffer", stats["hits"]),
+        ("Cache-Fehlschläge", stats["misses"]),
+        ("Dekodierungen", stats["decodes"]),
+        ("Dekodierte Bytes", stats["decoded_bytes"]),
+    ])
+    return stats["decodes"] == 0
+
+
+#########################################################################
+# Startzeit bis zum Menü: PNGs (kalt) gegen Asset-Pack (warm)
+#########################################################################
+
+def _time_to_menu(use_asset_pack):
+    """Erstellt ein frisches Game und misst die Zeit bis zum ersten Menü-Frame"""
+    import assets
+
+    assets.clear()
+    assets.reset_stats()
+    game = new_game(use_asset_pack=use_asset_pack)
+    return game.time_to_menu_ms, assets.get_stats()
+
+
+def bench_startup(runs=3):
+    """Vergleicht die Zeit bis zum Menü mit und ohne Asset-Pack"""
+    import asset_pack
+    from settings import ASSET_PACK_FILE
+
+    if not os.path.exists(ASSET_PACK_FILE):
+        with quiet():
+            pygame.init()
+            asset_pack.bake()
+
+    rows = []
+    for label, use_pack in (("kalt (PNG)", False), ("warm (Asset-Pack)", True)):
+        times = []
+        for _ in range(runs):
+            elapsed_ms, stats = _time_to_menu(use_pack)
+            times.append(elapsed_ms)
+        rows.append((label, f"{min(times):.0f} ms (min aus {runs}), "
+                            f"{stats['decodes']} dekodiert, {stats['pack_hits']} aus Pack"))
+    print_table("Zeit bis zum Menü", rows)
+
+
+#########################################################################
+# Paralleles Dekodieren beim Start (Thread-Pool)
+#########################################################################
+
+def bench_parallel_decode(worker_counts=(1, 2, 4, 8)):
+    """Dekodiert das komplette Manifest mit unterschiedlich vielen Threads"""
+    import assets
+
+    init_display()
+    assets.use_pack(None)  # Ohne Asset-Pack, sonst gibt es nichts zu dekodieren
+
+    rows = []
+    serial_report = None
+    for workers in worker_counts:
+        assets.clear()
+        assets.reset_stats()
+        with quiet():
+            report = assets.preload(workers=workers)
+        if serial_report is None:
+            serial_report = report
+        speedup = serial_report["wall_time"] / report["wall_time"]
+        rows.append((f"{workers} Threads", f"{report['wall_time'] * 1000:.0f} ms "
+                                           f"(Summe Einzelzeiten {report['decode_time_sum'] * 1000:.0f} ms, "
+                                           f"Faktor {speedup:.2f}x)"))
+    print_table(f"Paralleles Dekodieren ({os.cpu_count()} CPU-Kerne)", rows)
+
+    print_table("Dekodierzeit pro Datei (1 Thread)", [
+        (path, f"{elapsed * 1000:.1f} ms")
+        for path, elapsed in sorted(serial_report["file_times"].items(), key=lambda item: -item[1])
+    ])
+
+
+#########################################################################
+# Level-Wechsel: Eingabe (Start/R) bis spielbereit
+#########################################################################
+
+def bench_level_swap(runs=5):
+    """Vergleicht synchronen Level-Aufbau mit dem vorbereiteten Hintergrund-Level"""
+    import pygame_FoerdeDerFurcht as game_module
+
+    game = new_game()
+
+    sync_times = []
+    ready_times = []
+    immediate_times = []
+    with quiet():
+        for _ in range(runs):
+            # Bisher: Level(1) direkt bei Tastendruck bauen
+            start = time.perf_counter()
+            game_module.build_level()
+            sync_times.append((time.perf_counter() - start) * 1000)
+
+            # Neu: Level wurde während Menü/Game Over gebaut
+            game.prepare_next_level()
+            game.level_loader.wait()
+            game.activate_prepared_level()
+            game.draw()
+            ready_times.append(game.input_to_playable_ms)
+
+            # Ungünstigster Fall: Spieler drückt sofort, Ladebalken blockiert
+            game.prepare_next_level()
+            game.activate_prepared_level()
+            game.draw()
+            immediate_times.append(game.input_to_playable_ms)
+
+    print_table(f"Eingabe bis spielbereit (Median aus {runs})", [
+        ("synchron (bisher)", f"{sorted(sync_times)[runs // 2]:.1f} ms"),
+        ("Level vorbereitet", f"{sorted(ready_times)[runs // 2]:.1f} ms"),
+        ("sofort gedrückt (Ladebalken)", f"{sorted(immediate_times)[runs // 2]:.1f} ms"),
+    ])
+
+
+#########################################################################
+# Geteilte Bilder (Flyweight): Level-Aufbau und Speicher für Surfaces
+#########################################################################
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def bench_flyweight(runs=5):
+    """Misst den Level-Aufbau und vergleicht eindeutige mit kopierten Sprite-Bytes"""
+    from level import Level
+
+    init_display()
+    with quiet():
+        Level(1)  # Warm-up: Bilder und Kacheln einmal erzeugen
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            level = Level(1)
+            times.append((time.perf_counter() - start) * 1000)
+
+    groups = (level.platforms, level.enemies, level.powerups, level.collectibles)
+    sprites = [sprite for group in groups for sprite in group]
+    unique = {id(s.image): s.image for s in sprites}
+    per_instance = sum(_surface_bytes(s.image) for s in sprites)
+    shared = sum(_surface_bytes(image) for image in unique.values())
+
+    print_table(f"Geteilte Bilder (Level 1, Median aus {runs})", [
+        ("Level-Aufbau", f"{sorted(times)[runs // 2]:.1f} ms"),
+        ("Sprites", len(sprites)),
+        ("Eindeutige Surfaces", len(unique)),
+        ("Bytes bei eigener Kopie", f"{per_instance // 1024} KB"),
+        ("Bytes tatsächlich", f"{shared // 1024} KB"),
+    ])
+
+
+#########################################################################
+# Statische Ebene: Plattformen einzeln gegen vorgezeichnete Chunks
+#########################################################################
+
+def bench_static_layer(frames=600):
+    """Zeichnet die statische Geometrie über eine Kamerafahrt durch das Level"""
+    from level import Level
+
+    init_display()
+    screen = pygame.display.get_surface()
+    with quiet():
+        level = Level(1)
+        level.use_zone_streaming(False)  # Alle Chunks vorgezeichnet
+    static_platforms = [p for p in level.platforms if p.is_static]
+    step = (level.level_width - WIDTH) / frames
+
+    def sweep(draw):
+        start = time.perf_counter()
+        blits = 0
+        for frame in range(frames):
+            level.camera.camera_rect.x = int(frame * step)
+            blits += draw()
+        return (time.perf_counter() - start) / frames * 1000, blits / frames
+
+    def draw_each():
+        for platform in static_platforms:
+            screen.blit(platform.image, level.camera.apply(platform))
+        return len(static_platforms)
+
+    each_ms, each_blits = sweep(draw_each)
+    chunk_ms, chunk_blits = sweep(lambda: level.static_layer.draw(screen, level.camera))
+
+    start = time.perf_counter()
+    with quiet():
+        level.build_static_layer()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    print_table(f"Statische Geometrie ({len(static_platforms)} Plattformen, {frames} Frames)", [
+        ("einzeln (bisher)", f"{each_ms:.3f} ms/Frame, {each_blits:.0f} Blits"),
+        ("Chunks", f"{chunk_ms:.3f} ms/Frame, {chunk_blits:.2f} Blits"),
+        ("Chunks neu bauen", f"{build_ms:.1f} ms"),
+    ])
+
+
+#########################################################################
+# Start-Profil: Menü zuerst, Level danach (frischer Prozess pro Lauf)
+#########################################################################
+
+_PROFILE_SCRIPT = """
+import json, startup_profiler
+startup_profiler.enable()
+import pygame_FoerdeDerFurcht as game_module
+game = game_module.Game()
+if {eager}:
+    game_module.build_level()  # Bisherige Reihenfolge: Level vor dem ersten Frame bauen
+game.draw()
+if game.level_loader is not None:
+    game.level_loader.wait()
+report = startup_profiler.get_report()
+level_done = max(e["start_ms"] + e["duration_ms"] for e in report["events"] if e["name"] == "Level.__init__")
+print("PROFILE " + json.dumps({{"first_flip_ms": report["first_flip_ms"], "level_done_ms": level_done,
+                               "import_ms": report["import_ms_total"]}}))
+"""
+
+
+def _profile_run(eager):
+    """Startet das Spiel in einem frischen Python-Prozess und liest das Start-Profil aus"""
+    output = subprocess.run([sys.executable, "-c", _PROFILE_SCRIPT.format(eager=eager)],
+                            capture_output=True, text=True, check=True).stdout
+    line = next(l for l in output.splitlines() if l.startswith("PROFILE "))
+    return json.loads(line[len("PROFILE "):])
+
+
+def bench_startup_profile(runs=7):
+    """Vergleicht die Zeit bis zum ersten Frame: Level vorher bauen gegen Level im Hintergrund"""
+    import statistics
+
+    rows = []
+    medians = []
+    for label, eager in (("Level vor dem Menü (bisher)", True), ("Level nach dem ersten Frame", False)):
+        results = [_profile_run(eager) for _ in range(runs)]
+        flips = [r["first_flip_ms"] for r in results]
+        medians.append(statistics.median(flips))
+        rows.append((label, f"erster Frame {medians[-1]:.0f} ms ({min(flips):.0f}-{max(flips):.0f}), "
+                            f"Level fertig {statistics.median(r['level_done_ms'] for r in results):.0f} ms, "
+                            f"Importe {statistics.median(r['import_ms'] for r in results):.0f} ms"))
+    rows.append(("Differenz erster Frame", f"{medians[0] - medians[1]:.0f} ms (Median)"))
+    print_table(f"Start-Profil (frischer Prozess, Median und Spanne aus {runs})", rows)
+
+
+#########################################################################
+# Surface-Formate: Level.draw mit rohen, convert_alpha- und Policy-Surfaces
+#########################################################################
+
+def bench_surface_formats(frames=300):
+    """Misst Level.draw mit unterschiedlich konvertierten Sprites und zählt Audit-Befunde"""
+    import assets
+    import surface_audit
+
+    init_display()
+    screen = pygame.display.get_surface()
+    level = new_level()
+    sprites = [sprite for group in (level.platforms, level.enemies, level.powerups, level.collectibles)
+               for sprite in group] + [level.player]
+    originals = {sprite: sprite.image for sprite in sprites}
+    original_background = level.background_texture
+
+    def raw(surface):
+        # So, wie pygame.image.load ein PNG liefert: RGB(A)-Bytereihenfolge, nicht konvertiert
+        mode = "RGBA" if surface_audit.has_pixel_alpha(surface) else "RGB"
+        return pygame.image.frombytes(pygame.image.tobytes(surface, mode), surface.get_size(), mode)
+
+    variants = (
+        ("roh (ohne convert)", raw),
+        ("convert_alpha für alles (bisher)", lambda surface: surface.convert_alpha()),
+        ("Format-Policy (neu)", lambda surface: assets.to_display_format(surface)),
+    )
+    step = (level.level_width - WIDTH) / frames
+    rows = []
+    for label, transform in variants:
+        converted = {}
+        for sprite, image in originals.items():
+            if image not in converted:
+                converted[image] = transform(image)
+            sprite.image = converted[image]
+        level.background_texture = transform(original_background)
+        findings = sum(1 for surface in list(converted.values()) + [level.background_texture]
+                       if surface_audit.find_problems(surface, screen))
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            level.camera.camera_rect.x = int(frame * step)
+            level.draw(screen)
+        elapsed_ms = (time.perf_counter() - start) / frames * 1000
+        rows.append((label, f"{elapsed_ms:.2f} ms/Frame, {findings} auffällige Surfaces"))
+
+    for sprite, image in originals.items():
+        sprite.image = image
+    level.background_texture = original_background
+    print_table(f"Level.draw nach Surface-Format ({frames} Frames)", rows)
+
+
+def bench_blit_modes(blits=2000, runs=15):
+    """Vergleicht den Blit-Durchsatz von Alpha, Colorkey/RLE und vormultipliertem Alpha pro Sprite (beste/Median aus runs)"""
+    import statistics
+    import assets
+
+    init_display()
+    screen = pygame.display.get_surface()
+
+    def throughput(surface, flags):
+        # Blits pro Millisekunde, verteilt über den Bildschirm (wie im Spiel)
+        width, height = surface.get_size()
+        positions = [((i * 37) % (WIDTH - width), (i * 53) % (HEIGHT - height)) for i in range(blits)]
+        screen.blit(surface, positions[0], None, flags)  # RLE wird beim ersten Blit kodiert
+        start = time.perf_counter()
+        for position in positions:
+            screen.blit(surface, position, None, flags)
+        return blits / ((time.perf_counter() - start) * 1000)
+
+    rows = []
+    seen = set()
+    for path, size, alpha, max_size in assets.MANIFEST:
+        if alpha is not None or (path, size) in seen or not os.path.exists(path):
+            continue  # Nur Sprites mit automatischer Format-Wahl
+        seen.add((path, size))
+        raw = pygame.image.load(path)
+        new_size = assets.target_size(*raw.get_size(), size, max_size)
+        if new_size:
+            raw = pygame.transform.smoothscale(raw, new_size)
+        if raw.get_width() >= WIDTH or raw.get_height() >= HEIGHT:
+            continue  # Bodentextur & Co. passen nicht für die Messung auf den Bildschirm
+
+        kind = assets.classify_alpha(raw)
+        variants = (
+            (raw.convert_alpha(), 0),
+            (assets._to_colorkey(raw), 0),
+            (raw.convert_alpha().premul_alpha(), pygame.BLEND_PREMULTIPLIED),
+            (assets.convert_for_kind(raw, kind), 0),
+        )
+        # Abwechselnd messen, damit Schwankungen alle Varianten gleich treffen
+        samples = [[] for _ in variants]
+        for _ in range(runs):
+            for results, (surface, flags) in zip(samples, variants):
+                results.append(throughput(surface, flags))
+        name = f"{os.path.basename(path)} {raw.get_width()}x{raw.get_height()} [{kind}]"
+        rows.append((name, "  ".join(f"{max(results):6.1f}/{statistics.median(results):6.1f}" for results in samples)))
+
+    print_table(f"Blits/ms (beste/Median aus {runs}): Alpha, Colorkey+RLE, vormultipliert, Policy ({blits} Blits)", rows)
+
+
+#########################################################################
+# Transform-Cache: keine pygame.transform-Aufrufe im laufenden Spiel
+#########################################################################
+
+def _simulate_gameplay(level, screen, frames, enemies):
+    """Spieler läuft hin und her, schießt und fängt Gegner (ohne Tastatur)"""
+    from weapons import Bubble
+
+    for frame in range(frames):
+        if frame % 30 == 0:
+            # Richtungswechsel: Spieler-Sprite wird gespiegelt
+            level.player.velocity.x = 5 if (frame // 30) % 2 == 0 else -5
+        if frame % 10 == 0:
+            level.player.shoot(level.projectiles)
+        if frame % 20 == 0 and enemies:
+            # Gegner direkt in eine Blase einfangen (wie bei einem Treffer)
+            enemy = enemies.pop()
+            bubble = Bubble(*enemy.rect.center, level_width=level.level_width)
+            level.projectiles.add(bubble)
+            bubble.capture_enemy(enemy)
+        level.update()
+        level.draw(screen)
+
+
+def bench_transform_cache(frames=600):
+    """Zählt pygame.transform-Aufrufe im laufenden Spiel (nach dem Warm-up sollen es 0 sein)"""
+    import transform_cache
+    from enemies import Boss
+
+    init_display()
+    screen = pygame.display.get_surface()
+    level = new_level()
+
+    # Je Gegnertyp einen Gegner fürs Warm-up, die übrigen für die Messung
+    enemies = [enemy for enemy in level.enemies if not isinstance(enemy, Boss)]
+    warmup_enemies, measured_enemies = [], []
+    seen_types = set()
+    for enemy in enemies:
+        if type(enemy) in seen_types:
+            measured_enemies.append(enemy)
+        else:
+            seen_types.add(type(enemy))
+            warmup_enemies.append(enemy)
+
+    with quiet():
+        _simulate_gameplay(level, screen, 120, warmup_enemies)
+
+    # Alle Transformationen zählen, egal von wo sie aufgerufen werden
+    calls = {}
+    originals = {}
+    for name in ("flip", "scale", "smoothscale", "rotate", "rotozoom"):
+        original = getattr(pygame.transform, name)
+        originals[name] = original
+
+        def counted(*args, _name=name, _original=original, **kwargs):
+            calls[_name] = calls.get(_name, 0) + 1
+            return _original(*args, **kwargs)
+        setattr(pygame.transform, name, counted)
+
+    transform_cache.reset_stats()
+    try:
+        with quiet():
+            start = time.perf_counter()
+            _simulate_gameplay(level, screen, frames, measured_enemies)
+            elapsed_ms = (time.perf_counter() - start) / frames * 1000
+    finally:
+        for name, original in originals.items():
+            setattr(pygame.transform, name, original)
+
+    stats = transform_cache.get_stats()
+    print_table(f"Transform-Cache im laufenden Spiel ({frames} Frames nach Warm-up)", [
+        ("pygame.transform-Aufrufe", sum(calls.values()) if calls else 0),
+        ("Cache-Treffer", stats["hits"]),
+        ("Cache-Fehlschläge", stats["misses"]),
+        ("Verdrängungen", stats["evictions"]),
+        ("Varianten im Cache", f"{stats['cached_surfaces']} ({stats['cached_bytes'] / 1024:.0f} KiB "
+                               f"von {stats['budget_bytes'] / 1024:.0f} KiB)"),
+        ("Zeit pro Frame (update + draw)", f"{elapsed_ms:.2f} ms"),
+    ])
+
+    # LRU-Verdrängung: Budget kleiner als die aktuell benutzten Varianten
+    transform_cache.reset_stats()
+    transform_cache.set_budget(stats["cached_bytes"] // 2)
+    with quiet():
+        _simulate_gameplay(level, screen, 120, [])
+    small = transform_cache.get_stats()
+    transform_cache.set_budget(stats["budget_bytes"])
+    print_table("Transform-Cache mit halbem Budget (120 Frames)", [
+        ("Cache-Treffer", small["hits"]),
+        ("Cache-Fehlschläge", small["misses"]),
+        ("Verdrängungen", small["evictions"]),
+    ])
+    return not calls
+
+
+#########################################################################
+# Kollisions-Index: Kosten pro Frame unabhängig von der Level-Größe
+#########################################################################
+
+def _linear_platform_scan(character, platforms):
+    """Bisherige Prüfung: alle Plattformen zweimal pro Frame (horizontal und vertikal)"""
+    for _ in range(2):
+        for platform in platforms:
+            can_collide = True
+            if hasattr(platform, 'can_collide'):
+                can_collide = platform.can_collide()
+            if can_collide and character.rect.colliderect(platform.rect):
+                pass
+
+
+def bench_collision_index(frames=60, characters=60):
+    """Kollisionskosten pro Frame bei wachsender Level-Breite und Plattform-Anzahl"""
+    import random
+    from character import Character
+    from collision_index import CollisionIndex
+    from platforms import Platform, BreakingPlatform
+
+    init_display()
+    rows = []
+    for screens in (4, 16, 64):
+        level_width = WIDTH * screens
+        rng = random.Random(screens)
+        with quiet():
+            platforms = [Platform(0, HEIGHT - 50, level_width, 50)]
+            # Dichte wie im echten Level: gut 6 Plattformen pro Bildschirmbreite, jede 5. brechend
+            for i in range(screens * 6):
+                cls = BreakingPlatform if i % 5 == 0 else Platform
+                platforms.append(cls(rng.randrange(level_width - 100), rng.randrange(150, HEIGHT - 100),
+                                     rng.choice((60, 80, 100)), 20))
+            actors = []
+            for i in range(characters):
+                actor = Character(rng.randrange(level_width - 50), rng.randrange(HEIGHT - 100), None)
+                actor.level_width = level_width
+                actor.velocity.x = rng.choice((-2, 2))
+                actors.append(actor)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            for actor in actors:
+                _linear_platform_scan(actor, platforms)
+        linear_ms = (time.perf_counter() - start) / frames * 1000
+
+        build_start = time.perf_counter()
+        index = CollisionIndex(platforms)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        start = time.perf_counter()
+        for _ in range(frames):
+            for actor in actors:
+                actor.update(index)
+        indexed_ms = (time.perf_counter() - start) / frames * 1000
+
+        rows.append((f"{screens:2d} Bildschirme, {len(platforms):3d} Plattformen",
+                     f"linear {linear_ms:6.2f} ms/Frame   Index {indexed_ms:5.2f} ms/Frame "
+                     f"(inkl. Bewegung, Aufbau {build_ms:.1f} ms)"))
+
+    print_table(f"Plattform-Kollisionen für {characters} Charaktere", rows)
+
+
+#########################################################################
+# Broadphase: Paartests pro Frame bei vielen Blasen und Gegnern
+#########################################################################
+
+def _legacy_pair_tests(level):
+    """Zählt die Rechteck-Tests der bisherigen Schleifen (alle gegen alle, ohne Seiteneffekte)"""
+    from weapons import Bubble
+
+    enemies = list(level.enemies)
+    projectiles = list(level.projectiles)
+    bubbles = [p for p in projectiles if isinstance(p, Bubble)]
+    tests = 2 * len(enemies)       # Spieler gegen jeden Gegner (zwei identische Blöcke)
+    tests += len(projectiles)      # spritecollide Spieler gegen alle Projektile
+    for i, bubble in enumerate(bubbles):
+        if bubble.can_be_popped():
+            for other in bubbles[i + 1:]:
+                tests += 1
+                if other.can_be_popped() and bubble.rect.colliderect(other.rect):
+                    break
+        if not bubble.captured_enemy and not bubble.is_popping:
+            for enemy in enemies:
+                tests += 1
+                if bubble.rect.colliderect(enemy.rect):
+                    break
+    return tests
+
+
+def bench_broadphase(frames=60, counts=(100, 300, 600)):
+    """Stress-Szenario: viele Blasen und Gegner über das Level verteilt, Paartests vorher/nachher"""
+    import random
+    from enemies import MultipleChoiceEnemy
+    from weapons import Bubble
+
+    init_display()
+    rows = []
+    stale = 0
+    for count in counts:
+        rng = random.Random(count)
+        level = new_level()
+        level.player.has_semesterbreak_aura = True  # Schaden ignorieren, Spieler bleibt stehen
+
+        def spawn_enemy():
+            level.enemies.add(MultipleChoiceEnemy(rng.randrange(level.level_width - 50),
+                                                  rng.randrange(HEIGHT - 100),
+                                                  level.enemy_sprites['multiple_choice'], level.level_width))
+
+        def spawn_bubble():
+            level.projectiles.add(Bubble(rng.randrange(level.level_width), rng.randrange(HEIGHT - 50),
+                                         rng.choice((-1, 1)), level_width=level.level_width))
+
+        legacy_tests = new_tests = 0
+        elapsed = 0.0
+        for _ in range(frames):
+            # Bestand auffüllen: gefangene Gegner und geplatzte Blasen ersetzen
+            for projectile in list(level.projectiles):
+                if projectile.is_popping:
+                    projectile.kill()
+            while len(level.enemies) < count:
+                spawn_enemy()
+            while len(level.projectiles) < count:
+                spawn_bubble()
+            for sprite in list(level.enemies) + list(level.projectiles):
+                sprite.rect.x += rng.randint(-3, 3)
+
+            legacy_tests += _legacy_pair_tests(level)
+            with quiet():
+                start = time.perf_counter()
+                level._handle_collisions()
+                elapsed += time.perf_counter() - start
+            new_tests += level.broadphase.pair_tests
+            stale += _stale_broadphase_entries(level.broadphase)
+
+        rows.append((f"{count} Gegner + {count} Blasen",
+                     f"bisher {legacy_tests / frames:8.0f} Paartests/Frame   "
+                     f"Broadphase {new_tests / frames:6.0f} Paartests/Frame "
+                     f"({elapsed / frames * 1000:.2f} ms/Frame inkl. Aufbau)"))
+
+    rows.append(("veraltete Einträge nach pop/Fang", stale))
+    print_table(f"Dynamische Kollisionen ({frames} Frames, Level {WIDTH * 16} px breit)", rows)
+    return stale == 0
+
+
+def _stale_broadphase_entries(broadphase):
+    """Lebende Gegner und Blasen, deren Eintrag nicht mehr zu sprite.rect passt (z.B. nach Bubble.pop)"""
+    return sum(1 for sprite, (category, entry) in broadphase.entries.items()
+               if category in ("enemy", "bubble") and sprite.alive() and entry[2] != sprite.rect)
+
+
+#########################################################################
+# Pixelgenaue Treffer: Mehrkosten mit gecachten Masken
+#########################################################################
+
+def bench_precise_collision(frames=300, enemies_per_zone=40):
+    """Kollisionsphase mit und ohne pixelgenaue Treffer bei einer vollen Zone Gegner"""
+    import random
+    import collision_masks
+    from enemies import MultipleChoiceEnemy, PythonEnemy, ProgrammingTaskEnemy
+    from weapons import Bubble, RedPen
+
+    init_display()
+    sprite_keys = {MultipleChoiceEnemy: 'multiple_choice', PythonEnemy: 'python',
+                   ProgrammingTaskEnemy: 'programming_task'}
+    rows = []
+    for precise in (False, True):
+        rng = random.Random(1)
+        level = new_level()
+        level.precise_collision = precise
+        level.player.has_semesterbreak_aura = True  # Treffer zählen, aber Spieler bleibt im Spiel
+        zone = level.camera.camera_rect  # Erste Zone = sichtbarer Bereich
+
+        def random_point(margin):
+            return (rng.randrange(zone.left, zone.right - margin), rng.randrange(zone.top, zone.bottom - margin))
+
+        # Nur die Kollisionsphase von Level.update messen
+        handle_collisions = level._handle_collisions
+        elapsed = 0.0
+
+        def timed_collisions():
+            nonlocal elapsed
+            start = time.perf_counter()
+            handle_collisions()
+            elapsed += time.perf_counter() - start
+        level._handle_collisions = timed_collisions
+
+        collision_masks.reset_stats()
+        for _ in range(frames):
+            # Zone gefüllt halten: gefangene Gegner und geplatzte Blasen ersetzen
+            while len(level.enemies) < enemies_per_zone:
+                enemy_class = rng.choice(list(sprite_keys))
+                level.enemies.add(enemy_class(*random_point(50), level.enemy_sprites[sprite_keys[enemy_class]],
+                                              level.level_width))
+            bubbles = sum(1 for p in level.projectiles if isinstance(p, Bubble) and not p.is_popping)
+            for _ in range(enemies_per_zone - bubbles):
+                level.projectiles.add(Bubble(*random_point(20), rng.choice((-1, 1)), level_width=level.level_width))
+            if rng.random() < 0.2:
+                level.projectiles.add(RedPen(*random_point(30), level.player))
+
+            with quiet():
+                level.update()
+
+        stats = collision_masks.get_stats()
+        label = "pixelgenau (Masken)" if precise else "Rechtecke (Standard)"
+        rows.append((label, f"{elapsed / frames * 1000:.3f} ms/Frame, "
+                            f"{stats['overlap_tests'] / frames:.1f} Masken-Tests/Frame, "
+                            f"{stats['rejected']} Rechteck-Treffer verworfen, "
+                            f"{stats['masks_built']} Masken berechnet"))
+
+    print_table(f"Kollisionsphase mit {enemies_per_zone} Gegnern und Blasen in einer Zone ({frames} Frames)",
+                rows)
+
+
+#########################################################################
+# NumPy-Gegnerphysik: Differenztest und Break-even gegen Character.update
+#########################################################################
+
+def _enemy_physics_run(batched, frames, extra_enemies):
+    """Spielt ein Level mit fester Zufallsfolge und zeichnet alle Gegner-Zustände pro Frame auf"""
+    import random
+    import level as level_module
+    from level import Level
+    from enemies import MultipleChoiceEnemy, PythonEnemy
+
+    random.seed(5)
+    default_lod = level_module.ENEMY_LOD
+    level_module.ENEMY_LOD = False  # Alle Gegner jeden Schritt
+    with quiet():
+        level = Level(1)
+        level.use_zone_streaming(False)  # Alle Gegner des Levels
+        level.use_enemy_physics(batched)
+        level.player.has_semesterbreak_aura = True
+        rng = random.Random(9)
+        # Zusätzliche Gegner in der Luft: landen auf schwebenden Plattformen oder laufen dagegen
+        for _ in range(extra_enemies):
+            enemy_class = rng.choice((MultipleChoiceEnemy, PythonEnemy))
+            key = 'multiple_choice' if enemy_class is MultipleChoiceEnemy else 'python'
+            enemy = enemy_class(rng.randrange(level.level_width - 50), rng.randrange(0, HEIGHT - 100),
+                                level.enemy_sprites[key], level.level_width)
+            enemy.timers = level.timers
+            level.enemies.add(enemy)
+        trace = []
+        for frame in range(frames):
+            if frame % 40 == 0:
+                level.player.velocity.x = 5 if (frame // 40) % 3 != 2 else -5
+            if frame % 25 == 0:
+                level.player.jump()
+            if frame % 50 == 0:
+                # Einige Gegner betäuben (Stun-Zweig der Physik)
+                for enemy in list(level.enemies)[frame % 7::9]:
+                    enemy.apply_stun(20)
+            level.update()
+            trace.append([(tuple(e.rect), tuple(e.velocity), e.on_ground, e.is_stunned)
+                          for e in level.enemies])
+    level_module.ENEMY_LOD = default_lod
+    return trace
+
+
+def bench_enemy_physics(frames=600, counts=(10, 25, 50, 100, 200, 400, 800)):
+    """Vergleicht Gegner-Trajektorien (NumPy gegen Character.update) und sucht den Break-even"""
+    import random
+    import enemy_physics
+    from character import Character
+    from collision_index import CollisionIndex
+    from enemies import MultipleChoiceEnemy
+
+    if not enemy_physics.is_available():
+        print("\nNumPy nicht installiert - Benchmark enemy_physics übersprungen")
+        return None
+
+    init_display()
+
+    # Differenztest: gleiche Zufallsfolge, jeder Frame muss identisch sein
+    reference = _enemy_physics_run(False, frames, extra_enemies=60)
+    batched = _enemy_physics_run(True, frames, extra_enemies=60)
+    mismatches = [frame for frame, (a, b) in enumerate(zip(reference, batched)) if a != b]
+    print_table(f"Differenztest NumPy-Physik gegen Character.update ({frames} Frames)", [
+        ("Gegner (Start)", len(reference[0])),
+        ("Abweichende Frames", len(mismatches)),
+        ("Erster abweichender Frame", mismatches[0] if mismatches else "-"),
+    ])
+
+    # Break-even: nur der Physik-Schritt, gleiche Gegner und Plattformen
+    level = new_level()
+    index = CollisionIndex(level.platforms)
+    physics = enemy_physics.EnemyPhysics(level.platforms)
+    rows = []
+    crossover = None
+    for count in counts:
+        rng = random.Random(count)
+        enemies = [MultipleChoiceEnemy(rng.randrange(level.level_width - 50), rng.randrange(HEIGHT - 100),
+                                       level.enemy_sprites['multiple_choice'], level.level_width)
+                   for _ in range(count)]
+        for enemy in enemies:
+            enemy.velocity.x = rng.choice((-2, 2))
+        steps = 60
+
+        start = time.perf_counter()
+        for _ in range(steps):
+            for enemy in enemies:
+                Character.update(enemy, index)
+        per_object_ms = (time.perf_counter() - start) / steps * 1000
+
+        start = time.perf_counter()
+        for _ in range(steps):
+            physics.step(enemies)
+        batched_ms = (time.perf_counter() - start) / steps * 1000
+
+        if crossover is None and batched_ms < per_object_ms:
+            crossover = count
+        rows.append((f"{count:4d} Gegner", f"pro Objekt {per_object_ms:6.3f} ms   NumPy {batched_ms:6.3f} ms"))
+    rows.append(("Break-even ab", f"{crossover} Gegner" if crossover else "nicht erreicht"))
+    print_table("Gegner-Physik pro Frame", rows)
+    return not mismatches
+
+
+############################################################
+# Kontinuierliche Kollision (Swept AABB)
+############################################################
+
+def _swept_fall(step_fn, rate, speed):
+    """Lässt einen Charakter mit fester Fallgeschwindigkeit auf eine 20 px dünne Plattform fallen"""
+    from character import Character
+    from platforms import Platform
+
+    dt = 60 / rate
+    platform = Platform(0, 300, 200, 20)
+    character = Character(50, 100, None)
+    character.level_width, character.level_height = 1000, 10000
+    for _ in range(int(400 / speed) + 5):
+        character.velocity.y = speed  # konstant, Schwerkraft würde die Geschwindigkeit nur ändern
+        step_fn([character], [platform], dt)
+    return character.rect.bottom == platform.rect.top
+
+
+def _swept_run(step_fn, rate, speed):
+    """Lässt einen Charakter mit fester Geschwindigkeit gegen eine 20 px dünne Wand laufen"""
+    from character import Character
+    from platforms import Platform
+
+    dt = 60 / rate
+    wall = Platform(400, 0, 20, 200)
+    character = Character(100, 140, None)
+    character.level_width, character.level_height = 2000, 200
+    for _ in range(int(400 / speed) + 5):
+        character.velocity.x = speed
+        step_fn([character], [wall], dt)
+    return character.rect.right == wall.rect.left
+
+
+def bench_swept_collision(rates=(60, 30, 20, 15), speeds=(2, 5, 10, 15, 20)):
+    """Prüft auf Tunneling bei niedrigen Simulationsraten und misst die eingesparte Rechenzeit"""
+    import enemy_physics
+    from collision_index import CollisionIndex
+    from level import Level
+    from weapons import RedPen
+    from enemies import MultipleChoiceEnemy
+
+    init_display()
+
+    def per_object(characters, platforms, dt):
+        index = CollisionIndex(platforms)
+        for character in characters:
+            character.update(index, dt)
+
+    def batched(characters, platforms, dt):
+        enemy_physics.EnemyPhysics(platforms).step(characters, dt)
+
+    step_functions = [("Character.update", per_object)]
+    if enemy_physics.is_available():
+        step_functions.append(("NumPy-Physik", batched))
+
+    # Testmatrix: Rate x Geschwindigkeit (Schritt = Geschwindigkeit * 60 / Rate, bis 80 px)
+    rows = []
+    tunneled = 0
+    for name, step_fn in step_functions:
+        for rate in rates:
+            with quiet():
+                failures = [speed for speed in speeds
+                            if not _swept_fall(step_fn, rate, speed) or not _swept_run(step_fn, rate, speed)]
+            tunneled += len(failures)
+            rows.append((f"{name} {rate:2d} Hz", f"Tunneling bei {failures}" if failures else "ok"))
+
+    # Projektile: schneller Stift gegen ein schmales Ziel, Treffer über hit_rect()
+    missed = []
+    for rate in rates:
+        with quiet():
+            target = MultipleChoiceEnemy(300, 100, None, 1000)
+            target.rect.width = 10
+            pen = RedPen(100, target.rect.centery, target)
+        pen.velocity.scale_to_length(8 * 60 / rate)  # Schritt pro Simulationsschritt
+        hit = False
+        for _ in range(60):
+            pen.update()
+            if pen.hit_rect().colliderect(target.rect):
+                hit = True
+                break
+        if not hit:
+            missed.append(rate)
+    rows.append(("Projektil gegen 10 px Ziel", f"verfehlt bei {missed} Hz" if missed else "ok"))
+    print_table("Tunneling-Testmatrix (Fallen/Laufen gegen 20 px Plattformen)", rows)
+
+    # Eingesparte Rechenzeit: Kosten eines Simulationsschritts x gesparte Schritte pro Sekunde
+    with quiet():
+        level = Level(1)
+        for _ in range(30):
+            level.update()
+        steps = 120
+        start = time.perf_counter()
+        for _ in range(steps):
+            level.update()
+    step_ms = (time.perf_counter() - start) / steps * 1000
+    rows = [("Level.update pro Schritt", f"{step_ms:.3f} ms")]
+    for rate in rates[1:]:
+        rows.append((f"gespart bei {rate} Hz", f"{step_ms * (60 - rate):.1f} ms CPU pro Sekunde"))
+    print_table("Simulationsrate", rows)
+    return tunneled == 0 and not missed
+
+
+############################################################
+# Feste Simulationsrate mit Interpolation
+############################################################
+
+def _fixed_timestep_run(game, render_fps, seconds, interpolation=True):
+    """Treibt Game.run_frame mit einer virtuellen Uhr (Bildrate = render_fps)"""
+    import pygame_FoerdeDerFurcht as game_module
+    from settings import PLAYER_SPEED
+
+    game_module.INTERPOLATION = interpolation
+    level = game.current_level
+    positions = []
+    draw = level._draw
+
+    def recording_draw(screen):
+        positions.append(level.player.rect.x)  # Position, wie sie gezeichnet wird
+        draw(screen)
+
+    level._draw = recording_draw
+    game.accumulator = 0.0
+    game.last_frame_time = None
+    start = now = time.perf_counter()
+    steps = 0
+    try:
+        for _ in range(int(seconds * render_fps) + 1):
+            level.player.velocity.x = PLAYER_SPEED  # gleichmäßig nach rechts laufen
+            steps += game.run_frame(now)
+            now += 1.0 / render_fps
+    finally:
+        del level._draw
+        game_module.INTERPOLATION = True
+    # Bilder, in denen sich der Spieler nicht bewegt hat, obwohl er läuft (Ruckeln)
+    still = sum(1 for a, b in zip(positions, positions[1:]) if a == b)
+    return steps, still, len(positions) - 1
+
+
+def bench_fixed_timestep(render_rates=(10, 20, 30, 60, 144, 240), seconds=2.0):
+    """Simulationsschritte gegen gezeichnete Bilder bei verschiedenen Bildraten"""
+    import pygame_FoerdeDerFurcht as game_module
+    from settings import SIMULATION_RATE
+
+    game = new_game(start=True)
+    # Spieler unverwundbar halten, damit die Messung nicht im Game Over endet
+    game.current_level.player.has_semesterbreak_aura = True
+    game.current_level.player.start_powerup_timer('semesterbreak', 10 ** 9)
+
+    rows = []
+    steady = True
+    for fps in render_rates:
+        with quiet():
+            steps, _, _ = _fixed_timestep_run(game, fps, seconds)
+        game_seconds = steps / SIMULATION_RATE
+        rows.append((f"{fps:3d} Bilder/s", f"{steps / seconds:5.1f} Schritte/s   "
+                                           f"Spielzeit {game_seconds / seconds:4.2f}x Echtzeit"))
+        # Bis MAX_STEPS_PER_FRAME pro Bild muss die Spielzeit mit der echten Zeit mithalten
+        if fps * game_module.MAX_STEPS_PER_FRAME >= SIMULATION_RATE and abs(steps - seconds * SIMULATION_RATE) > 1:
+            steady = False
+    print_table(f"Feste Simulationsrate ({SIMULATION_RATE} Hz, virtuelle Uhr)", rows)
+
+    # Bei mehr Bildern als Schritten: ohne Interpolation steht der Spieler in vielen Bildern still
+    rows = []
+    for interpolation in (False, True):
+        with quiet():
+            _, still, frames = _fixed_timestep_run(game, 144, 1.0, interpolation)
+        rows.append(("mit Interpolation" if interpolation else "ohne Interpolation",
+                     f"{still} von {frames} Bildern ohne Bewegung"))
+    print_table("Ruckeln bei 144 Bildern/s", rows)
+    return steady
+
+
+############################################################
+# Timer-Rad: Korrektheit, Kosten gegen Abfragen pro Frame
+############################################################
+
+def _timer_wheel_check(count, max_delay):
+    """Meldet zufällige Timer an, bricht einige ab und prüft, ob jeder genau zu seinem Schritt feuert"""
+    import random
+    from timers import TimerWheel
+
+    rng = random.Random(count + max_delay)
+    wheel = TimerWheel()
+    fired = []
+    expected = {}
+    handles = []
+    for number in range(count):
+        delay = rng.choice((rng.randint(1, 64), rng.randint(1, max_delay)))
+        handles.append(wheel.schedule(delay, lambda number=number: fired.append((number, wheel.now))))
+        expected[number] = handles[-1].expires
+    for number in rng.sample(range(count), count // 10):
+        handles[number].cancel()
+        del expected[number]
+    while wheel.now <= max_delay:
+        wheel.advance(rng.choice((1.0, 1.0, 2.0, 0.5, 37.0)))
+    wrong = sum(1 for number, now in fired if expected.get(number) != now)
+    return wrong, len(expected) - len(fired), wheel.pending, len(fired)
+
+
+def bench_timer_wheel(timers=20000, ticks=300000, idle_counts=(100, 1000, 10000)):
+    """Prüft das Timer-Rad gegen eine einfache Referenz und vergleicht die Kosten pro Schritt"""
+    import random
+    import timers as timers_module
+    from timers import TimerWheel
+
+    default_size = (timers_module.SLOTS, timers_module.LEVELS)
+    rng = random.Random(3)
+    # Differenztest: zufällige Dauern über alle Ebenen, einige abgebrochen, Zeit in unterschiedlich
+    # großen Schritten (auch Bruchteile und Vorspulen); zusätzlich ein Mini-Rad, bei dem viele
+    # Timer über das ganze Rad hinausreichen und beim Umlauf neu einsortiert werden
+    rows = []
+    correct = True
+    for slots, levels, max_delay in ((timers_module.SLOTS, timers_module.LEVELS, ticks), (4, 2, 500)):
+        timers_module.SLOTS, timers_module.LEVELS = slots, levels
+        try:
+            wrong, missing, pending, count = _timer_wheel_check(timers, max_delay)
+        finally:
+            timers_module.SLOTS, timers_module.LEVELS = default_size
+        rows.append((f"{slots} Fächer x {levels} Ebenen, bis {max_delay} Schritte",
+                     f"{count} Callbacks, {wrong} zum falschen Schritt, {missing} fehlend, {pending} offen"))
+        correct &= not wrong and not missing and not pending
+    print_table(f"Timer-Rad gegen Referenz ({timers} Timer)", rows)
+
+    # Kosten pro Schritt: jede Entität zählt ihren Timer herunter gegen ein Rad mit ruhenden Timern
+    class Countdown:
+        def __init__(self, frames):
+            self.timer = frames
+            self.active = True
+
+    rows = []
+    steps = 600
+    for count in idle_counts:
+        entities = [Countdown(rng.randint(1000, 100000)) for _ in range(count)]
+        start = time.perf_counter()
+        for _ in range(steps):
+            for entity in entities:
+                if entity.timer > 0:
+                    entity.timer -= 1
+                    if entity.timer <= 0:
+                        entity.active = False
+        polling_us = (time.perf_counter() - start) / steps * 1e6
+
+        wheel = TimerWheel()
+        for entity in entities:
+            wheel.schedule(entity.timer, lambda entity=entity: setattr(entity, "active", False))
+        start = time.perf_counter()
+        for _ in range(steps):
+            wheel.advance(1.0)
+        wheel_us = (time.perf_counter() - start) / steps * 1e6
+        rows.append((f"{count:5d} laufende Timer", f"Abfragen {polling_us:8.1f} us   Timer-Rad {wheel_us:6.1f} us"))
+    print_table("Kosten pro Simulationsschritt", rows)
+
+    # Im Spiel: Callbacks pro Schritt bei einer Runde mit Schüssen, Treffern und PowerUps
+    from level import Level
+    init_display()
+    with quiet():
+        level = Level(1)
+        level.player.lives = 1000
+        fired_per_step = []
+        for frame in range(1200):
+            if frame % 40 == 0:
+                level.player.velocity.x = 5 if (frame // 40) % 3 != 2 else -5
+            if frame % 25 == 0:
+                level.player.jump()
+            if frame % 4 == 0:
+                level.player.shoot(level.projectiles)
+            if frame in (100, 600):
+                level._spawn_powerup(level.player.rect.centerx, level.player.rect.centery, 'double_espresso')
+            level.update()
+            fired_per_step.append(level.timers.fired)
+    print_table("Im Spiel (1200 Schritte)", [
+        ("Callbacks gesamt", sum(fired_per_step)),
+        ("Schritte ohne Callback", fired_per_step.count(0)),
+        ("höchstens pro Schritt", max(fired_per_step)),
+    ])
+    return correct
+
+
+############################################################
+# Entity-Registry: Abfragen pro Frame gegen isinstance-Suchen
+############################################################
+
+def _legacy_lookups(level):
+    """Die bisherigen Suchen eines Frames (draw_hud, _check_boss_defeated, Level.update)"""
+    from enemies import Boss
+    from weapons import Bubble, RedPen
+
+    def scan_boss():
+        for enemy in level.enemies:
+            if isinstance(enemy, Boss):
+                return enemy
+        return None
+
+    boss = scan_boss()                           # draw_hud
+    defeated = scan_boss() is None               # _check_boss_defeated (zweimal gesucht)
+    defeated = scan_boss() is None and defeated
+    boss_flags = [isinstance(enemy, Boss) for enemy in level.enemies]
+    bubbles = [p for p in level.projectiles if isinstance(p, Bubble)]        # _handle_bubble_mechanics
+    hit_bubbles = [p for p in level.projectiles if isinstance(p, Bubble)]    # Blasen gegen Gegner
+    pens = [p for p in level.projectiles if isinstance(p, RedPen)]           # _fill_broadphase
+    for p in level.projectiles:
+        isinstance(p, Bubble) or isinstance(p, RedPen)
+    return boss, defeated, boss_flags, bubbles, hit_bubbles, pens
+
+
+def _registry_lookups(level):
+    """Dieselben Abfragen über die Registry"""
+    registry = level.registry
+    boss = level.get_boss()
+    defeated = level.is_boss_defeated()
+    boss_flags = [enemy is boss for enemy in level.enemies]
+    bubbles = list(registry.get("bubble"))
+    hit_bubbles = list(registry.get("bubble"))
+    pens = list(registry.get("pen"))
+    return boss, defeated, boss_flags, bubbles, hit_bubbles, pens
+
+
+def bench_entity_registry(frames=2000, bubbles=20, pens=10):
+    """Spätes Spiel: alle Gegner leben, viele Blasen und Stifte, Spieler beim Boss"""
+    from level import Level
+    from weapons import Bubble, RedPen
+
+    init_display()
+    rows = []
+    correct = True
+    for number in (1, 2, 3):
+        with quiet():
+            level = Level(number)
+            level.use_zone_streaming(False)  # Alle Gegner des Levels leben
+        boss = level.get_boss()
+        level.player.rect.midbottom = (boss.rect.left - 200, boss.rect.bottom)
+        for i in range(bubbles):
+            level.projectiles.add(Bubble(boss.rect.left - 40 * i, boss.rect.top, -1, level_width=level.level_width))
+        for i in range(pens):
+            level.projectiles.add(RedPen(boss.rect.centerx, boss.rect.top + 10 * i, level.player))
+
+        correct &= _legacy_lookups(level) == _registry_lookups(level)
+        timings = []
+        for lookups in (_legacy_lookups, _registry_lookups):
+            start = time.perf_counter()
+            for _ in range(frames):
+                lookups(level)
+            timings.append((time.perf_counter() - start) / frames * 1e6)
+
+        # Boss besiegt: Registry muss es ohne erneute Suche merken
+        boss.kill()
+        correct &= level.get_boss() is None and level.is_boss_defeated()
+        rows.append((f"Level {number}: {len(level.enemies) + 1} Gegner, {len(level.projectiles)} Projektile",
+                     f"isinstance-Suchen {timings[0]:6.1f} us   Registry {timings[1]:5.1f} us   "
+                     f"gespart {timings[0] - timings[1]:5.1f} us/Frame"))
+    rows.append(("Gleiche Ergebnisse wie die Suchen", "ja" if correct else "NEIN"))
+    print_table(f"Typ-Abfragen pro Frame ({frames} Frames)", rows)
+    return correct
+
+
+############################################################
+# Brechende Plattformen: nur aktive pro Frame aktualisieren
+############################################################
+
+def _legacy_platform_update(level):
+    """Die bisherige Schleife: jede Plattform besuchen, brechende prüfen den Spieler"""
+    for platform in level.platforms:
+        if hasattr(platform, 'update') and hasattr(platform, 'check_player_collision'):
+            platform.update(level.player)
+        elif hasattr(platform, 'update'):
+            platform.update()
+
+
+def _platform_activity_run(all_breaking, legacy, frames):
+    """Spieler läuft und springt durchs Level; liefert (Plattform-Zustände je Frame, us/Frame, aktive je Frame)"""
+    import random
+    import platforms as platforms_module
+    from level import Level
+    from collision_index import CollisionIndex
+    from platforms import BreakingPlatform
+
+    platforms_module.random = random.Random(5)  # Wackeln bei beiden Läufen gleich
+    try:
+        with quiet():
+            level = Level(1)
+            if all_breaking:
+                # Stress: jede Plattform bricht
+                for platform in list(level.platforms):
+                    if not isinstance(platform, BreakingPlatform):
+                        level.platforms.remove(platform)
+                        replacement = BreakingPlatform(*platform.rect)
+                        replacement.timers = level.timers
+                        replacement.active_platforms = level.active_platforms
+                        level.platforms.add(replacement)
+                        level.breaking_platforms += 1
+                level.collision_index = CollisionIndex(level.platforms)
+            level.player.lives = 1000
+            level.player.has_semesterbreak_aura = True
+
+            elapsed = [0.0]
+            update_platforms = level._update_platforms
+            if legacy:
+                def update_platforms():
+                    _legacy_platform_update(level)
+
+            def timed_update_platforms():
+                start = time.perf_counter()
+                update_platforms()
+                elapsed[0] += time.perf_counter() - start
+            level._update_platforms = timed_update_platforms
+
+            states = []
+            active = []
+            for frame in range(frames):
+                if frame % 40 == 0:
+                    level.player.velocity.x = 5 if (frame // 40) % 4 != 3 else -5
+                if frame % 30 == 0:
+                    level.player.jump()
+                level.update()
+                states.append(tuple(getattr(platform, 'state', '') for platform in level.platforms))
+                active.append(len(level.active_platforms))
+    finally:
+        platforms_module.random = random
+    return states, elapsed[0] / frames * 1e6, active
+
+
+def bench_platform_activity(frames=1500):
+    """Kosten der Plattform-Updates pro Frame: alle Plattformen besuchen gegen aktive Menge"""
+    rows = []
+    correct = True
+    init_display()
+    for all_breaking in (False, True):
+        legacy_states, legacy_us, _ = _platform_activity_run(all_breaking, True, frames)
+        states, active_us, active = _platform_activity_run(all_breaking, False, frames)
+        same = legacy_states == states
+        correct &= same
+        label = "alle Plattformen brechend" if all_breaking else "Level 1"
+        rows.append((label, f"alle besuchen {legacy_us:7.1f} us   aktive Menge {active_us:5.1f} us   "
+                            f"aktiv im Schnitt {sum(active) / frames:4.2f} (max {max(active)}), "
+                            f"Zustände {'gleich' if same else 'VERSCHIEDEN'}"))
+    print_table(f"Plattform-Updates pro Frame ({frames} Frames)", rows)
+    return correct
+
+
+############################################################
+# Gegner-LOD: Ringe um die Kamera
+############################################################
+
+def _enemy_lod_run(lod, frames):
+    """Spieler läuft durchs Level; liefert (us/Schritt für Gegner, Ringgrößen je Schritt, Probleme beim Eintritt ins Bild)"""
+    import random
+    import debug_stats
+    import level as level_module
+    from level import Level
+
+    random.seed(7)
+    default_lod = level_module.ENEMY_LOD
+    level_module.ENEMY_LOD = lod
+    try:
+        with quiet():
+            level = Level(1)
+            level.use_zone_streaming(False)  # Alle Gegner des Levels, die Ringe übernehmen das Ausdünnen
+            level.player.lives = 1000
+            level.player.start_powerup_timer('semesterbreak', 10**9)  # Spieler läuft ungestört durch
+
+            elapsed = [0.0]
+            update_enemies = level._update_enemies
+
+            def timed_update_enemies(dt):
+                start = time.perf_counter()
+                stepped = update_enemies(dt)
+                elapsed[0] += time.perf_counter() - start
+                return stepped
+            level._update_enemies = timed_update_enemies
+
+            level_rect = pygame.Rect(0, 0, level.level_width, level.level_height)
+            rings = []
+            seen = set()
+            problems = []
+            for frame in range(frames):
+                level.player.velocity.x = 5
+                if frame % 25 == 0:
+                    level.player.jump()
+                level.update()
+                stats = debug_stats.get_stats()
+                rings.append((int(stats["Gegner nah"].split()[0]), int(stats["Gegner mittel"].split(",")[0]),
+                              stats["Gegner fern (schlafen)"]))
+                # Plausibel beim Eintritt ins Bild: im Level und nicht in einer Plattform steckend
+                for enemy in level.enemies:
+                    if enemy in seen or not level.camera.camera_rect.colliderect(enemy.rect):
+                        continue
+                    seen.add(enemy)
+                    stuck = [platform for platform, breakable in level.collision_index.query(enemy.rect)
+                             if not breakable or platform.can_collide()]
+                    if stuck or not level_rect.contains(enemy.rect):
+                        problems.append((frame, tuple(enemy.rect)))
+    finally:
+        level_module.ENEMY_LOD = default_lod
+    return elapsed[0] / frames * 1e6, rings, problems, len(seen), level.camera.camera_rect.right
+
+
+def bench_enemy_lod(frames=2600):
+    """Gegner-Updates mit und ohne LOD-Ringe, während der Spieler das Level durchquert"""
+    import debug_stats
+    rows = []
+    correct = True
+    init_display()
+    for lod in (False, True):
+        debug_stats.reset_stats()
+        enemy_us, rings, problems, seen, camera_right = _enemy_lod_run(lod, frames)
+        correct &= not problems
+        average = [sum(ring[i] for ring in rings) / frames for i in range(3)]
+        rows.append((f"LOD {'an ' if lod else 'aus'}",
+                     f"{enemy_us:7.1f} us/Schritt   Ringe im Schnitt nah {average[0]:4.1f} / mittel {average[1]:4.1f} / "
+                     f"fern {average[2]:4.1f}   {seen} Gegner ins Bild gekommen, {len(problems)} unplausibel"))
+    print_table(f"Gegner-Updates ({frames} Schritte, Kamera bis x={camera_right})", rows)
+    return correct
+
+
+############################################################
+# Zonen-Streaming: Kosten bei 16, 64 und 256 Bildschirmen Level-Breite
+############################################################
+
+def _zone_inventory(level):
+    """Alle Gegner, PowerUps und Sammelobjekte des Levels (erzeugt oder als Eintrag) als sortierte Liste"""
+    boss = level.get_boss()
+    inventory = [(cls.__name__, x, y) for zone in level.streamer.stored
+                 for entries in zone.values() for cls, x, y, *_ in entries]
+    for group in (level.enemies, level.powerups, level.collectibles):
+        inventory += [(type(sprite).__name__, sprite.rect.x, sprite.rect.y) for sprite in group if sprite is not boss]
+    return sorted(inventory)
+
+
+def _zone_streaming_run(screens, streaming, frames, screen):
+    """Spieler läuft nach rechts; liefert Ladezeit, ms/Frame, Sprites im Spiel und Chunk-Speicher"""
+    import random
+    import zones
+    from level import Level
+
+    random.seed(3)
+    defaults = zones.ZoneStreamer.__init__.__defaults__
+    zones.ZoneStreamer.__init__.__defaults__ = defaults[:2] + (streaming,)
+    try:
+        with quiet():
+            start = time.perf_counter()
+            level = Level(1, screens=screens)
+            load_time = time.perf_counter() - start
+            level.player.lives = 1000
+            level.player.start_powerup_timer('semesterbreak', 10**9)
+            live = []
+            chunk_bytes = 0
+            start = time.perf_counter()
+            for frame in range(frames):
+                level.player.velocity.x = 5
+                if frame % 25 == 0:
+                    level.player.jump()
+                level.update()
+                level.draw(screen)
+                live.append(len(level.enemies) + len(level.powerups) + len(level.collectibles))
+                chunk_bytes = max(chunk_bytes, level.static_layer.rendered_bytes())
+            frame_ms = (time.perf_counter() - start) / frames * 1000
+    finally:
+        zones.ZoneStreamer.__init__.__defaults__ = defaults
+    return load_time, frame_ms, sum(live) / frames, chunk_bytes, level
+
+
+def bench_zone_streaming(screen_counts=(16, 64, 256), frames=900):
+    """Level-Breite gegen Ladezeit, Kosten pro Frame und Speicher, mit und ohne Zonen-Streaming"""
+    from level import Level
+
+    init_display()
+    screen = pygame.display.get_surface()
+    with quiet():
+        Level(1)  # Warm-up: Bilder und Kacheln einmal erzeugen
+    rows = []
+    for screens in screen_counts:
+        for streaming in (False, True):
+            load_time, frame_ms, live, chunk_bytes, level = _zone_streaming_run(screens, streaming, frames, screen)
+            rows.append((f"{screens:3d} Bildschirme, Streaming {'an ' if streaming else 'aus'}",
+                         f"Laden {load_time * 1000:6.0f} ms   {frame_ms:5.2f} ms/Frame   "
+                         f"{live:6.1f} Sprites im Spiel   Chunks {chunk_bytes / 2**20:6.1f} MB"))
+    print_table(f"Zonen-Streaming ({frames} Frames, Spieler läuft nach rechts)", rows)
+
+    # Persistenz: Kamera einmal durchs Level und zurück, ohne Simulation - nichts darf verloren gehen
+    with quiet():
+        level = Level(1, screens=64)
+        before = _zone_inventory(level)
+        camera_rect = level.camera.camera_rect
+        for x in list(range(0, level.level_width - WIDTH, 400)) + list(range(level.level_width - WIDTH, -1, -400)):
+            camera_rect.x = x
+            level.streamer.update(camera_rect)
+        correct = _zone_inventory(level) == before
+        streamer = level.streamer
+        # Jeder Eintrag muss in der Zone liegen, in der ihn add() ablegt (auch nach _retire)
+        misfiled = sum(1 for index, zone in enumerate(streamer.stored) for entries in zone.values()
+                       for entry in entries if streamer.zone_of(entry[1]) != index)
+    print_table("Kamerafahrt durch 64 Bildschirme und zurück", [
+        ("Objekte erzeugt / weggeräumt", f"{streamer.materialized} / {streamer.retired}"),
+        ("alle Objekte an ihrem Platz", "ja" if correct else "NEIN"),
+        ("Einträge in einer falschen Zone", misfiled),
+    ])
+    return correct and misfiled == 0
+
+
+############################################################
+# Gezeichnet wird nur, was im Bild liegt (render_index.py)
+############################################################
+
+def _legacy_draw_sprites(level, screen):
+    """Sprite-Ebenen wie vor dem Culling: alles im Level, Gegner zweimal"""
+    camera = level.camera
+    for platform in level.dynamic_platforms:
+        screen.blit(platform.image, camera.apply_rect(platform.get_render_rect()))
+    for collectible in level.collectibles:
+        screen.blit(collectible.image, camera.apply(collectible))
+    for powerup in level.powerups:
+        screen.blit(powerup.image, camera.apply(powerup))
+    for enemy in level.enemies:
+        screen.blit(enemy.image, camera.apply(enemy))
+    for enemy in level.enemies:
+        enemy_pos = camera.apply(enemy)
+        if level.player.are_enemies_frozen():
+            _legacy_draw_frozen(screen, enemy, enemy_pos)
+        else:
+            screen.blit(enemy.image, enemy_pos)
+    for projectile in level.projectiles:
+        screen.blit(projectile.image, camera.apply(projectile))
+
+
+def _culled_draw_run(extra, frames, screen):
+    """Level mit extra Gegnern, PowerUps und Sammelobjekten außerhalb des Bildes; misst das Zeichnen"""
+    import random
+    from level import Level
+    from enemies import PythonEnemy
+    from powerups import DoubleEspresso, Creditpoint
+
+    random.seed(4)
+    with quiet():
+        level = Level(1)
+        level.use_zone_streaming(False)
+        rng = random.Random(extra)
+        for _ in range(extra):
+            x = rng.randrange(4000, level.level_width - 100)
+            level.enemies.add(level.create_enemy(PythonEnemy, x, rng.randrange(50, 400)))
+            level.collectibles.add(Creditpoint(x, rng.randrange(50, 500)))
+            level.powerups.add(DoubleEspresso(rng.randrange(4000, level.level_width - 100), 450))
+        level.player.lives = 1000
+        level.player.start_powerup_timer('semesterbreak', 10**9)
+        index = level.render_index
+        moves = sum(grid.moves for grid in index.layers.values())
+
+        times = {False: 0.0, True: 0.0}
+        legacy_time = 0.0
+        drawn = 0
+        mismatches = 0
+        reference = pygame.Surface(screen.get_size())
+        for frame in range(frames):
+            level.player.velocity.x = 3
+            if frame % 25 == 0:
+                level.player.jump()
+            if frame % 40 == 0:
+                level.player.shoot(level.projectiles)
+            level.update()
+
+            start = time.perf_counter()
+            _legacy_draw_sprites(level, screen)
+            legacy_time += time.perf_counter() - start
+
+            # Ohne und mit Culling: müssen dasselbe Bild ergeben
+            for culling, target in ((False, reference), (True, screen)):
+                target.fill((0, 0, 0))
+                level.render_culling = culling
+                start = time.perf_counter()
+                level._draw_sprites(target)
+                times[culling] += time.perf_counter() - start
+            if pygame.image.tobytes(screen, "RGB") != pygame.image.tobytes(reference, "RGB"):
+                mismatches += 1
+            view = level.camera.camera_rect
+            drawn += sum(len(index.visible(layer, view)) for layer in index.layers)
+        total = sum(index.total(layer) for layer in index.layers)
+        moves = sum(grid.moves for grid in index.layers.values()) - moves
+    return legacy_time / frames, times[False] / frames, times[True] / frames, drawn / frames, total, moves / frames, mismatches
+
+
+def bench_culled_draw(extra_counts=(0, 500, 2000), frames=300):
+    """Kosten der Sprite-Ebenen gegen die Zahl der Objekte außerhalb des Bildes"""
+    init_display()
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    rows = []
+    correct = True
+    for extra in extra_counts:
+        legacy_time, all_time, culled_time, drawn, total, moves, mismatches = _culled_draw_run(extra, frames, screen)
+        correct &= mismatches == 0
+        rows.append((f"+{extra:4d} je Art außerhalb",
+                     f"{total:5d} Sprites, {drawn:4.1f} im Bild   bisher {legacy_time * 1e6:7.1f} us   "
+                     f"alle einmal {all_time * 1e6:7.1f} us   gecullt {culled_time * 1e6:6.1f} us   "
+                     f"{moves:4.1f} Zellwechsel/Schritt   {mismatches} Bilder abweichend"))
+    print_table(f"Sprite-Ebenen zeichnen ({frames} Frames, ohne Zonen-Streaming)", rows)
+    return correct
+
+############################################################
+# Effekt-Varianten: Einfrier-Tint, Umrandung und Betäubung aus dem Cache
+############################################################
+
+def _legacy_draw_frozen(screen, enemy, pos):
+    """Eingefrorener Gegner ohne Cache: Tint in jedem Frame neu; gibt die Zahl der angelegten Surfaces zurück"""
+    import transform_cache
+
+    screen.blit(transform_cache._tint(enemy.image, (100, 150, 255), 100), pos)
+    return 1  # Kopie
+
+
+def _legacy_effects(level, screen, enemies):
+    """Effekte wie bisher in jedem Frame neu erzeugt; gibt die Zahl der angelegten Surfaces zurück"""
+    allocations = 0
+    for enemy in enemies:
+        allocations += _legacy_draw_frozen(screen, enemy, level.camera.apply(enemy))
+
+    player = level.player
+    player_pos = level.camera.apply(player)
+    colors = [(255, 255, 0)] * player.is_speed_boosted + [(0, 255, 0)] * player.has_semesterbreak_aura
+    if colors:
+        mask = pygame.mask.from_surface(player.image)
+        allocations += 1
+        for i, color in enumerate(colors):
+            offset = i + 1
+            for dx in (-offset, 0, offset):
+                for dy in (-offset, 0, offset):
+                    if dx or dy:
+                        outline_surface = mask.to_surface(setcolor=color, unsetcolor=(0, 0, 0, 0))
+                        outline_surface.set_alpha(120 - i * 20)
+                        screen.blit(outline_surface, (player_pos[0] + dx, player_pos[1] + dy))
+                        allocations += 1
+    if not player.is_invincible or (player.invincibility_timer.remaining() // 5) % 2 == 0:
+        screen.blit(player.image, player_pos)
+    if player.is_stunned:
+        stun_overlay = pygame.Surface(player.rect.size, pygame.SRCALPHA)
+        stun_overlay.fill((0, 0, 150, 80))
+        screen.blit(stun_overlay, player_pos)
+        allocations += 1
+    return allocations
+
+
+def _cached_effects(level, screen, enemies):
+    """Dieselben Effekte über transform_cache (wie Level._draw_sprites bzw. _draw_player_with_effects)"""
+    import transform_cache
+
+    for enemy in enemies:
+        screen.blit(transform_cache.tinted(enemy.image, (100, 150, 255), 100), level.camera.apply(enemy))
+    level._draw_player_with_effects(screen)
+
+
+def _max_difference(first, second):
+    """Größte Abweichung eines Farbkanals zwischen zwei Bildern (ohne numpy: 0 = gleich, 255 = verschieden)"""
+    try:
+        import numpy
+    except ImportError:
+        return 0 if pygame.image.tobytes(first, "RGB") == pygame.image.tobytes(second, "RGB") else 255
+    difference = (pygame.surfarray.array3d(first).astype(numpy.int16) -
+                  pygame.surfarray.array3d(second).astype(numpy.int16))
+    return int(numpy.abs(difference).max())
+
+
+def bench_effect_variants(frames=600):
+    """Spieler mit allen PowerUps (und zeitweise betäubt) läuft an eingefrorenen Gegnern vorbei"""
+    import random
+    import transform_cache
+    from enemies import PythonEnemy, MultipleChoiceEnemy
+    from powerups import DoubleEspresso, CheatsheetScroll, SemesterbreakAura
+
+    random.seed(5)
+    level = new_level()
+    comparison = DrawComparison(background=(40, 60, 80))
+    with quiet():
+        player = level.player
+        player.lives = 1000
+        for x in range(250, 800, 110):
+            enemy_class = PythonEnemy if x % 220 else MultipleChoiceEnemy
+            level.enemies.add(level.create_enemy(enemy_class, x, 300))
+        for powerup, name in ((DoubleEspresso, 'double_espresso'), (CheatsheetScroll, 'cheatsheet'),
+                              (SemesterbreakAura, 'semesterbreak')):
+            powerup(0, 0).apply(player)
+            player.start_powerup_timer(name, 10**9)
+
+        legacy_allocations = 0
+        misses = []
+        drawn = 0
+        transform_cache.reset_stats()
+        for frame in range(frames):
+            player.velocity.x = 4
+            if frame % 30 == 0:
+                player.jump()
+            if frame % 150 == 100:
+                player.apply_stun(40)
+            level.update()
+            enemies = level.render_index.visible("enemy", level.camera.camera_rect)
+            drawn += len(enemies)
+
+            before = transform_cache.get_stats()["misses"]
+            legacy_allocations += comparison.frame(lambda screen: _legacy_effects(level, screen, enemies),
+                                                   lambda screen: _cached_effects(level, screen, enemies))
+            misses.append(transform_cache.get_stats()["misses"] - before)
+
+    second_half = sum(misses[frames // 2:])
+    print_table(f"Effekt-Varianten ({frames} Frames, alle PowerUps, {drawn / frames:.1f} eingefrorene Gegner im Bild)", [
+        ("bisher pro Frame erzeugt", f"{comparison.legacy_time / frames * 1e6:7.1f} us/Frame   {legacy_allocations / frames:5.1f} Surfaces/Frame"),
+        ("aus dem Cache", f"{comparison.new_time / frames * 1e6:7.1f} us/Frame   {sum(misses)} Varianten erzeugt, "
+                          f"davon {second_half} in der zweiten Hälfte"),
+        ("Frames mit neuen Surfaces", f"{sum(1 for count in misses if count)} von {frames}"),
+        ("größte Abweichung (Farbkanal)", comparison.worst),
+    ])
+    # Rundung beim vormultiplierten Übereinanderlegen der Umrandungen: höchstens ein paar Stufen
+    return second_half == 0 and comparison.worst <= 3
+
+
+############################################################
+# HUD: zwischengespeicherte Teile statt font.render in jedem Frame
+############################################################
+
+def _legacy_draw_hud(game, screen):
+    """HUD wie bisher: alle Texte und Herzen in jedem Frame neu"""
+    from settings import COLOR_HEART, BOSS_HEALTH, BOSS_SHOOTING_RADIUS
+
+    player = game.current_level.player
+    for i in range(player.lives):
+        x, y, size = 10 + i * 35, 10, 30
+        radius = size // 4
+        pygame.draw.circle(screen, COLOR_HEART, (x + radius, y + radius), radius)
+        pygame.draw.circle(screen, COLOR_HEART, (x + size - radius, y + radius), radius)
+        pygame.draw.rect(screen, COLOR_HEART, (x, y + radius, size, radius))
+        pygame.draw.polygon(screen, COLOR_HEART, [(x + size // 2, y + size - 2), (x, y + size // 2), (x + size, y + size // 2)])
+    screen.blit(game.font.render(f"Score: {player.score}", True, (255, 255, 255)), (10, 50))
+    screen.blit(game.font.render(f"CP: {player.credit_points}", True, (255, 215, 0)), (10, 80))
+    if player.grades_collected > 0:
+        screen.blit(game.font.render(f"Noten 1,0: {player.grades_collected}", True, (0, 255, 0)), (10, 110))
+    for i, status in enumerate(player.get_powerup_status()):
+        screen.blit(game.font.render(status, True, (255, 255, 0)), (WIDTH - 250, 10 + i * 30))
+    boss = game.current_level.get_boss()
+    if boss and abs(boss.rect.centerx - player.rect.centerx) <= BOSS_SHOOTING_RADIUS:
+        background_rect = pygame.Rect((WIDTH - 250) // 2, 20, 250, 15)
+        pygame.draw.rect(screen, (139, 0, 0), background_rect)
+        if boss.health > 0:
+            pygame.draw.rect(screen, (255, 69, 0), pygame.Rect(background_rect.x, 20, 250 * boss.health / BOSS_HEALTH, 15))
+        pygame.draw.rect(screen, (0, 0, 0), background_rect, 3)
+        name = game.font.render("Prof. Dr. Krauss", True, (255, 255, 255))
+        screen.blit(name, name.get_rect(center=(WIDTH // 2, 50)))
+
+
+def bench_hud(frames=600):
+    """HUD über 10 Sekunden Spielzeit: PowerUps laufen ab, Punkte, CP, Leben und Boss ändern sich"""
+    import debug_stats
+    from powerups import DoubleEspresso, CheatsheetScroll
+
+    game = new_game(start=True)
+    level = game.current_level
+    player = level.player
+    boss = level.get_boss()
+    comparison = DrawComparison(background=(20, 30, 50))
+    debug_stats.reset_stats()
+    with quiet():
+        DoubleEspresso(0, 0).apply(player)
+        CheatsheetScroll(0, 0).apply(player)
+        rebuilds = game.hud.rebuilds
+        for frame in range(frames):
+            # Simulierte Spielzeit: Timer laufen, ab und zu ändert sich ein Wert
+            level.timers.advance(1)
+            if frame % 45 == 0:
+                player.score += 10
+            if frame % 70 == 0:
+                player.credit_points += 1
+            if frame == 250:
+                player.grades_collected += 1
+                player.lives -= 1
+            if frame == 300:
+                player.rect.centerx = boss.rect.centerx  # In Schussweite: Boss-Leiste erscheint
+            if frame == 450:
+                boss.health -= 1
+            comparison.frame(lambda screen: _legacy_draw_hud(game, screen),
+                             lambda screen: game.hud.draw(screen, level))
+        rebuilds = game.hud.rebuilds - rebuilds
+        debug_stats.tick(time.perf_counter() + 1.0)  # Zähler abschließen, um die Anzeige zu prüfen
+        shown = debug_stats.get_stats()
+
+    print_table(f"HUD ({frames} Frames = {frames / 60:.0f} s Spielzeit)", [
+        ("bisher (jedes Frame neu)", f"{comparison.legacy_time / frames * 1e6:7.1f} us/Frame"),
+        ("zwischengespeichert", f"{comparison.new_time / frames * 1e6:7.1f} us/Frame   {rebuilds} Teile neu gezeichnet "
+                                f"({rebuilds / (frames / 60):.1f} pro Sekunde)"),
+        ("Debug-Anzeige", f"HUD pro Frame {shown.get('HUD pro Frame')}, HUD-Neuaufbau/s vorhanden: "
+                          f"{'ja' if 'HUD-Neuaufbau/s' in shown else 'NEIN'}"),
+        ("größte Abweichung (Farbkanal)", comparison.worst),
+    ])
+    return comparison.worst == 0 and rebuilds < frames // 10
+
+
+############################################################
+# Statische Bildschirme: vorgezeichnete Menüs und End-Bildschirme
+############################################################
+
+def _legacy_menu_background(game, screen):
+    """Hintergrund von Hauptmenü und Optionen wie bisher"""
+    import assets
+
+    # Startbildschirm als Hintergrund
+    if game.start_screen_image:
+        screen.blit(game.start_screen_image, (0, 0))
+    else:
+        # Fallback-Hintergrund
+        screen.fill((20, 30, 50))
+        title_text = game.big_font.render("FÖRDE DER FURCHT", True, (255, 215, 0))
+        title_rect = title_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 100))
+        screen.blit(title_text, title_rect)
+
+
+def _legacy_menu_panel(game, screen, panel, shadow_offset):
+    """Panel von Hauptmenü und Optionen wie bisher: Schatten, dunkle Fläche, goldener Rahmen"""
+    shadow_surface = pygame.Surface((panel.width, panel.height))
+    shadow_surface.set_alpha(50)
+    shadow_surface.fill((0, 0, 0))
+    screen.blit(shadow_surface, (panel.x + shadow_offset, panel.y + shadow_offset))
+
+    panel_surface = pygame.Surface((panel.width, panel.height))
+    panel_surface.fill((25, 25, 30))
+    pygame.draw.rect(panel_surface, game.menu_accent_color, (0, 0, panel.width, panel.height), 3)
+    screen.blit(panel_surface, (panel.x, panel.y))
+
+
+def _legacy_main_menu(game, screen, mouse_pos):
+    """Hauptmenü wie bisher: Panel, Schatten und alle Texte in jedem Frame neu"""
+    _legacy_menu_background(game, screen)
+
+    # Menü-Panel mit Animation (horizontal von rechts)
+    animated_panel = game.menu_panel.copy()
+    animated_panel.x += game.menu_animation_offset
+    _legacy_menu_panel(game, screen, animated_panel, 4)
+
+    # Buttons zeichnen
+    for button_name, button_rect in game.menu_buttons.items():
+        # Button-Position mit Animation anpassen (horizontal)
+        animated_button = button_rect.copy()
+        animated_button.x += game.menu_animation_offset
+
+        # Hover-Erkennung (mit animierter Position)
+        is_hovered = animated_button.collidepoint(mouse_pos)
+
+        # Button-Hintergrund (harmonischer mit dem Rest)
+        button_color = (45, 45, 50) if not is_hovered else (60, 60, 65)
+        pygame.draw.rect(screen, button_color, animated_button)
+
+        # Button-Rahmen (dick bei Hover, dünn sonst)
+        border_width = 3 if is_hovered else 2
+        border_color = game.menu_hover_color if is_hovered else game.menu_accent_color
+        pygame.draw.rect(screen, border_color, animated_button, border_width)
+
+        # Subtiler Glow-Effekt bei Hover
+        if is_hovered:
+            # Innerer Glow
+            inner_rect = animated_button.inflate(-6, -6)
+            pygame.draw.rect(screen, (80, 80, 85), inner_rect, 1)
+
+        # Button-Text mit kleinem Schatten-Effekt
+        text_color = game.menu_hover_color if is_hovered else game.menu_text_color
+
+        # Schatten-Text (subtil)
+        shadow_surface = game.menu_font.render(game.button_texts[button_name], True, (0, 0, 0))
+        shadow_rect = shadow_surface.get_rect(center=(animated_button.centerx + 1, animated_button.centery + 1))
+        shadow_surface.set_alpha(100)
+        screen.blit(shadow_surface, shadow_rect)
+
+        # Haupttext
+        text_surface = game.menu_font.render(game.button_texts[button_name], True, text_color)
+        text_rect = text_surface.get_rect(center=animated_button.center)
+        screen.blit(text_surface, text_rect)
+
+
+def _legacy_options_menu(game, screen, mouse_pos):
+    """Optionsmenü wie bisher (inklusive neu geladener Fonts pro Abschnitt)"""
+    _legacy_menu_background(game, screen)
+
+    # Großes Panel für Optionen
+    panel_width = 500
+    panel_height = 420  # Höhe erhöht, um Platz für den Button zu schaffen
+    panel_x = (WIDTH - panel_width) // 2
+    panel_y = (HEIGHT - panel_height) // 2
+    _legacy_menu_panel(game, screen, pygame.Rect(panel_x, panel_y, panel_width, panel_height), 6)
+
+    # Titel des Optionsmenüs
+    options_title = game.title_font.render("STEUERUNG", True, game.menu_hover_color)
+    title_rect = options_title.get_rect(center=(WIDTH//2, panel_y + 35))
+    screen.blit(options_title, title_rect)
+
+    # Dezente Trennlinie unter dem Titel
+    line_y = panel_y + 60
+    line_color = (100, 90, 80)  # Gedämpftere Farbe
+    pygame.draw.line(screen, line_color,
+                    (panel_x + 80, line_y), (panel_x + panel_width - 80, line_y), 2)
+
+    # Steuerungsinformationen mit harmonischen Farben
+    controls_sections = [
+        {
+            "title": "BEWEGUNG",
+            "color": game.menu_accent_color,  # Warmes Gold
+            "items": ["Pfeiltasten - Bewegen/Springen"]
+        },
+        {
+            "title": "AKTIONEN",
+            "color": (200, 170, 130),  # Gedämpftes Gold
+            "items": ["LEERTASTE - Blasen schießen", "ESC - Zurück zum Hauptmenü"]
+        },
+        {
+            "title": "SPIELZIEL",
+            "color": (180, 150, 110),  # Noch gedämpfteres Gold
+            "items": ["Fange Gegner mit Blasen und sammle", "Credit Points und Noten (1,0)!"]
+        }
+    ]
+
+    # Text rendern
+    y_offset = panel_y + 85
+
+    for section in controls_sections:
+        # Kategorie-Titel
+        category_font = pygame.font.Font(None, 28)
+        category_surface = category_font.render(section["title"], True, section["color"])
+        category_rect = category_surface.get_rect(centerx=WIDTH//2, y=y_offset)
+        screen.blit(category_surface, category_rect)
+
+        # Kleine Linie unter Kategorie
+        pygame.draw.line(screen, section["color"],
+                       (category_rect.left, category_rect.bottom + 2),
+                       (category_rect.right, category_rect.bottom + 2), 1)
+
+        y_offset += 35
+
+        # Detail-Items
+        detail_font = pygame.font.Font(None, 24)
+        for item in section["items"]:
+            item_surface = detail_font.render(item, True, (200, 200, 200))
+            item_rect = item_surface.get_rect(centerx=WIDTH//2, y=y_offset)
+            screen.blit(item_surface, item_rect)
+
+            y_offset += 25
+
+        y_offset += 15  # Extra Abstand zwischen Sektionen
+
+    # Zurück-Button (weiter unten positioniert)
+    back_button_width = 120
+    back_button_height = 35
+    back_button_x = WIDTH//2 - back_button_width//2
+    back_button_y = panel_y + panel_height - 55  # Mehr Abstand vom Rand
+
+    back_button_rect = pygame.Rect(back_button_x, back_button_y, back_button_width, back_button_height)
+
+    # Button-Styling
+    is_hovered = back_button_rect.collidepoint(mouse_pos)
+    button_color = (45, 45, 50) if not is_hovered else (60, 60, 65)
+    pygame.draw.rect(screen, button_color, back_button_rect)
+
+    # Button-Rahmen
+    border_width = 3 if is_hovered else 2
+    border_color = game.menu_hover_color if is_hovered else game.menu_accent_color
+    pygame.draw.rect(screen, border_color, back_button_rect, border_width)
+
+    # Button-Text
+    text_color = game.menu_hover_color if is_hovered else game.menu_text_color
+    back_text = game.menu_font.render("Zurück", True, text_color)
+    back_text_rect = back_text.get_rect(center=back_button_rect.center)
+    screen.blit(back_text, back_text_rect)
+
+
+def _legacy_game_over(game, screen):
+    """Game Over wie bisher: Abdunkelung, Panel und alle Texte in jedem Frame neu"""
+    import assets
+
+    if not game.game_over_image_loaded:
+        game.load_game_over_image()
+    # Game Over-Hintergrund zeichnen
+    if game.game_over_image:
+        # Game Over-Bild als Hintergrund verwenden
+        screen.blit(game.game_over_image, (0, 0))
+
+        # Leichte Abdunkelung für bessere Textlesbarkeit
+        overlay = pygame.Surface((WIDTH, HEIGHT))
+        overlay.set_alpha(80)  # Weniger stark abdunkeln da Bild schon dunkel sein könnte
+        overlay.fill((0, 0, 0))
+        screen.blit(overlay, (0, 0))
+    else:
+        # Fallback: Dunkler Hintergrund ohne Bild
+        overlay = pygame.Surface((WIDTH, HEIGHT))
+        overlay.set_alpha(180)
+        overlay.fill((0, 0, 0))
+        screen.blit(overlay, (0, 0))
+
+    # Panel für bessere Textlesbarkeit
+    panel_width = 700
+    panel_height = 300
+    panel_x = (WIDTH - panel_width) // 2
+    panel_y = (HEIGHT - panel_height) // 2
+
+    # Halbtransparentes Panel
+    panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+    panel_surface.fill((0, 0, 0, 120))  # Schwarzer transparenter Hintergrund
+
+    # Roter Rahmen für dramatischen Effekt
+    pygame.draw.rect(panel_surface, (255, 0, 0),
+                    (0, 0, panel_width, panel_height), 4)
+
+    screen.blit(panel_surface, (panel_x, panel_y))
+
+    # "Zwangsexmatrikulation" Text mit Schatten
+    shadow_offset = 3
+    game_over_shadow = game.big_font.render("ZWANGSEXMATRIKULATION", True, (0, 0, 0))
+    shadow_rect = game_over_shadow.get_rect(center=(WIDTH//2 + shadow_offset, panel_y + 70 + shadow_offset))
+    screen.blit(game_over_shadow, shadow_rect)
+
+    game_over_text = game.big_font.render("ZWANGSEXMATRIKULATION", True, (255, 0, 0))
+    text_rect = game_over_text.get_rect(center=(WIDTH//2, panel_y + 70))
+    screen.blit(game_over_text, text_rect)
+
+    # Zusätzliche Informationen mit Schatten
+    subtitle_shadow = game.font.render("Alle Fehlversuche aufgebraucht!", True, (0, 0, 0))
+    subtitle_shadow_rect = subtitle_shadow.get_rect(center=(WIDTH//2 + 2, panel_y + 120 + 2))
+    screen.blit(subtitle_shadow, subtitle_shadow_rect)
+
+    subtitle_text = game.font.render("Alle Fehlversuche aufgebraucht!", True, (255, 255, 255))
+    subtitle_rect = subtitle_text.get_rect(center=(WIDTH//2, panel_y + 120))
+    screen.blit(subtitle_text, subtitle_rect)
+
+    # Neustart-Anweisung mit Schatten
+    restart_shadow = game.font.render("Drücke 'R' für Neustart", True, (0, 0, 0))
+    restart_shadow_rect = restart_shadow.get_rect(center=(WIDTH//2 + 2, panel_y + 170 + 2))
+    screen.blit(restart_shadow, restart_shadow_rect)
+
+    restart_text = game.font.render("Drücke 'R' für Neustart", True, (255, 255, 255))
+    restart_rect = restart_text.get_rect(center=(WIDTH//2, panel_y + 170))
+    screen.blit(restart_text, restart_rect)
+
+    # Finaler Punktestand mit Schatten
+    final_score_shadow = game.font.render(f"Endpunktestand: {game.score}", True, (0, 0, 0))
+    final_score_shadow_rect = final_score_shadow.get_rect(center=(WIDTH//2 + 2, panel_y + 220 + 2))
+    screen.blit(final_score_shadow, final_score_shadow_rect)
+
+    final_score_text = game.font.render(f"Endpunktestand: {game.score}", True, (255, 255, 0))
+    final_score_rect = final_score_text.get_rect(center=(WIDTH//2, panel_y + 220))
+    screen.blit(final_score_text, final_score_rect)
+
+
+def _legacy_level_complete(game, screen):
+    """Level-Sieg wie bisher: Abdunkelung, Panel und alle Texte in jedem Frame neu"""
+    # Hintergrund abdunkeln
+    overlay = pygame.Surface((WIDTH, HEIGHT))
+    overlay.set_alpha(150)
+    overlay.fill((0, 0, 0))
+    screen.blit(overlay, (0, 0))
+
+    # Goldener Hintergrund für den Siegestext
+    victory_panel_width = 600
+    victory_panel_height = 400
+    panel_x = (WIDTH - victory_panel_width) // 2
+    panel_y = (HEIGHT - victory_panel_height) // 2
+
+    # Panel mit Gradient-Effekt
+    panel_surface = pygame.Surface((victory_panel_width, victory_panel_height))
+    panel_surface.fill((40, 40, 50))  # Dunkler Hintergrund
+
+    # Goldener Rahmen
+    pygame.draw.rect(panel_surface, (255, 215, 0),
+                    (0, 0, victory_panel_width, victory_panel_height), 5)
+
+    # Innerer Glow-Effekt
+    inner_rect = pygame.Rect(5, 5, victory_panel_width - 10, victory_panel_height - 10)
+    pygame.draw.rect(panel_surface, (60, 60, 70), inner_rect, 2)
+
+    screen.blit(panel_surface, (panel_x, panel_y))
+
+    # Siegestext
+    victory_title = game.big_font.render("PROFESSOR BESIEGT!", True, (255, 215, 0))
+    title_rect = victory_title.get_rect(center=(WIDTH//2, panel_y + 70))
+    screen.blit(victory_title, title_rect)
+
+    # Untertitel
+    subtitle = game.title_font.render("Klausur erfolgreich bestanden!", True, (0, 255, 0))
+    subtitle_rect = subtitle.get_rect(center=(WIDTH//2, panel_y + 120))
+    screen.blit(subtitle, subtitle_rect)
+
+    # Score-Informationen
+    final_score = game.title_font.render(f"Endpunktestand: {game.score}", True, (255, 255, 255))
+    score_rect = final_score.get_rect(center=(WIDTH//2, panel_y + 170))
+    screen.blit(final_score, score_rect)
+
+    # Credit Points
+    final_cp = game.font.render(f"Credit Points gesammelt: {game.current_level.player.credit_points}", True, (255, 215, 0))
+    cp_rect = final_cp.get_rect(center=(WIDTH//2, panel_y + 210))
+    screen.blit(final_cp, cp_rect)
+
+    # Grades
+    final_grades = game.font.render(f"Noten 1,0 gesammelt: {game.current_level.player.grades_collected}", True, (0, 255, 0))
+    grades_rect = final_grades.get_rect(center=(WIDTH//2, panel_y + 240))
+    screen.blit(final_grades, grades_rect)
+
+    # Überlebte Leben
+    final_lives = game.font.render(f"Verbleibende Leben: {game.current_level.player.lives}", True, (255, 100, 100))
+    lives_rect = final_lives.get_rect(center=(WIDTH//2, panel_y + 270))
+    screen.blit(final_lives, lives_rect)
+
+    # Trennlinie
+    line_y = panel_y + 300
+    pygame.draw.line(screen, (255, 215, 0),
+                    (panel_x + 50, line_y), (panel_x + victory_panel_width - 50, line_y), 2)
+
+    # Anweisungen
+    instruction1 = game.font.render("Drücke 'R' für Neustart", True, (255, 255, 255))
+    instruction1_rect = instruction1.get_rect(center=(WIDTH//2, panel_y + 330))
+    screen.blit(instruction1, instruction1_rect)
+
+    instruction2 = game.font.render("Drücke 'ESC' für Hauptmenü", True, (255, 255, 255))
+    instruction2_rect = instruction2.get_rect(center=(WIDTH//2, panel_y + 360))
+    screen.blit(instruction2, instruction2_rect)
+
+
+def bench_static_screens(frames=600):
+    """Menü, Optionen, Game Over und Level-Sieg je frames Bilder: bisher gegen vorgezeichnet"""
+    import debug_stats
+
+    game = new_game(start=True)
+    game.score = 12345
+    player = game.current_level.player
+    player.credit_points, player.grades_collected = 42, 3
+
+    # Maus wandert alle 20 Bilder weiter: über die Buttons und daneben (Hover an/aus)
+    menu_points = [button.center for button in game.menu_buttons.values()] + [(40, 40)]
+    options_points = [game.back_button_rect.center, (40, 40)]
+
+    def main_menu(draw, screen, frame):
+        if frame == 0:
+            game.menu_animation_offset = 200  # Panel fährt wie beim Öffnen herein
+        if draw is None:
+            game.update_menu_animation()
+            return
+        draw(screen, menu_points[frame // 20 % len(menu_points)])
+
+    def options_menu(draw, screen, frame):
+        if draw is not None:
+            draw(screen, options_points[frame // 20 % len(options_points)])
+
+    def end_screen(draw, screen, frame):
+        if draw is not None:
+            draw(screen)
+
+    def with_screen(method):
+        """Neue Variante zeichnet auf game.screen: für die Messung umlenken"""
+        def draw(screen):
+            game.screen, display = screen, game.screen
+            try:
+                method()
+            finally:
+                game.screen = display
+        return draw
+
+    screens = [
+        ("Hauptmenü", main_menu, lambda s, m: _legacy_main_menu(game, s, m), game.draw_main_menu),
+        ("Optionen", options_menu, lambda s, m: _legacy_options_menu(game, s, m), game.draw_options_menu),
+        ("Game Over", end_screen, lambda s: _legacy_game_over(game, s), with_screen(game.draw_game_over)),
+        ("Level geschafft", end_screen, lambda s: _legacy_level_complete(game, s),
+         with_screen(game.draw_level_complete)),
+    ]
+    rows = []
+    worst = 0
+    slower = False
+    debug_stats.reset_stats()
+    builds = game.static_screens.builds
+    with quiet():
+        for label, run, legacy, cached in screens:
+            comparison = DrawComparison()
+            for frame in range(frames):
+                run(None, None, frame)  # Simulationsschritt (Menü-Animation)
+                comparison.frame(lambda screen: run(legacy, screen, frame), lambda screen: run(cached, screen, frame))
+            legacy_time, cached_time = comparison.legacy_time, comparison.new_time
+            worst = max(worst, comparison.worst)
+            slower |= cached_time * 2 > legacy_time
+            rows.append((label, f"{legacy_time / frames * 1e6:7.1f} -> {cached_time / frames * 1e6:6.1f} us/Frame "
+                                f"({cached_time / legacy_time:.0%})"))
+    builds = game.static_screens.builds - builds
+    debug_stats.tick(time.perf_counter() + 1.0)
+
+    rows.append(("vorgezeichnete Hintergründe", f"{builds} (Debug-Anzeige: "
+                 f"{'ja' if 'Bildschirm-Neuaufbau/s' in debug_stats.get_stats() else 'NEIN'})"))
+    rows.append(("größte Abweichung (Farbkanal)", worst))
+    print_table(f"Statische Bildschirme ({frames} Frames je Bildschirm)", rows)
+    return worst == 0 and not slower
+
+
+BENCHMARKS = {
+    "asset_cache": bench_asset_cache,
+    "startup": bench_startup,
+    "parallel_decode": bench_parallel_decode,
+    "level_swap": bench_level_swap,
+    "flyweight": bench_flyweight,
+    "static_layer": bench_static_layer,
+    "startup_profile": bench_startup_profile,
+    "surface_formats": bench_surface_formats,
+    "blit_modes": bench_blit_modes,
+    "transform_cache": bench_transform_cache,
+    "collision_index": bench_collision_index,
+    "broadphase": bench_broadphase,
+    "precise_collision": bench_precise_collision,
+    "enemy_physics": bench_enemy_physics,
+    "swept_collision": bench_swept_collision,
+    "fixed_timestep": bench_fixed_timestep,
+    "timer_wheel": bench_timer_wheel,
+    "entity_registry": bench_entity_registry,
+    "platform_activity": bench_platform_activity,
+    "enemy_lod": bench_enemy_lod,
+    "zone_streaming": bench_zone_streaming,
+    "culled_draw": bench_culled_draw,
+    "effect_variants": bench_effect_variants,
+    "hud": bench_hud,
+    "static_screens": bench_static_screens,
+}
+
+
+def main(names):
+    """Führt die angegebenen (oder alle) Benchmarks aus; gibt 1 zurück, wenn eine Prüfung fehlschlägt
+
+    Benchmarks mit Prüfung geben True/False zurück, reine Messungen None.
+    """
+    selected = names or list(BENCHMARKS)
+    failed = []
+    for name in selected:
+        if name not in BENCHMARKS:
+            print(f"Unbekannter Benchmark: {name} (verfügbar: {', '.join(BENCHMARKS)})")
+            failed.append(name)
+            continue
+        if BENCHMARKS[name]() is False:
+            failed.append(name)
+    pygame.quit()
+    if failed:
+        print(f"\nFehlgeschlagen: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
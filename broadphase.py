@@ -0,0 +1,85 @@
+"""
+Dynamische Broadphase für bewegliche Objekte
+Spieler, Gegner, Blasen und Stifte werden in jedem Frame nach der Bewegung in
+einen räumlichen Hash (BROADPHASE_CELL_SIZE) einsortiert. Alle Kollisionsprüfungen
+in Level.update fragen dann nur noch die Objekte derselben oder benachbarter
+Zellen ab - die Kosten hängen von der Dichte vor Ort ab, nicht von der
+Gesamtzahl der Objekte im Level.
+
+Abfragen liefern Treffer in Einfüge-Reihenfolge (= Reihenfolge der Sprite-Gruppen),
+damit bei mehreren Treffern dasselbe Objekt gewinnt wie bei einer linearen Suche.
+"""
+
+from settings import BROADPHASE_CELL_SIZE
+
+
+class SpatialHash:
+    """Räumlicher Hash mit Kategorien (z.B. "enemy", "bubble"), wird pro Frame neu gefüllt"""
+
+    def __init__(self, cell_size=BROADPHASE_CELL_SIZE):
+        self.cell_size = cell_size
+        # kategorie -> {(spalte, zeile): [(reihenfolge, sprite, rechteck beim Einfügen), ...]}
+        self.cells = {}
+        self.order = {}       # sprite -> Einfüge-Reihenfolge
+        self.entries = {}     # sprite -> (kategorie, eintrag), für refresh()
+        self.pair_tests = 0   # Rechteck-Tests seit dem letzten clear() (für Benchmarks)
+
+    def clear(self):
+        """Leert den Hash für den nächsten Frame"""
+        self.cells = {}
+        self.order = {}
+        self.entries = {}
+        self.pair_tests = 0
+
+    def insert(self, category, sprite, rect=None):
+        """Sortiert ein Sprite mit seinem aktuellen (oder dem übergebenen) Rechteck ein"""
+        order = len(self.order)
+        self.order[sprite] = order
+        self._file(category, (order, sprite, (sprite.rect if rect is None else rect).copy()))
+
+    def refresh(self, sprite, rect=None):
+        """Sortiert ein schon eingefügtes Sprite mit seinem neuen Rechteck um (z.B. nach
+        Bubble.pop), die Einfüge-Reihenfolge bleibt"""
+        category, old = self.entries[sprite]
+        grid = self.cells[category]
+        for cell in self._cells_for(old[2]):
+            grid[cell].remove(old)
+        self._file(category, (old[0], sprite, (sprite.rect if rect is None else rect).copy()))
+
+    def _file(self, category, entry):
+        grid = self.cells.setdefault(category, {})
+        for cell in self._cells_for(entry[2]):
+            grid.setdefault(cell, []).append(entry)
+        self.entries[entry[1]] = (category, entry)
+
+    def _cells_for(self, rect):
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (column, row)
+
+    def insert_all(self, category, sprites):
+        for sprite in sprites:
+            self.insert(category, sprite)
+
+    def query(self, rect, category, after=None):
+        """Sprites einer Kategorie, die rect überlappen (in Einfüge-Reihenfolge)
+
+        after: nur Sprites, die nach diesem Sprite eingefügt wurden (für Paare innerhalb
+               einer Kategorie, damit jedes Paar nur einmal geprüft wird)
+        """
+        grid = self.cells.get(category)
+        if not grid:
+            return []
+        first = self.order[after] + 1 if after is not None else 0
+        size = self.cell_size
+        candidates = {}
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in rows:
+                for entry in grid.get((column, row), ()):
+                    if entry[0] >= first:
+                        candidates[entry[0]] = entry
+        self.pair_tests += len(candidates)
+        return [candidates[order][1] for order in sorted(candidates)
+                if candidates[order][2].colliderect(rect)]
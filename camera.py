@@ -25,15 +25,16 @@ class Camera:
         self.y_min = 0
         self.y_max = level_height - HEIGHT
     
-    def update(self, target):
+    def update(self, target, dt=1.0):
         """Aktualisiert die Kamera-Position basierend auf dem Ziel (normalerweise der Spieler)"""
         # Zielposition berechnen (Spieler zentriert)
         target_x = target.rect.centerx - WIDTH // 2
         target_y = target.rect.centery - HEIGHT // 2
         
-        # Sanfte Kamera-Bewegung (Lerp)
-        self.x_offset += (target_x - self.x_offset) * self.follow_speed
-        self.y_offset += (target_y - self.y_offset) * self.follow_speed
+        # Sanfte Kamera-Bewegung (Lerp), bei längeren Schritten entsprechend weiter
+        follow = self.follow_speed if dt == 1.0 else 1 - (1 - self.follow_speed) ** dt
+        self.x_offset += (target_x - self.x_offset) * follow
+        self.y_offset += (target_y - self.y_offset) * follow
         
         # Kamera in Level-Grenzen halten
         self.x_offset = max(self.x_min, min(self.x_offset, self.x_max))
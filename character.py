@@ -1,5 +1,6 @@
 import pygame
 from settings import WIDTH, HEIGHT, GRAVITY, PLAYER_JUMP_STRENGTH, ENEMY_HEALTH, COLOR_WHITE, MAX_FALL_SPEED
+from collision_index import CollisionIndex
 
 class Character(pygame.sprite.Sprite):
     def __init__(self, x, y, sprite):
@@ -18,10 +19,11 @@ class Character(pygame.sprite.Sprite):
         # Level-Grenzen (werden vom Level gesetzt)
         self.level_width = WIDTH  # Standard-Wert, wird überschrieben
         self.level_height = HEIGHT
+        self.timers = None  # Timer-Rad des Levels (wird vom Level gesetzt, siehe timers.py)
 
         #Betäubung durch Syntax Scream
         self.is_stunned = False
-        self.stun_timer = 0
+        self.stun_timer = None  # Timer, der die Betäubung beendet
         self.stun_effect_color = (255, 0, 0, 70)  # Rot mit Transparenz
 
 
@@ -37,33 +39,50 @@ class Character(pygame.sprite.Sprite):
             self.velocity.y = PLAYER_JUMP_STRENGTH  # Sprunggeschwindigkeit
             self.on_ground = False
 
-    def update(self, platforms=None):
+    def update(self, platforms=None, dt=1.0):
+        """Schwerkraft, Bewegung und Plattform-Kollision für einen Simulationsschritt
+
+        platforms: CollisionIndex der Plattformen (Level.collision_index, einmal beim Laden gebaut) oder None
+        dt: Länge des Schritts in Frames bei 60 FPS (1.0 = ein Frame, 2.0 bei 30 Hz)
+        """
         # Schwerkraft anwenden
-        self.velocity.y += GRAVITY
+        self.velocity.y += GRAVITY * dt
         
         #Betäubungseffekt anwenden
         if self.is_stunned:
             self.velocity.x = 0  # Keine horizontale Bewegung während der Betäubung
-            self.stun_timer -= 1
-            if self.stun_timer <= 0:
-                self.is_stunned = False
 
         # Maximale Fallgeschwindigkeit begrenzen
         if self.velocity.y > MAX_FALL_SPEED:
             self.velocity.y = MAX_FALL_SPEED
         
+        # Kein Neuaufbau pro Frame: eine Plattformliste ist hier ein Fehler des Aufrufers
+        if platforms is not None and not isinstance(platforms, CollisionIndex):
+            raise TypeError("Character.update erwartet einen CollisionIndex (Level.collision_index)")
+
         # Horizontale Bewegung
-        self.rect.x += self.velocity.x
+        start_rect = self.rect.copy()
+        self.rect.x += self.velocity.x * dt
         
-        # Horizontale Kollisionsprüfung mit Plattformen
+        # Horizontale Kollisionsprüfung mit Plattformen (nur die im überstrichenen Bereich)
         if platforms:
-            for platform in platforms:
-                # Prüfe ob brechende Plattform kollidierbar ist
-                can_collide = True
-                if hasattr(platform, 'can_collide'):
-                    can_collide = platform.can_collide()
+            candidates = platforms.query(self.rect.union(start_rect))
+            # Kontinuierlich: an der ersten Plattformkante anhalten, die auf dem Weg lag
+            # (sonst könnte ein schneller Schritt durch eine schmale Plattform hindurch gehen)
+            contact = self._first_contact_x(start_rect, candidates)
+            if contact is not None:
+                if self.velocity.x > 0:
+                    self.rect.right = contact.rect.left
+                else:
+                    self.rect.left = contact.rect.right
+
+            # Überlappung von Anfang an (z.B. in eine Plattform gespawnt): herausschieben wie bisher
+            for platform, breakable in candidates:
+                # Brechende Plattform nur kollidierbar, solange sie nicht gebrochen ist
+                if breakable and not platform.can_collide():
+                    continue
                 
-                if can_collide and self.rect.colliderect(platform.rect):
+                if self.rect.colliderect(platform.rect):
                     if self.velocity.x > 0:  # Bewegung nach rechts
                         self.rect.right = platform.rect.left
                     elif self.velocity.x < 0:  # Bewegung nach links
@@ -76,18 +95,30 @@ class Character(pygame.sprite.Sprite):
             self.rect.right = self.level_width
         
         # Vertikale Bewegung
-        self.rect.y += self.velocity.y
+        start_rect = self.rect.copy()
+        self.rect.y += self.velocity.y * dt
         
-        # Vertikale Kollisionsprüfung mit Plattformen
+        # Vertikale Kollisionsprüfung mit Plattformen (nur die im überstrichenen Bereich)
         self.on_ground = False
         if platforms:
-            for platform in platforms:
-                # Prüfe ob brechende Plattform kollidierbar ist
-                can_collide = True
-                if hasattr(platform, 'can_collide'):
-                    can_collide = platform.can_collide()
+            candidates = platforms.query(self.rect.union(start_rect))
+            contact = self._first_contact_y(start_rect, candidates)
+            if contact is not None:
+                # Auf der ersten Plattform landen bzw. anstoßen, die auf dem Weg lag
+                if self.velocity.y > 0:
+                    self.rect.bottom = contact.rect.top
+                    self.on_ground = True
+                else:
+                    self.rect.top = contact.rect.bottom
+                self.velocity.y = 0
+                candidates = ()  # Geschwindigkeit ist 0, weitere Plattformen ändern nichts
+
+            for platform, breakable in candidates:
+                # Brechende Plattform nur kollidierbar, solange sie nicht gebrochen ist
+                if breakable and not platform.can_collide():
+                    continue
                 
-                if can_collide and self.rect.colliderect(platform.rect):
+                if self.rect.colliderect(platform.rect):
                     if self.velocity.y > 0:  # Charakter fällt nach unten
                         self.rect.bottom = platform.rect.top
                         self.velocity.y = 0
@@ -105,9 +136,63 @@ class Character(pygame.sprite.Sprite):
             self.velocity.y = 0
             self.on_ground = True
 
+    def _first_contact_x(self, start_rect, candidates):
+        """Erste Plattform, deren Seitenkante bei der horizontalen Bewegung überquert wurde"""
+        contact = None
+        for platform, breakable in candidates:
+            rect = platform.rect
+            # Nur Plattformen auf gleicher Höhe, an denen der Charakter vorher noch nicht steckte
+            if rect.top >= start_rect.bottom or rect.bottom <= start_rect.top:
+                continue
+            if self.velocity.x > 0:
+                if not start_rect.right <= rect.left < self.rect.right:
+                    continue
+                if contact is not None and contact.rect.left <= rect.left:
+                    continue
+            elif self.velocity.x < 0:
+                if not self.rect.left < rect.right <= start_rect.left:
+                    continue
+                if contact is not None and contact.rect.right >= rect.right:
+                    continue
+            else:
+                return None
+            if breakable and not platform.can_collide():
+                continue
+            contact = platform
+        return contact
+
+    def _first_contact_y(self, start_rect, candidates):
+        """Erste Plattform, deren Ober- bzw. Unterkante bei der vertikalen Bewegung überquert wurde"""
+        contact = None
+        for platform, breakable in candidates:
+            rect = platform.rect
+            if rect.left >= self.rect.right or rect.right <= self.rect.left:
+                continue
+            if self.velocity.y > 0:
+                if not start_rect.bottom <= rect.top < self.rect.bottom:
+                    continue
+                if contact is not None and contact.rect.top <= rect.top:
+                    continue
+            elif self.velocity.y < 0:
+                if not self.rect.top < rect.bottom <= start_rect.top:
+                    continue
+                if contact is not None and contact.rect.bottom >= rect.bottom:
+                    continue
+            else:
+                return None
+            if breakable and not platform.can_collide():
+                continue
+            contact = platform
+        return contact
+
     def apply_stun(self, duration):
         """Wendet eine Betäubung an, die die Bewegung des Charakters für eine bestimmte Zeit stoppt."""
         self.is_stunned = True
-        self.stun_timer = duration
+        if self.stun_timer is not None:
+            self.stun_timer.cancel()  # Neue Betäubung ersetzt die alte
+        self.stun_timer = self.timers.schedule(duration, self._end_stun)
         self.velocity.x = 0
-        self.velocity.y = 0
\ No newline at end of file
+        self.velocity.y = 0
+
+    def _end_stun(self):
+        self.is_stunned = False
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Statischer Kollisions-Index für Plattformen
+Die Plattformen eines Levels werden beim Laden einmal in ein gleichmäßiges
+Raster (COLLISION_CELL_SIZE) einsortiert. Character.update fragt dann nur noch
+die Plattformen ab, die das überstrichene Rechteck eines Charakters berühren,
+statt in jedem Frame alle Plattformen des Levels zweimal durchzugehen.
+
+Brechende Plattformen werden beim Einsortieren markiert; nur für sie wird
+can_collide() aufgerufen.
+"""
+
+from settings import COLLISION_CELL_SIZE
+
+
+class CollisionIndex:
+    """Raster über alle Plattformen eines Levels (Positionen ändern sich nicht)"""
+
+    def __init__(self, platforms, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        # (spalte, zeile) -> Liste von (reihenfolge, plattform, brechbar)
+        self.cells = {}
+        self.count = 0
+        for order, platform in enumerate(platforms):
+            # Brechbar: Kollision hängt vom Zustand ab (siehe BreakingPlatform.can_collide)
+            entry = (order, platform, hasattr(platform, 'can_collide'))
+            for cell in self._cells_for(platform.rect):
+                self.cells.setdefault(cell, []).append(entry)
+            self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def _cells_for(self, rect):
+        """Alle Rasterzellen, die ein Rechteck berührt"""
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (column, row)
+
+    def query(self, rect):
+        """Plattformen, die rect überlappen, als (plattform, brechbar) in Level-Reihenfolge"""
+        found = {}
+        size = self.cell_size
+        cells = self.cells
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        # Schleifen ausgeschrieben statt _cells_for: läuft pro Charakter zweimal je Frame
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in rows:
+                for entry in cells.get((column, row), ()):
+                    if entry[1].rect.colliderect(rect):
+                        found[entry[0]] = entry
+        # Reihenfolge wie in der Plattform-Gruppe: bei mehreren Treffern gewinnt dieselbe Plattform wie bisher
+        return [(found[order][1], found[order][2]) for order in sorted(found)]
@@ -0,0 +1,56 @@
+"""
+Gecachte Kollisionsmasken für pixelgenaue Treffer
+Im präzisen Modus (PRECISE_COLLISION) zählt ein Treffer erst, wenn sich die
+sichtbaren Pixel zweier Sprites überlappen - durchsichtige Ecken (z.B. beim
+Boss) verletzen den Spieler dann nicht mehr. Die Maske wird pro Surface
+einmal berechnet; da Sprites und ihre gespiegelten Varianten geteilt werden
+(siehe transform_cache), gibt es nur eine Handvoll Masken im ganzen Spiel.
+Der Rechteck-Test der Broadphase bleibt die Vorauswahl.
+"""
+
+import weakref
+import pygame
+
+# Surface -> Maske (verschwindet automatisch mit der Surface)
+_masks = weakref.WeakKeyDictionary()
+
+# Statistiken zur Kontrolle (z.B. für python benchmark.py precise_collision)
+_stats = {
+    "masks_built": 0,
+    "overlap_tests": 0,
+    "rejected": 0,      # Rechtecke überlappen, sichtbare Pixel nicht
+}
+
+
+def get_mask(surface):
+    """Gibt die Maske einer Surface zurück (einmal pro Surface berechnet)"""
+    mask = _masks.get(surface)
+    if mask is None:
+        # Berücksichtigt Alpha-Kanal und Colorkey (siehe assets.to_display_format)
+        mask = pygame.mask.from_surface(surface)
+        _masks[surface] = mask
+        _stats["masks_built"] += 1
+    return mask
+
+
+def overlap(sprite_a, sprite_b):
+    """Prüft, ob sich die sichtbaren Pixel zweier Sprites überlappen"""
+    offset = (sprite_b.rect.x - sprite_a.rect.x, sprite_b.rect.y - sprite_a.rect.y)
+    _stats["overlap_tests"] += 1
+    if get_mask(sprite_a.image).overlap(get_mask(sprite_b.image), offset) is None:
+        _stats["rejected"] += 1
+        return False
+    return True
+
+
+def get_stats():
+    """Gibt eine Kopie der Statistiken zurück"""
+    stats = dict(_stats)
+    stats["cached_masks"] = len(_masks)
+    return stats
+
+
+def reset_stats():
+    """Setzt die Zähler zurück (der Cache selbst bleibt erhalten)"""
+    for key in _stats:
+        _stats[key] = 0
@@ -0,0 +1,63 @@
+"""
+Debug-Statistiken für das laufende Spiel
+Module melden Werte (set_value) oder zählen Ereignisse (count); Zähler werden
+einmal pro Sekunde abgeschlossen, sodass das Overlay (F3) Raten pro Sekunde
+zeigt, z.B. Simulationsschritte gegen gezeichnete Bilder.
+"""
+
+import time
+
+# Name -> aktueller Wert (wird so angezeigt, wie er gemeldet wurde)
+_values = {}
+# Name -> Zähler der laufenden Sekunde bzw. Ergebnis der letzten vollen Sekunde
+_counters = {}
+_per_second = {}
+_window_start = time.perf_counter()
+
+
+def set_value(name, value):
+    """Meldet einen aktuellen Wert (z.B. Kosten des letzten Frames)"""
+    _values[name] = value
+
+
+def count(name, amount=1):
+    """Zählt ein Ereignis; angezeigt wird die Anzahl pro Sekunde"""
+    _counters[name] = _counters.get(name, 0) + amount
+
+
+def tick(now=None):
+    """Schließt nach Ablauf einer Sekunde die Zähler ab (einmal pro Frame aufrufen)"""
+    global _window_start
+    now = time.perf_counter() if now is None else now
+    elapsed = now - _window_start
+    if elapsed < 1.0:
+        return
+    for name in set(_counters) | set(_per_second):
+        _per_second[name] = _counters.get(name, 0) / elapsed
+    _counters.clear()
+    _window_start = now
+
+
+def get_stats():
+    """Gibt alle Werte zurück (Zähler als Rate pro Sekunde mit Suffix "/s")"""
+    stats = {f"{name}/s": rate for name, rate in _per_second.items()}
+    stats.update(_values)
+    return stats
+
+
+def reset_stats():
+    """Löscht alle Werte und Zähler"""
+    global _window_start
+    _values.clear()
+    _counters.clear()
+    _per_second.clear()
+    _window_start = time.perf_counter()
+
+
+def draw(screen, font, position=(10, 150)):
+    """Zeichnet die Statistiken als Textzeilen (nur im Debug-Overlay)"""
+    x, y = position
+    for name, value in sorted(get_stats().items()):
+        text = f"{name}: {value:.1f}" if isinstance(value, float) else f"{name}: {value}"
+        screen.blit(font.render(text, True, (200, 200, 200)), (x, y))
+        y += font.get_linesize()
@@ -1,5 +1,5 @@
-import pygame
 import random
+import transform_cache
 from settings import WIDTH, HEIGHT, GRAVITY, PLAYER_JUMP_STRENGTH, ENEMY_SPEED, ENEMY_HEALTH, COLOR_WHITE, COLOR_YELLOW, COLOR_BLUE, COLOR_BLACK
 from settings import BOSS_ATTACK_COOLDOWN_SYNTAXSCREAM, BOSS_HEALTH, PLAYER_SCREAM_DURATION, BOSS_SCREAM_RADIUS, BOSS_SHOOTING_RADIUS # Boss related settings
 from character import Character
@@ -14,9 +14,8 @@ class Enemy(Character):
         self.state = '''idle'''
         self.movement_strategy = None #Bewegungsstrategie zuweisen
 
-        self.base_image = sprite.copy() if sprite else pygame.Surface((50, 50))
-        if sprite is None:
-            self.base_image.fill(COLOR_WHITE)
+        # Sprite wird von allen Gegnern des Typs geteilt (keine Kopie pro Instanz)
+        self.base_image = sprite if sprite else self.image
 
         self.image = self.base_image
 
@@ -27,8 +26,12 @@ class Enemy(Character):
     def attack(self):
         pass
 
-    def update(self, platforms, player = None, camera = None):
+    def update(self, platforms, player = None, camera = None, dt=1.0):
+        self.update_behaviour(platforms, player, camera)
+        super().update(platforms, dt)
 
+    def update_behaviour(self, platforms, player = None, camera = None):
+        """Bewegungsstrategie und Blickrichtung (ohne Physik, siehe enemy_physics.py)"""
         if self.movement_strategy:
             self.movement_strategy.move(self, platforms, player, camera)
 
@@ -36,10 +39,7 @@ class Enemy(Character):
         if self.velocity.x > 0:  # Bewegung rechts
             self.image = self.base_image  # Originalbild nach rechts
         elif self.velocity.x < 0:  # Bewegung links
-            self.image = pygame.transform.flip(self.base_image, True, False)  # Spiegle das Bild
-        
-
-        super().update(platforms)
+            self.image = transform_cache.flip(self.base_image, True, False)  # Gespiegeltes Bild (geteilt)
 
 class MultipleChoiceEnemy(Enemy):
     # Standardgegner
@@ -54,8 +54,8 @@ class MultipleChoiceEnemy(Enemy):
             RandomJump(jump_strength=-8, jump_chance=0.01))    
         #self.movement_strategy = HorizontalMovement(speed=self.speed)
     
-    def update(self, platforms, player=None, camera=None):
-        super().update(platforms, player, camera)
+    def update(self, platforms, player=None, camera=None, dt=1.0):
+        super().update(platforms, player, camera, dt)
 
 
     def attack(self):
@@ -99,16 +99,17 @@ class Boss(Enemy):
         super().__init__(x, y, sprite, level_width)
         
         boss_size = (75, 75)
-        self.image = pygame.transform.scale(self.base_image, boss_size)
-        self.base_image = pygame.transform.scale(self.base_image, boss_size)
+        self.base_image = transform_cache.scale(self.base_image, boss_size)
+        self.image = self.base_image
         
         old_center = self.rect.center
         self.rect = self.image.get_rect(center=old_center)
         self.health = BOSS_HEALTH
         self.movement_strategy = ChasePlayer(speed=self.speed)
 
+        # Alle Zeiten in Simulationsschritten (Frames bei 60 FPS) auf dem Timer-Rad des Levels
         # Cooldown für die Stift Durchgang
-        self.pen_attack_cooldown_ms = 5000
+        self.pen_attack_cooldown = 300  # 5s
         self.last_pen_attack_time = 0
 
         # Cooldown für den Syntax Schrei
@@ -116,35 +117,34 @@ class Boss(Enemy):
         
         #Pen Feuern
         self.pens_to_fire = 0  #wie viele stifte übrig
-        self.time_between_pens_ms = 5000  #Pause 5s
+        self.time_between_pens = 300  #Pause 5s
         self.last_pen_fired_time = 0 # Zeitstempel des letzten Schusses
 
         #Unverwundbarkeit
         self.is_invincible = False
-        self.invincibility_duration = 500 # Dauer in ms
-        self.invincibility_end_time = 0 # Zeitstempel, wann die Unverwundbarkeit endet
+        self.invincibility_duration = 30 # 0,5s
 
-    def update(self, platforms, player=None, camera=None):
+    def update(self, platforms, player=None, camera=None, dt=1.0):
         # Führt die grundlegende Logik aus (Bewegung, Schwerkraft)
-        super().update(platforms, player, camera)
+        super().update(platforms, player, camera, dt)
 
         if not player:
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = self.timers.now
 
         distance_to_player = abs(self.rect.centerx-player.rect.centerx)
 
         #feuern prüfen
         if (self.pens_to_fire == 0 and 
-            current_time - self.last_pen_attack_time > self.pen_attack_cooldown_ms and
+            current_time - self.last_pen_attack_time > self.pen_attack_cooldown and
             distance_to_player <= BOSS_SHOOTING_RADIUS):
             self.pens_to_fire = 5  # Starte einen Durchgang mit 5 Schuss
             self.last_pen_attack_time = current_time
 
         #Wird grad gefeuert prüfen
         if self.pens_to_fire > 0:
-            if current_time - self.last_pen_fired_time > self.time_between_pens_ms:
+            if current_time - self.last_pen_fired_time > self.time_between_pens:
                 if player and hasattr(self, 'projectiles'):
                     new_pen = RedPen(self.rect.centerx, self.rect.centery, player)
                     self.projectiles.add(new_pen)
@@ -152,22 +152,21 @@ class Boss(Enemy):
                 self.pens_to_fire -= 1
                 self.last_pen_fired_time = current_time
 
-        #Unverwundbarkeit aufheben
-        if self.is_invincible and current_time > self.invincibility_end_time:
-            self.is_invincible = False
-
     def take_damage(self, amount=1):
         if not self.is_invincible:
             self.health -= amount
             self.is_invincible = True
-            # Berechne den Endzeitpunkt der Unverwundbarkeit
-            self.invincibility_end_time = pygame.time.get_ticks() + self.invincibility_duration
+            # Unverwundbarkeit nach Ablauf wieder aufheben
+            self.timers.schedule(self.invincibility_duration, self._end_invincibility)
 
             if self.health <= 0:
                 self.kill()
 
+    def _end_invincibility(self):
+        self.is_invincible = False
+
     def scream(self, player):
-        current_time = pygame.time.get_ticks()
+        current_time = self.timers.now
         if current_time - self.last_scream_time >= BOSS_ATTACK_COOLDOWN_SYNTAXSCREAM:
             player.apply_stun(PLAYER_SCREAM_DURATION)
             self.last_scream_time = current_time
@@ -0,0 +1,145 @@
+"""
+Gebündelte Gegner-Physik mit NumPy (optional)
+Statt Character.update für jeden Gegner einzeln aufzurufen, werden Positionen,
+Geschwindigkeiten, Bodenkontakt und Betäubung aller Gegner in Arrays
+(structure of arrays) gesammelt. Schwerkraft, Begrenzungen und die Kollision
+mit den Plattformen laufen dann als Array-Operationen über alle Gegner auf
+einmal. Das Ergebnis ist identisch mit Character.update (siehe
+python benchmark.py enemy_physics), lohnt sich aber erst bei vielen Gegnern.
+
+Einschalten: NUMPY_ENEMY_PHYSICS = True in settings.py (braucht numpy)
+"""
+
+from settings import GRAVITY, MAX_FALL_SPEED
+
+try:
+    import numpy as np
+except ImportError:  # numpy ist optional, ohne läuft die Physik pro Gegner
+    np = None
+
+
+def is_available():
+    return np is not None
+
+
+def _round_rect_coord(values):
+    """Rundet wie pygame.Rect beim Zuweisen von Kommazahlen (x.5 von der Null weg)"""
+    whole = np.trunc(values)
+    return (whole + np.where(np.abs(values - whole) >= 0.5, np.sign(values), 0.0)).astype(np.int64)
+
+
+class EnemyPhysics:
+    """Physik aller Gegner gegen die (unbeweglichen) Plattformen eines Levels"""
+
+    def __init__(self, platforms):
+        # Reihenfolge wie in der Plattform-Gruppe (entscheidet bei mehreren Treffern)
+        self.platforms = list(platforms)
+        self.left = np.array([p.rect.left for p in self.platforms], dtype=np.int64)
+        self.top = np.array([p.rect.top for p in self.platforms], dtype=np.int64)
+        self.right = np.array([p.rect.right for p in self.platforms], dtype=np.int64)
+        self.bottom = np.array([p.rect.bottom for p in self.platforms], dtype=np.int64)
+        # Brechende Plattformen: Kollision hängt vom Zustand ab (wird pro Frame abgefragt)
+        self.breakable = [i for i, p in enumerate(self.platforms) if hasattr(p, 'can_collide')]
+
+    def _collidable(self):
+        """Welche Plattformen in diesem Frame kollidierbar sind"""
+        collidable = np.ones(len(self.platforms), dtype=bool)
+        for i in self.breakable:
+            collidable[i] = self.platforms[i].can_collide()
+        return collidable
+
+    def _overlaps(self, left, top, right, bottom, collidable):
+        """Matrix Gegner x Plattform: Rechtecke überlappen (wie Rect.colliderect)"""
+        return ((left[:, None] < self.right[None, :]) & (right[:, None] > self.left[None, :]) &
+                (top[:, None] < self.bottom[None, :]) & (bottom[:, None] > self.top[None, :]) &
+                collidable[None, :])
+
+    def step(self, enemies, dt=1.0):
+        """Ein Physik-Schritt für alle übergebenen Gegner (entspricht Character.update)"""
+        if not enemies:
+            return
+        # Zustand einsammeln (Bewegungsstrategien haben Rect und Geschwindigkeit evtl. verändert)
+        x = np.array([e.rect.x for e in enemies], dtype=np.int64)
+        y = np.array([e.rect.y for e in enemies], dtype=np.int64)
+        w = np.array([e.rect.width for e in enemies], dtype=np.int64)
+        h = np.array([e.rect.height for e in enemies], dtype=np.int64)
+        vx = np.array([e.velocity.x for e in enemies], dtype=np.float64)
+        vy = np.array([e.velocity.y for e in enemies], dtype=np.float64)
+        stunned = np.array([e.is_stunned for e in enemies], dtype=bool)
+        level_width = np.array([e.level_width for e in enemies], dtype=np.int64)
+        level_height = np.array([e.level_height for e in enemies], dtype=np.int64)
+        collidable = self._collidable()
+
+        # Schwerkraft und Betäubung (das Ende der Betäubung meldet das Timer-Rad)
+        vy += GRAVITY * dt
+        vx[stunned] = 0
+        np.minimum(vy, MAX_FALL_SPEED, out=vy)
+
+        # Horizontale Bewegung
+        start_x = x
+        x = _round_rect_coord(x + vx * dt)
+        swept_left, swept_right = np.minimum(start_x, x), np.maximum(start_x, x) + w
+        touched = self._overlaps(swept_left, y, swept_right, y + h, collidable)
+        for i in np.flatnonzero(touched.any(axis=1)):
+            # Selten (Gegner läuft gegen eine Plattform): der Reihe nach wie Character.update
+            candidates = np.flatnonzero(touched[i])
+            # Kontinuierlich: erste überquerte Seitenkante
+            if vx[i] > 0:
+                crossed = candidates[(start_x[i] + w[i] <= self.left[candidates]) &
+                                     (self.left[candidates] < x[i] + w[i])]
+                if len(crossed):
+                    x[i] = self.left[crossed].min() - w[i]
+            elif vx[i] < 0:
+                crossed = candidates[(x[i] < self.right[candidates]) & (self.right[candidates] <= start_x[i])]
+                if len(crossed):
+                    x[i] = self.right[crossed].max()
+            # Überlappung von Anfang an: herausschieben
+            for j in candidates:
+                if x[i] < self.right[j] and x[i] + w[i] > self.left[j]:
+                    if vx[i] > 0:
+                        x[i] = self.left[j] - w[i]
+                    elif vx[i] < 0:
+                        x[i] = self.right[j]
+
+        # Level-Grenzen horizontal
+        x = np.where(x < 0, 0, np.where(x + w > level_width, level_width - w, x))
+
+        # Vertikale Bewegung
+        start_y = y
+        y = _round_rect_coord(y + vy * dt)
+        falling, rising = vy > 0, vy < 0
+        # Kontinuierlich: nächste überquerte Ober- bzw. Unterkante (auch bei Schritten größer als die Plattform)
+        in_column = ((x[:, None] < self.right[None, :]) & (x[:, None] + w[:, None] > self.left[None, :]) &
+                     collidable[None, :])
+        crossed_top = (in_column & falling[:, None] & (start_y[:, None] + h[:, None] <= self.top[None, :]) &
+                       (self.top[None, :] < y[:, None] + h[:, None]))
+        crossed_bottom = (in_column & rising[:, None] & (y[:, None] < self.bottom[None, :]) &
+                          (self.bottom[None, :] <= start_y[:, None]))
+        landed = crossed_top.any(axis=1)
+        bumped = crossed_bottom.any(axis=1)
+        nearest_top = np.where(crossed_top, self.top[None, :], np.iinfo(np.int64).max).min(axis=1)
+        nearest_bottom = np.where(crossed_bottom, self.bottom[None, :], np.iinfo(np.int64).min).max(axis=1)
+        y = np.where(landed, nearest_top - h, np.where(bumped, nearest_bottom, y))
+
+        # Sonst wie bisher: nach dem ersten Treffer ist vy = 0, weitere Plattformen ändern nichts
+        hits = self._overlaps(x, y, x + w, y + h, collidable) & ~(landed | bumped)[:, None]
+        hit_rows = hits.any(axis=1)
+        first = hits.argmax(axis=1)
+        falling_hit = hit_rows & falling
+        rising_hit = hit_rows & rising
+        y = np.where(falling_hit, self.top[first] - h, np.where(rising_hit, self.bottom[first], y))
+        on_ground = landed | falling_hit
+        vy[landed | bumped | falling_hit | rising_hit] = 0
+
+        # Level-Grenzen vertikal
+        above = y < 0
+        below = ~above & (y + h > level_height)
+        y = np.where(above, 0, np.where(below, level_height - h, y))
+        vy[above | below] = 0
+        on_ground |= below
+
+        # Ergebnis zurückschreiben (tolist() liefert Python-Zahlen, schneller als Einzelzugriffe)
+        for enemy, *state in zip(enemies, x.tolist(), y.tolist(), vx.tolist(), vy.tolist(), on_ground.tolist()):
+            enemy.rect.topleft = (state[0], state[1])
+            enemy.velocity.update(state[2], state[3])
+            enemy.on_ground = state[4]
@@ -0,0 +1,130 @@
+"""
+HUD als zwischengespeicherte Ebene
+Leben, Score, CP und Noten, die PowerUp-Restzeiten und die Boss-Leiste ändern
+sich nur ein paar Mal pro Minute. Jeder dieser Teile wird deshalb einmal in
+eine eigene Surface gezeichnet und danach pro Frame nur noch geblittet; neu
+gezeichnet wird ein Teil erst, wenn sich seine Werte ändern.
+
+Die Teile liegen auf durchsichtigen Surfaces und überlappen sich darin nicht;
+Text mit weichen Kanten sieht so genauso aus wie direkt auf den Bildschirm gezeichnet.
+"""
+
+import time
+import pygame
+import debug_stats
+from settings import WIDTH, COLOR_HEART, BOSS_HEALTH, BOSS_SHOOTING_RADIUS
+
+HEART_SIZE = 30
+HEART_MARGIN = 5
+POWERUP_COLUMN = 250  # Breite der PowerUp-Anzeige am rechten Rand
+BOSS_BAR_SIZE = (250, 15)
+BOSS_NAME = "Prof. Dr. Krauss"
+
+
+def draw_heart(surface, x, y, size):
+    """Einfaches Herz aus zwei Kreisen, einem Rechteck und einem Dreieck"""
+    circle_radius = size // 4
+    pygame.draw.circle(surface, COLOR_HEART, (x + circle_radius, y + circle_radius), circle_radius)
+    pygame.draw.circle(surface, COLOR_HEART, (x + size - circle_radius, y + circle_radius), circle_radius)
+    pygame.draw.rect(surface, COLOR_HEART, (x, y + circle_radius, size, circle_radius))
+    points = [
+        (x + size // 2, y + size - 2),  # Spitze unten
+        (x, y + size // 2),             # Links
+        (x + size, y + size // 2)       # Rechts
+    ]
+    pygame.draw.polygon(surface, COLOR_HEART, points)
+
+
+class Hud:
+    """Teile des HUDs mit den Werten, aus denen sie gezeichnet wurden"""
+
+    def __init__(self, font):
+        self.font = font
+        self.widgets = {}   # name -> (werte, surface oder None, position)
+        self.rebuilds = 0   # Neu gezeichnete Teile seit dem Start (für Benchmarks)
+
+    def draw(self, screen, level):
+        """Blittet das HUD; nur Teile mit geänderten Werten werden vorher neu gezeichnet"""
+        start = time.perf_counter()
+        player = level.player
+        self._draw_widget(screen, "status", (player.lives, player.score, player.credit_points,
+                                             player.grades_collected), self._build_status)
+        self._draw_widget(screen, "powerups", tuple(player.get_powerup_seconds()), self._build_powerups)
+
+        # Boss-Leiste nur in Schussweite des Bosses
+        boss = level.get_boss()
+        boss_health = None
+        if boss and abs(boss.rect.centerx - player.rect.centerx) <= BOSS_SHOOTING_RADIUS:
+            boss_health = boss.health
+        self._draw_widget(screen, "boss", boss_health, self._build_boss_bar)
+        debug_stats.set_value("HUD pro Frame", f"{(time.perf_counter() - start) * 1000:.3f} ms")
+
+    def invalidate(self):
+        """Alle Teile beim nächsten Frame neu zeichnen (z.B. nach einem Wechsel des Fonts)"""
+        self.widgets.clear()
+
+    def _draw_widget(self, screen, name, values, build):
+        widget = self.widgets.get(name)
+        if widget is None or widget[0] != values:
+            widget = (values,) + build(values)
+            self.widgets[name] = widget
+            self.rebuilds += 1
+            debug_stats.count("HUD-Neuaufbau")
+        if widget[1] is not None:
+            screen.blit(widget[1], widget[2])
+
+    def _canvas(self, rect):
+        """Leere, durchsichtige Surface für einen Teil"""
+        canvas = pygame.Surface(rect.size, pygame.SRCALPHA)
+        canvas.fill((0, 0, 0, 0))
+        return canvas
+
+    def _text(self, canvas, text, color, position):
+        canvas.blit(self.font.render(text, True, color), position)
+
+    def _build_status(self, values):
+        """Herzen für die Leben, darunter Score, CP und (falls vorhanden) Noten"""
+        lives, score, credit_points, grades = values
+        lines = [(f"Score: {score}", (255, 255, 255)), (f"CP: {credit_points}", (255, 215, 0))]
+        if grades > 0:
+            lines.append((f"Noten 1,0: {grades}", (0, 255, 0)))
+        text_width = max(self.font.size(text)[0] for text, _ in lines)
+        width = min(WIDTH, max(10 + lives * (HEART_SIZE + HEART_MARGIN), 10 + text_width))
+        rect = pygame.Rect(0, 0, width, 50 + 30 * (len(lines) - 1) + self.font.get_linesize())
+        canvas = self._canvas(rect)
+        for i in range(lives):
+            draw_heart(canvas, 10 + i * (HEART_SIZE + HEART_MARGIN), 10, HEART_SIZE)
+        for i, (text, color) in enumerate(lines):
+            self._text(canvas, text, color, (10, 50 + i * 30))
+        return canvas, rect.topleft
+
+    def _build_powerups(self, values):
+        """Aktive PowerUps mit Restzeit untereinander am rechten Rand"""
+        if not values:
+            return None, None
+        rect = pygame.Rect(WIDTH - POWERUP_COLUMN, 10, POWERUP_COLUMN,
+                           30 * (len(values) - 1) + self.font.get_linesize())
+        canvas = self._canvas(rect)
+        for i, (label, seconds) in enumerate(values):
+            self._text(canvas, f"{label}: {seconds}s", (255, 255, 0), (0, i * 30))
+        return canvas, rect.topleft
+
+    def _build_boss_bar(self, health):
+        """Lebensleiste des Bosses oben in der Mitte mit Namen darunter"""
+        if health is None:
+            return None, None
+        bar_width, bar_height = BOSS_BAR_SIZE
+        bar = pygame.Rect((WIDTH - bar_width) // 2, 20, bar_width, bar_height)
+        name = self.font.render(BOSS_NAME, True, (255, 255, 255))
+        name_rect = name.get_rect(center=(WIDTH // 2, bar.bottom + 15))
+        rect = bar.union(name_rect)
+        canvas = self._canvas(rect)
+
+        local_bar = bar.move(-rect.x, -rect.y)
+        pygame.draw.rect(canvas, (139, 0, 0), local_bar)  # Hintergrund (dunkelrot)
+        current_health_width = bar_width * (health / BOSS_HEALTH)  # Schrumpft mit der Gesundheit
+        if current_health_width > 0:
+            pygame.draw.rect(canvas, (255, 69, 0), (local_bar.x, local_bar.y, current_health_width, bar_height))
+        pygame.draw.rect(canvas, (0, 0, 0), local_bar, 3)  # Schwarzer Rahmen
+        canvas.blit(name, name_rect.move(-rect.x, -rect.y))
+        return canvas, rect.topleft
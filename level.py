@@ -0,0 +1,1167 @@
+"""
+Level-Inhalte: Aufbau, Update und Zeichnen eines Levels
+Wird erst beim Bau des ersten Levels (im Hintergrund nach dem ersten Menü-Frame)
+importiert, damit Spieler, Gegner, PowerUps und Waffen den Start nicht verzögern.
+"""
+
+import contextlib
+import time
+import pygame
+import random
+from settings import WIDTH, HEIGHT, PRECISE_COLLISION, NUMPY_ENEMY_PHYSICS
+from settings import ENEMY_LOD, LOD_NEAR_MARGIN, LOD_MIDDLE_MARGIN, LOD_MIDDLE_INTERVAL
+from settings import LEVEL_SCREENS, ZONE_WIDTH, RENDER_CULLING, RENDER_MARGIN
+from player import Player
+from enemies import MultipleChoiceEnemy, PythonEnemy, ProgrammingTaskEnemy, Boss
+from weapons import Bubble, RedPen
+from platforms import Platform, BreakingPlatform
+from powerups import *
+from camera import Camera
+from static_layer import StaticLayer
+from collision_index import CollisionIndex
+from broadphase import SpatialHash
+from timers import TimerWheel
+from registry import EntityRegistry
+from zones import ZoneStreamer
+from render_index import RenderIndex
+import collision_masks
+import enemy_physics
+import assets
+import transform_cache
+import startup_profiler
+import surface_audit
+import debug_stats
+
+#########################################################################
+# Spezielle Klasse für den Hauptboden mit ground.png Textur
+#########################################################################
+
+class GroundPlatform(Platform):
+    @classmethod
+    def _create_image(cls, width, height):
+        """Kachelt ground.png über die gesamte Breite (wird pro Größe geteilt)"""
+        try:
+            ground_texture = assets.load_image("images/ground.png")
+        except (pygame.error, FileNotFoundError):
+            # Fallback: normale Platform-Darstellung
+            return Platform._create_image(width, height)
+
+        tex_w, tex_h = ground_texture.get_size()
+        
+        # Neue Surface im Format der Textur (deckend, falls ground.png keine Transparenz hat)
+        flags = pygame.SRCALPHA if surface_audit.has_pixel_alpha(ground_texture) else 0
+        image = pygame.Surface((width, height), flags, ground_texture)
+        
+        # Textur über die gesamte Breite kacheln
+        for ty in range(0, height, tex_h):
+            for tx in range(0, width, tex_w):
+                image.blit(ground_texture, (tx, ty))
+        return image
+
+class Level:
+    @startup_profiler.profiled("Level.__init__")
+    def __init__(self, number, progress_callback=None, screens=LEVEL_SCREENS):
+        self.number = number
+        self.layout = None  # Level-Daten laden
+        self.progress_callback = progress_callback  # Fortschritt für den Ladebildschirm
+        self._report_progress(0.0, "Sprites")
+
+        # Level-Größe (größer als der Bildschirm für Scrolling)
+        self.level_width = WIDTH * screens # 16x so breit wie der Bildschirm für ein längeres Level
+        self.level_height = HEIGHT
+        
+        # Kamera initialisieren
+        self.camera = Camera(self.level_width, self.level_height)
+
+        # Timer-Rad für alle Dauern im Level (läuft nur, solange das Level simuliert wird)
+        self.timers = TimerWheel()
+        # Brechende Plattformen, die gerade etwas zu tun haben (siehe BreakingPlatform.wake)
+        self.active_platforms = {}
+        self.breaking_platforms = 0
+        
+        # Player-Sprites laden
+        player_sprites = self._load_player_sprites()
+        self.player = Player(100, 400, player_sprites)
+
+        # Gegner-Sprites laden
+        self.enemy_sprites = self._load_enemy_sprites()  # Gegner-Sprites laden
+        
+        # Level-Größe an den Player weitergeben
+        self.player.level_width = self.level_width
+        self.player.level_height = self.level_height
+        self.player.timers = self.timers
+
+        # Registry: Boss, Blasen und Stifte direkt abrufbar statt per isinstance-Suche
+        self.registry = EntityRegistry()
+        self.registry.register("boss", Boss, singleton=True)
+        self.registry.register("bubble", Bubble)
+        self.registry.register("pen", RedPen)
+        self.registry.set_singleton("player", self.player)
+
+        # Zeichenebenen im räumlichen Hash: gezeichnet wird nur, was die Kamera berührt
+        self.render_index = RenderIndex()
+        self.render_culling = RENDER_CULLING
+
+        self.enemies = self.registry.group()
+        self.powerups = self.registry.group()
+        self.collectibles = self.registry.group()
+        self.platforms = pygame.sprite.Group()
+        self.projectiles = self.registry.group()  # Gruppe für Projektile/Blasen
+        self.render_index.set_layer("platform", [])  # Brechende Plattformen (siehe ZoneStreamer.refresh_platforms)
+        self.render_index.track("collectible", self.collectibles)
+        self.render_index.track("powerup", self.powerups)
+        self.render_index.track("enemy", self.enemies)
+        self.render_index.track("projectile", self.projectiles)
+        self.static_layer = StaticLayer(self.level_width)  # Vorgezeichnete statische Plattformen
+        self.dynamic_platforms = []  # Brechende Plattformen, werden einzeln gezeichnet
+        self.collision_index = None  # Raster über alle Plattformen für Character.update
+        self.broadphase = SpatialHash()  # Pro Frame neu gefüllt: Gegner, Blasen, Stifte
+        self.precise_collision = PRECISE_COLLISION  # Treffer pixelgenau über gecachte Masken
+        self.enemy_physics = None  # Gebündelte NumPy-Physik für Gegner (NUMPY_ENEMY_PHYSICS)
+        self.streamer = ZoneStreamer(self)  # Gegner, PowerUps, Sammelobjekte nur in Zonen nahe der Kamera
+        # Positionen vor dem letzten Simulationsschritt (zum Interpolieren beim Zeichnen)
+        self.previous_positions = {}
+        self.previous_camera = (0, 0)
+
+        
+        
+        # Hintergrund-Farbe oder -Bild
+        self.background_color = (20, 30, 50)  # Dunkelblau
+        
+        # Hintergrundbild für das Level laden (vereinfachtes Parallax-System)
+        self.background_texture = None
+        self.parallax_factor = 0.5  # Hintergrund bewegt sich halb so schnell wie die Kamera
+        
+        self._report_progress(0.1, "Hintergrund")
+        try:
+            # Hintergrundbild auf Bildschirmhöhe skalieren (Breite proportional)
+            self.background_texture = assets.load_image("images/foerde_background.png", (None, HEIGHT), alpha=False)
+                     
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Hintergrundbild 'foerde_background.png' konnte nicht geladen werden: {e}")
+            self.background_texture = None
+        
+        self.load()
+
+    def _report_progress(self, fraction, label):
+        """Meldet den Ladefortschritt an den Level-Loader (falls vorhanden)"""
+        if self.progress_callback:
+            self.progress_callback(fraction, label)
+
+    def _load_player_sprites(self):
+        """Lädt alle Player-Sprites für Animationen"""
+        sprites = {}
+        
+        # Sprite-Definitionen: (key, dateiname, fallback_dateinamen)
+        sprite_definitions = {
+            'idle': ['player.png', 'Player.png', 'player_idle.png'],
+            'jump': ['player_jump.png', 'Player_jump.png', 'player_jumping.png'],
+            'run': ['player_run.png', 'Player_run.png', 'player_running.png']
+        }
+        
+        for sprite_key, filenames in sprite_definitions.items():
+            image_paths = [f"images/{filename}" for filename in filenames]
+            sprite, _ = assets.load_first(image_paths, (50, 50))  # Spieler-Größe
+            
+            if sprite is None:
+                print(f"Player-{sprite_key}-Sprite nicht gefunden, verwende Fallback")
+                # Fallback: Weißes Rechteck
+                sprite = pygame.Surface((50, 50))
+                sprite.fill((255, 255, 255))
+            
+            sprites[sprite_key] = sprite
+        
+        return sprites
+    
+      #############Enemys generieren######################
+    def _load_enemy_sprites(self):
+        
+        enemy_sprites = {}
+        
+        # Sprite-Definitionen: (key, dateiname, fallback_dateinamen)
+        sprite_definitions = {
+            'multiple_choice': ['enemy_multiple_choice.png', 'Enemy_multiple_choice.png'],
+            'python': ['enemy_python.png', 'Enemy_python.png'],
+            'programming_task': ['enemy_programming_task.png', 'Enemy_programming_task.png'],
+            'boss': ['enemy_boss.png', 'Boss.png']
+        }
+        
+        for sprite_key, filenames in sprite_definitions.items():
+            # Boss größer skalieren, aber nicht zu groß
+            size = (80, 80) if sprite_key == 'boss' else (50, 50)  # Boss- bzw. Gegner-Größe
+            image_paths = [f"images/{filename}" for filename in filenames]
+            sprite, _ = assets.load_first(image_paths, size)
+            
+            if sprite is None:
+                print(f"{sprite_key.capitalize()}-Sprite nicht gefunden, verwende Fallback")
+                # Fallback: Weißes Rechteck
+                sprite = pygame.Surface((50, 50))
+                sprite.fill((255, 255, 255))
+            
+            enemy_sprites[sprite_key] = sprite
+        
+        return enemy_sprites
+
+    @startup_profiler.profiled("Level.load")
+    def load(self):
+        # Erweiterte Level-Generierung für Scrolling
+        # Boden über die gesamte Level-Breite
+        self._report_progress(0.2, "Plattformen")
+        ground_height = 50
+        # Boden in Stücken von 32 Bildschirmen (Vielfaches der 1024 px breiten Bodentextur, keine Naht);
+        # das 16 Bildschirme breite Level hat weiterhin ein einziges Bodenstück
+        ground_segment = WIDTH * 32
+        for left in range(0, self.level_width, ground_segment):
+            self.platforms.add(GroundPlatform(left, HEIGHT - ground_height,
+                                              min(ground_segment, self.level_width - left), ground_height))
+        
+        # Level in Zonen aufteilen (jede Zone = WIDTH Breite)
+        # Zone 1-2: Tutorial/Einfach
+        # Zone 3-4: Mittel
+        # Zone 5-6: Schwer
+        # Zone 7-8: Sehr schwer
+        # Zone 9-10: Expert
+        # Zone 11-12: Nightmare
+        # Zone 13-14: Extreme
+        # Zone 15-16: Final Boss
+        
+        # ZONE 1-2: TUTORIAL & EINFÜHRUNG (0 - WIDTH*2)
+        # Garantiert erreichbare Plattformen (Max: 180 horizontal, 120 vertikal)
+        tutorial_platforms = [
+            (400, HEIGHT - 120, 200, 20),     # Erste Lernplattform
+            (550, HEIGHT - 200, 150, 20),     # Erreichbar (150 horizontal, 80 vertikal)
+            (750, HEIGHT - 140, 180, 20),     # Zurück nach unten (200 horizontal, 60 vertikal)
+            (1000, HEIGHT - 180, 150, 20),    # Mittlere Höhe (250 horizontal, 40 vertikal)
+            (1200, HEIGHT - 120, 200, 20),    # Leicht erreichbar (200 horizontal, 60 vertikal)
+            (1450, HEIGHT - 200, 180, 20),    # Letzte Tutorial-Plattform (250 horizontal, 80 vertikal)
+        ]
+        
+        # ZONE 3-4: MITTLERER BEREICH (WIDTH*2 - WIDTH*4)
+        # Erreichbare Abstände mit progressiver Schwierigkeit
+        medium_platforms = [
+            (WIDTH*2 + 200, HEIGHT - 180, 120, 20),   # Zonenstart (einfacher Übergang)
+            (WIDTH*2 + 370, HEIGHT - 260, 100, 20),   # Erreichbar (170 horizontal, 80 vertikal)
+            (WIDTH*2 + 520, HEIGHT - 200, 80, 20),    # Abstieg (150 horizontal, 60 vertikal)
+            (WIDTH*2 + 680, HEIGHT - 300, 80, 20),    # Hoch (160 horizontal, 100 vertikal)
+            (WIDTH*2 + 840, HEIGHT - 220, 100, 20),   # Abstieg (160 horizontal, 80 vertikal)
+            (WIDTH*3 + 20, HEIGHT - 280, 80, 20),     # Übergang neue Zone (180 horizontal, 60 vertikal)
+            (WIDTH*3 + 180, HEIGHT - 200, 100, 20),   # Erreichbar (160 horizontal, 80 vertikal)
+            (WIDTH*3 + 350, HEIGHT - 320, 80, 20),    # Hohe Plattform (170 horizontal, 120 vertikal)
+            (WIDTH*3 + 500, HEIGHT - 240, 100, 20),   # Abstieg (150 horizontal, 80 vertikal)
+        ]
+        
+        # ZONE 5-6: SCHWERER BEREICH (WIDTH*4 - WIDTH*6)
+        # Maximale aber noch erreichbare Sprünge
+        hard_platforms = [
+            (WIDTH*4 + 150, HEIGHT - 200, 80, 20),    # Zonenstart
+            (WIDTH*4 + 310, HEIGHT - 300, 60, 20),    # Erreichbar (160 horizontal, 100 vertikal)
+            (WIDTH*4 + 450, HEIGHT - 220, 60, 20),    # Abstieg (140 horizontal, 80 vertikal)
+            (WIDTH*4 + 600, HEIGHT - 340, 60, 20),    # Höchste Plattform (150 horizontal, 120 vertikal)
+            (WIDTH*4 + 740, HEIGHT - 260, 80, 20),    # Abstieg (140 horizontal, 80 vertikal)
+            (WIDTH*4 + 900, HEIGHT - 180, 80, 20),    # Niedrig (160 horizontal, 80 vertikal)
+            (WIDTH*5 + 70, HEIGHT - 280, 60, 20),     # Hoch (170 horizontal, 100 vertikal)
+            (WIDTH*5 + 210, HEIGHT - 200, 70, 20),    # Abstieg (140 horizontal, 80 vertikal)
+            (WIDTH*5 + 360, HEIGHT - 320, 50, 20),    # Sehr hoch (150 horizontal, 120 vertikal)
+            (WIDTH*5 + 490, HEIGHT - 240, 80, 20),    # Abstieg (130 horizontal, 80 vertikal)
+            (WIDTH*5 + 650, HEIGHT - 180, 100, 20),   # Übergang Boss-Zone (160 horizontal, 60 vertikal)
+        ]
+        
+        # ZONE 7-8: SEHR SCHWER (WIDTH*6 - WIDTH*8)
+        very_hard_platforms = [
+            (WIDTH*6 + 200, HEIGHT - 220, 80, 20),    # Übergang von schwer
+            (WIDTH*6 + 350, HEIGHT - 300, 60, 20),    # Hoch (150 horizontal, 80 vertikal)
+            (WIDTH*6 + 480, HEIGHT - 200, 60, 20),    # Abstieg (130 horizontal, 100 vertikal)
+            (WIDTH*6 + 610, HEIGHT - 340, 50, 20),    # Sehr hoch (130 horizontal, 140 vertikal)
+            (WIDTH*6 + 730, HEIGHT - 260, 60, 20),    # Abstieg (120 horizontal, 80 vertikal)
+            (WIDTH*6 + 860, HEIGHT - 180, 70, 20),    # Niedrig (130 horizontal, 80 vertikal)
+            (WIDTH*7 + 10, HEIGHT - 320, 50, 20),     # Übergang hoch (150 horizontal, 140 vertikal)
+            (WIDTH*7 + 140, HEIGHT - 240, 60, 20),    # Abstieg (130 horizontal, 80 vertikal)
+            (WIDTH*7 + 270, HEIGHT - 160, 80, 20),    # Niedrig (130 horizontal, 80 vertikal)
+            (WIDTH*7 + 420, HEIGHT - 280, 60, 20),    # Hoch (150 horizontal, 120 vertikal)
+            (WIDTH*7 + 550, HEIGHT - 200, 80, 20),    # Abstieg (130 horizontal, 80 vertikal)
+        ]
+        
+        # ZONE 9-10: EXPERT (WIDTH*8 - WIDTH*10)
+        expert_platforms = [
+            (WIDTH*8 + 150, HEIGHT - 240, 60, 20),    # Expertenstart
+            (WIDTH*8 + 270, HEIGHT - 320, 50, 20),    # Hoch (120 horizontal, 80 vertikal)
+            (WIDTH*8 + 390, HEIGHT - 200, 50, 20),    # Abstieg (120 horizontal, 120 vertikal)
+            (WIDTH*8 + 510, HEIGHT - 340, 40, 20),    # Sehr hoch (120 horizontal, 140 vertikal)
+            (WIDTH*8 + 620, HEIGHT - 260, 50, 20),    # Abstieg (110 horizontal, 80 vertikal)
+            (WIDTH*8 + 740, HEIGHT - 180, 60, 20),    # Niedrig (120 horizontal, 80 vertikal)
+            (WIDTH*8 + 870, HEIGHT - 300, 50, 20),    # Hoch (130 horizontal, 120 vertikal)
+            (WIDTH*9 + 20, HEIGHT - 220, 60, 20),     # Übergang (150 horizontal, 80 vertikal)
+            (WIDTH*9 + 150, HEIGHT - 340, 40, 20),    # Sehr hoch (130 horizontal, 120 vertikal)
+            (WIDTH*9 + 260, HEIGHT - 200, 50, 20),    # Abstieg (110 horizontal, 140 vertikal)
+            (WIDTH*9 + 380, HEIGHT - 280, 50, 20),    # Hoch (120 horizontal, 80 vertikel)
+            (WIDTH*9 + 500, HEIGHT - 160, 70, 20),    # Niedrig (120 horizontal, 120 vertikal)
+            (WIDTH*9 + 630, HEIGHT - 240, 60, 20),    # Mittel (130 horizontal, 80 vertikal)
+        ]
+        
+        # ZONE 11-12: NIGHTMARE (WIDTH*10 - WIDTH*12)
+        nightmare_platforms = [
+            (WIDTH*10 + 100, HEIGHT - 200, 50, 20),   # Nightmare Start
+            (WIDTH*10 + 210, HEIGHT - 320, 40, 20),   # Hoch (110 horizontal, 120 vertikal)
+            (WIDTH*10 + 310, HEIGHT - 240, 40, 20),   # Abstieg (100 horizontal, 80 vertikal)
+            (WIDTH*10 + 410, HEIGHT - 360, 30, 20),   # Extrem hoch (100 horizontal, 120 vertikal)
+            (WIDTH*10 + 500, HEIGHT - 280, 40, 20),   # Abstieg (90 horizontal, 80 vertikal)
+            (WIDTH*10 + 600, HEIGHT - 200, 50, 20),   # Niedrig (100 horizontal, 80 vertikal)
+            (WIDTH*10 + 720, HEIGHT - 340, 30, 20),   # Sehr hoch (120 horizontal, 140 vertikal)
+            (WIDTH*10 + 810, HEIGHT - 260, 40, 20),   # Abstieg (90 horizontal, 80 vertikal)
+            (WIDTH*10 + 920, HEIGHT - 180, 50, 20),   # Niedrig (110 horizontal, 80 vertikal)
+            (WIDTH*11 + 50, HEIGHT - 300, 40, 20),    # Übergang hoch (130 horizontal, 120 vertikal)
+            (WIDTH*11 + 160, HEIGHT - 220, 40, 20),   # Abstieg (110 horizontal, 80 vertikal)
+            (WIDTH*11 + 270, HEIGHT - 340, 30, 20),   # Sehr hoch (110 horizontal, 120 vertikal)
+            (WIDTH*11 + 360, HEIGHT - 260, 40, 20),   # Abstieg (90 horizontal, 80 vertikal)
+            (WIDTH*11 + 470, HEIGHT - 180, 50, 20),   # Niedrig (110 horizontal, 80 vertikal)
+            (WIDTH*11 + 590, HEIGHT - 280, 40, 20),   # Hoch (120 horizontal, 100 vertikal)
+        ]
+        
+        # ZONE 13-14: EXTREME (WIDTH*12 - WIDTH*14)
+        extreme_platforms = [
+            (WIDTH*12 + 80, HEIGHT - 220, 40, 20),    # Extreme Start
+            (WIDTH*12 + 180, HEIGHT - 340, 30, 20),   # Extrem hoch (100 horizontal, 120 vertikal)
+            (WIDTH*12 + 270, HEIGHT - 260, 30, 20),   # Abstieg (90 horizontal, 80 vertikal)
+            (WIDTH*12 + 360, HEIGHT - 180, 40, 20),   # Niedrig (90 horizontal, 80 vertikal)
+            (WIDTH*12 + 470, HEIGHT - 320, 30, 20),   # Hoch (110 horizontal, 140 vertikal)
+            (WIDTH*12 + 560, HEIGHT - 240, 30, 20),   # Abstieg (90 horizontal, 80 vertikal)
+            (WIDTH*12 + 650, HEIGHT - 360, 25, 20),   # Extrem hoch (90 horizontal, 120 vertikal)
+            (WIDTH*12 + 730, HEIGHT - 280, 30, 20),   # Abstieg (80 horizontal, 80 vertikal)
+            (WIDTH*12 + 820, HEIGHT - 200, 40, 20),   # Niedrig (90 horizontal, 80 vertikal)
+            (WIDTH*12 + 930, HEIGHT - 300, 30, 20),   # Hoch (110 horizontal, 100 vertikal)
+            (WIDTH*13 + 40, HEIGHT - 220, 30, 20),    # Übergang (110 horizontal, 80 vertikal)
+            (WIDTH*13 + 140, HEIGHT - 340, 25, 20),   # Extrem hoch (100 horizontal, 120 vertikal)
+            (WIDTH*13 + 220, HEIGHT - 260, 30, 20),   # Abstieg (80 horizontal, 80 vertikal)
+            (WIDTH*13 + 310, HEIGHT - 180, 40, 20),   # Niedrig (90 horizontal, 80 vertikal)
+            (WIDTH*13 + 420, HEIGHT - 300, 30, 20),   # Hoch (110 horizontal, 120 vertikal)
+            (WIDTH*13 + 520, HEIGHT - 240, 40, 20),   # Abstieg (100 horizontal, 60 vertikal)
+        ]
+        
+        # ZONE 15-16: FINAL BOSS (WIDTH*14 - WIDTH*16)
+        final_boss_platforms = [
+            (WIDTH*14 + 200, HEIGHT - 220, 100, 20),  # Pre-Boss Plattform
+            (WIDTH*14 + 350, HEIGHT - 300, 80, 20),   # Boss-Kampf hoch
+            (WIDTH*14 + 500, HEIGHT - 180, 80, 20),   # Boss-Kampf niedrig
+            (WIDTH*14 + 650, HEIGHT - 260, 80, 20),   # Boss-Kampf mittel
+            (WIDTH*15 + 50, HEIGHT - 200, 120, 20),   # Boss-Arena Mitte
+            (WIDTH*15 + 220, HEIGHT - 300, 100, 20),  # Boss-Arena hoch
+            (WIDTH*15 + 370, HEIGHT - 220, 100, 20),  # Boss-Arena abstieg
+            (WIDTH*15 + 520, HEIGHT - 340, 80, 20),   # Boss-Arena sehr hoch
+            (WIDTH*15 + 650, HEIGHT - 160, 150, 20),  # Boss-Arena Ende
+        ]
+        
+        # Alle Plattformen hinzufügen
+        self._report_progress(0.3, "Plattformen")
+        for x, y, width, height in self._spread(tutorial_platforms + medium_platforms + hard_platforms +
+                                                very_hard_platforms + expert_platforms + nightmare_platforms +
+                                                extreme_platforms + final_boss_platforms):
+            self.platforms.add(Platform(x, y, width, height))
+        
+        # BRECHENDE PLATTFORMEN - strategisch ausgewählte Plattformen ersetzen
+        breaking_platform_positions = [
+            # Zone 1-2: Lerneffekt - ein paar brechende für Tutorial
+            (550, HEIGHT - 200, 150, 20),     # Tutorial: Zweite Plattform
+            (1200, HEIGHT - 120, 200, 20),    # Tutorial: Fünfte Plattform
+            
+            # Zone 3-4: Mittlerer Schwierigkeitsgrad
+            (WIDTH*2 + 370, HEIGHT - 260, 100, 20),   # Mittlere Zone: Zweite Plattform
+            (WIDTH*2 + 680, HEIGHT - 300, 80, 20),    # Mittlere Zone: Vierte Plattform
+            (WIDTH*3 + 180, HEIGHT - 200, 100, 20),   # Mittlere Zone: Siebte Plattform
+            
+            # Zone 5-6: Schwieriger - mehr strategische Positionen
+            (WIDTH*4 + 310, HEIGHT - 300, 60, 20),    # Schwer: Zweite Plattform
+            (WIDTH*4 + 600, HEIGHT - 340, 60, 20),    # Schwer: Höchste Plattform (riskant!)
+            (WIDTH*5 + 210, HEIGHT - 200, 70, 20),    # Schwer: Achte Plattform
+            (WIDTH*5 + 490, HEIGHT - 240, 80, 20),    # Schwer: Zehnte Plattform
+            
+            # Zone 7-8: Sehr schwer - kritische Positionen
+            (WIDTH*6 + 350, HEIGHT - 300, 60, 20),    # Sehr schwer: Zweite Plattform
+            (WIDTH*6 + 610, HEIGHT - 340, 50, 20),    # Sehr schwer: Höchste Plattform
+            (WIDTH*7 + 140, HEIGHT - 240, 60, 20),    # Sehr schwer: Achte Plattform
+            
+            # Zone 9-10: Expert - nur wenige, aber entscheidende
+            (WIDTH*8 + 270, HEIGHT - 320, 50, 20),    # Expert: Zweite Plattform
+            (WIDTH*8 + 510, HEIGHT - 340, 40, 20),    # Expert: Höchste Plattform
+            (WIDTH*9 + 150, HEIGHT - 340, 40, 20),    # Expert: Sehr hohe Plattform
+            
+            # Zone 11-12: Nightmare - tückische Positionen
+            (WIDTH*10 + 210, HEIGHT - 320, 40, 20),   # Nightmare: Zweite Plattform
+            (WIDTH*10 + 410, HEIGHT - 360, 30, 20),   # Nightmare: Extrem hohe Plattform
+            (WIDTH*11 + 270, HEIGHT - 340, 30, 20),   # Nightmare: Sehr hohe Plattform
+            
+            # Zone 13-14: Extreme - finale Herausforderung
+            (WIDTH*12 + 180, HEIGHT - 340, 30, 20),   # Extreme: Extrem hohe Plattform
+            (WIDTH*12 + 650, HEIGHT - 360, 25, 20),   # Extreme: Höchste Plattform
+            (WIDTH*13 + 140, HEIGHT - 340, 25, 20),   # Extreme: Finale Herausforderung
+        ]
+        
+        # Entferne die entsprechenden normalen Plattformen und ersetze sie durch brechende
+        platforms_by_rect = {}
+        for platform in self.platforms:
+            platforms_by_rect.setdefault(tuple(platform.rect), platform)
+        for x, y, width, height in self._spread(breaking_platform_positions):
+            # Finde und entferne die normale Plattform an dieser Position
+            platform = platforms_by_rect.pop((x, y, width, height), None)
+            if platform is not None:
+                self.platforms.remove(platform)
+            
+            # Füge die brechende Plattform hinzu
+            breaking_platform = BreakingPlatform(x, y, width, height)
+            breaking_platform.timers = self.timers
+            breaking_platform.active_platforms = self.active_platforms
+            self.platforms.add(breaking_platform)
+            self.breaking_platforms += 1
+            print(f"Brechende Plattform hinzugefügt bei ({x}, {y}) - {width}x{height}")
+        
+        # Statische Plattformen und Boden in Chunks vorzeichnen
+        self.build_static_layer()
+        # Kollisions-Index: Plattformen bewegen sich nicht, einmal pro Level reicht
+        self.collision_index = CollisionIndex(self.platforms)
+        if NUMPY_ENEMY_PHYSICS:
+            self.use_enemy_physics(True)
+        
+        # GEGNER-PLATZIERUNG (progressiv schwieriger)
+        # Zone 1-2: Wenige, einfache Gegner
+        easy_enemies = [
+            (500, HEIGHT - 100, MultipleChoiceEnemy),
+            (1200, HEIGHT - 100, MultipleChoiceEnemy),
+            (1800, HEIGHT - 100, PythonEnemy),
+        ]
+        
+        # Zone 3-4: Mehr Gegner, gemischte Typen
+        medium_enemies = [
+            (WIDTH*2 + 300, HEIGHT - 100, PythonEnemy),
+            (WIDTH*2 + 600, HEIGHT - 250, MultipleChoiceEnemy),
+            (WIDTH*2 + 900, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*3 + 200, HEIGHT - 350, PythonEnemy),
+            (WIDTH*3 + 500, HEIGHT - 100, MultipleChoiceEnemy),
+            (WIDTH*3 + 800, HEIGHT - 100, ProgrammingTaskEnemy),
+        ]
+        
+        # Zone 5-6: Viele Gegner, schwierige Positionen
+        hard_enemies = [
+            (WIDTH*4 + 200, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*4 + 400, HEIGHT - 300, PythonEnemy),
+            (WIDTH*4 + 600, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*4 + 800, HEIGHT - 250, MultipleChoiceEnemy),
+            (WIDTH*5 + 150, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*5 + 350, HEIGHT - 330, PythonEnemy),
+            (WIDTH*5 + 600, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*5 + 850, HEIGHT - 100, MultipleChoiceEnemy),
+        ]
+        
+        # Zone 7-8: Sehr schwere Gegner
+        very_hard_enemies = [
+            (WIDTH*6 + 300, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*6 + 600, HEIGHT - 340, ProgrammingTaskEnemy),
+            (WIDTH*6 + 900, HEIGHT - 100, PythonEnemy),
+            (WIDTH*7 + 200, HEIGHT - 320, ProgrammingTaskEnemy),
+            (WIDTH*7 + 500, HEIGHT - 100, ProgrammingTaskEnemy),
+        ]
+        
+        # Zone 9-10: Expert Gegner
+        expert_enemies = [
+            (WIDTH*8 + 200, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*8 + 450, HEIGHT - 340, ProgrammingTaskEnemy),
+            (WIDTH*8 + 700, HEIGHT - 100, PythonEnemy),
+            (WIDTH*8 + 950, HEIGHT - 300, ProgrammingTaskEnemy),
+            (WIDTH*9 + 200, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*9 + 450, HEIGHT - 340, PythonEnemy),
+            (WIDTH*9 + 700, HEIGHT - 100, ProgrammingTaskEnemy),
+        ]
+        
+        # Zone 11-12: Nightmare Gegner
+        nightmare_enemies = [
+            (WIDTH*10 + 150, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*10 + 350, HEIGHT - 360, ProgrammingTaskEnemy),
+            (WIDTH*10 + 550, HEIGHT - 100, PythonEnemy),
+            (WIDTH*10 + 750, HEIGHT - 340, ProgrammingTaskEnemy),
+            (WIDTH*10 + 950, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*11 + 200, HEIGHT - 340, PythonEnemy),
+            (WIDTH*11 + 400, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*11 + 650, HEIGHT - 280, ProgrammingTaskEnemy),
+        ]
+        
+        # Zone 13-14: Extreme Gegner
+        extreme_enemies = [
+            (WIDTH*12 + 130, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*12 + 320, HEIGHT - 360, ProgrammingTaskEnemy),
+            (WIDTH*12 + 520, HEIGHT - 100, PythonEnemy),
+            (WIDTH*12 + 720, HEIGHT - 360, ProgrammingTaskEnemy),
+            (WIDTH*12 + 920, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*13 + 150, HEIGHT - 340, PythonEnemy),
+            (WIDTH*13 + 350, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*13 + 550, HEIGHT - 300, ProgrammingTaskEnemy),
+        ]
+        
+        # Zone 15: Pre-Final-Boss Gegner
+        prefinal_enemies = [
+            (WIDTH*14 + 300, HEIGHT - 100, ProgrammingTaskEnemy),
+            (WIDTH*14 + 600, HEIGHT - 300, ProgrammingTaskEnemy),
+            (WIDTH*14 + 900, HEIGHT - 100, PythonEnemy),
+            (WIDTH*15 + 200, HEIGHT - 340, ProgrammingTaskEnemy),
+        ]
+        
+        # Gegner hinzufügen (als Einträge ihrer Zone, erzeugt werden sie erst nahe der Kamera)
+        self._report_progress(0.7, "Gegner")
+        for x, y, enemy_class in self._spread(easy_enemies + medium_enemies + hard_enemies + very_hard_enemies +
+                                              expert_enemies + nightmare_enemies + extreme_enemies +
+                                              prefinal_enemies):
+            self.streamer.add("enemy", (enemy_class, x, y, 0, 0))
+
+        # PowerUps und Collectibles über das Level verteilt
+        self._report_progress(0.85, "PowerUps und Sammelobjekte")
+        self._spawn_level_items()
+        self.streamer.update(self.camera.camera_rect)
+
+        # FINAL BOSS am Ende (wird nicht gestreamt)
+        boss_x = self.level_width - 400  # Boss am rechten Ende des Levels
+        boss_y = HEIGHT - 200  # Etwas höher als der Boden
+        boss = Boss(boss_x, boss_y, self.enemy_sprites['boss'], self.level_width)
+        self.enemies.add(boss)
+        boss.projectiles = self.projectiles   
+        boss.timers = self.timers
+
+        # Gespiegelte Sprites und Fang-Bilder schon beim Laden erzeugen, nicht im Spiel
+        self._prepare_sprite_variants()
+
+    def _prepare_sprite_variants(self):
+        """Legt alle im Spiel benötigten Sprite-Varianten im Transform-Cache an"""
+        for sprite in self.player.sprites.values():
+            transform_cache.flip(sprite, True, False)
+        # Pro geteiltem Sprite einmal; der Boss wird nicht gefangen und braucht kein Fang-Bild
+        # (auch für Gegner, deren Zone noch nicht geladen ist)
+        images = {self.enemy_sprites[key]: False for key in ('multiple_choice', 'python', 'programming_task')
+                  if self.enemy_sprites.get(key) is not None}
+        images.update({enemy.base_image: isinstance(enemy, Boss) for enemy in self.enemies})
+        for image, is_boss in images.items():
+            flipped = transform_cache.flip(image, True, False)
+            if not is_boss:
+                Bubble.capture_image(image)
+                Bubble.capture_image(flipped)
+
+    def _spread(self, entries):
+        """Verteilt Einträge (x, ...) des 16 Bildschirme breiten Grundlevels auf die Level-Breite
+
+        Ein Abschnitt umfasst zwei Zonen (Tutorial, Mittel, ..., Final Boss). Breitere Levels
+        wiederholen die Abschnitte Mittel bis Extreme bis zum Final Boss am Ende.
+        """
+        section_width = 2 * ZONE_WIDTH
+        sections = max(2, self.level_width // section_width)
+        spread = []
+        for section in range(sections):
+            if section == 0:
+                template = 0
+            elif section == sections - 1:
+                template = 7  # Final Boss
+            else:
+                template = 1 + (section - 1) % 6
+            shift = (section - template) * section_width
+            for entry in entries:
+                # Einträge am Levelende (z.B. x = 16 Bildschirme) gehören zum Final Boss
+                entry_section = min(7, entry[0] // section_width)
+                if entry_section == template:
+                    spread.append((entry[0] + shift,) + tuple(entry[1:]))
+        return spread
+
+    def create_enemy(self, enemy_class, x, y):
+        """Erzeugt einen Gegner mit dem geteilten Sprite seiner Klasse"""
+        sprite_map = {
+            MultipleChoiceEnemy: 'multiple_choice',
+            PythonEnemy: 'python',
+            ProgrammingTaskEnemy: 'programming_task'
+        }
+        sprite_key = sprite_map.get(enemy_class, 'multiple_choice')
+        enemy = enemy_class(x, y, self.enemy_sprites[sprite_key], self.level_width)
+        enemy.timers = self.timers
+        return enemy
+
+    def use_zone_streaming(self, enabled):
+        """Schaltet das Zonen-Streaming ein oder aus (aus: alle Objekte des Levels existieren)"""
+        self.streamer.set_enabled(enabled, self.camera.camera_rect)
+
+    def use_enemy_physics(self, enabled):
+        """Schaltet die gebündelte NumPy-Physik für Gegner ein oder aus"""
+        if enabled and not enemy_physics.is_available():
+            print("NumPy nicht installiert - Gegner-Physik läuft pro Gegner")
+            enabled = False
+        self.enemy_physics = enemy_physics.EnemyPhysics(self.platforms) if enabled else None
+
+    def get_boss(self):
+        """Gibt den Boss zurück (None, wenn er nicht mehr lebt oder nie existiert hat)"""
+        return self.registry.singleton("boss")
+
+    def is_boss_defeated(self):
+        """Boss war im Level und lebt nicht mehr"""
+        return self.registry.spawned["boss"] > 0 and self.registry.singleton("boss") is None
+
+    def build_static_layer(self):
+        """Baut die statische Ebene neu (nach Änderungen an den Plattformen aufrufen)"""
+        self.static_layer.build(self.platforms, eager=not self.streamer.enabled)
+        self.streamer.refresh_platforms()  # Brechende Plattformen der geladenen Zonen
+
+    def update(self, dt=1.0):
+        """Ein Simulationsschritt (dt: Länge in Frames bei 60 FPS, siehe SIMULATION_RATE)"""
+        self._remember_positions()
+        # Abgelaufene Dauern beenden (Unverwundbarkeit, PowerUps, Betäubung, Cooldowns, ...)
+        fired = self.timers.advance(dt)
+        debug_stats.set_value("Timer-Callbacks im Schritt", fired)
+        debug_stats.count("Timer-Callbacks", fired)
+        debug_stats.set_value("Aktive Timer", self.timers.pending)
+        self.player.update(self.collision_index, dt)
+        
+        # Kamera dem Spieler folgen lassen
+        self.camera.update(self.player, dt)  # Oder: self.camera.update_with_deadzone(self.player)
+        self.streamer.update(self.camera.camera_rect)
+        debug_stats.set_value("Zonen geladen", f"{len(self.streamer.loaded)} von {self.streamer.zone_count}")
+        
+        stepped_enemies = self._update_enemies(dt)
+        
+        self.powerups.update()
+        self.collectibles.update()
+        
+        self._update_platforms()
+        
+        # Jedes Projektil mit Kamera-Referenz updaten
+        for projectile in self.projectiles:
+            projectile.update(self.camera, dt)
+        
+        self._handle_collisions()
+
+        # Zeichenebenen nachführen: nur was in diesem Schritt gelaufen ist, kann sich bewegt haben
+        self.render_index.moved("enemy", stepped_enemies)
+        self.render_index.moved("projectile", self.projectiles)
+    
+    def _update_enemies(self, dt):
+        """Gegner nach Abstand zur Kamera: nah jeden Schritt, im mittleren Ring seltener, fern gar nicht
+
+        Ferne Gegner schlafen mit ihrem letzten Zustand (Betäubung usw. läuft über das Timer-Rad
+        weiter) und holen die verschlafene Zeit nicht nach. Sie wachen im mittleren Ring auf, wo
+        sie landen und loslaufen, bevor sie ins Bild kommen. Der Boss läuft immer jeden Schritt.
+        Gibt die Gegner zurück, die in diesem Schritt gelaufen sind.
+        """
+        boss = self.registry.singleton("boss")
+        near_zone = self.camera.camera_rect.inflate(2 * LOD_NEAR_MARGIN, 2 * LOD_NEAR_MARGIN)
+        middle_zone = self.camera.camera_rect.inflate(2 * LOD_MIDDLE_MARGIN, 2 * LOD_MIDDLE_MARGIN)
+        near, due = [], []
+        middle = far = 0
+        for index, enemy in enumerate(self.enemies):
+            if not ENEMY_LOD or enemy is boss or near_zone.colliderect(enemy.rect):
+                near.append(enemy)
+            elif middle_zone.colliderect(enemy.rect):
+                # Reihum verteilt: pro Schritt kommt etwa jeder n-te Gegner des Rings dran
+                middle += 1
+                if (index + self.timers.now) % LOD_MIDDLE_INTERVAL == 0:
+                    due.append(enemy)
+            else:
+                far += 1
+
+        start = time.perf_counter()
+        self._step_enemies(near, boss, dt)
+        near_time = time.perf_counter() - start
+        start = time.perf_counter()
+        self._step_enemies(due, boss, dt * LOD_MIDDLE_INTERVAL)
+        middle_time = time.perf_counter() - start
+        debug_stats.set_value("Gegner nah", f"{len(near)} ({near_time * 1000:.2f} ms)")
+        debug_stats.set_value("Gegner mittel", f"{middle}, davon {len(due)} im Schritt ({middle_time * 1000:.2f} ms)")
+        debug_stats.set_value("Gegner fern (schlafen)", far)
+        return near + due
+
+    def _step_enemies(self, enemies, boss, dt):
+        """Ein Schritt der Länge dt für die übergebenen Gegner"""
+        batched_enemies = []  # Gegner, deren Physik gesammelt in enemy_physics läuft
+        for enemy in enemies:
+            if enemy is boss:
+                enemy.perform_boss_attack(self.player) #Übergabe Projektile
+
+            if self.enemy_physics is not None and enemy is not boss:
+                # Nur Verhalten jetzt, Schwerkraft und Kollision für alle zusammen danach
+                if not self.player.are_enemies_frozen():
+                    enemy.update_behaviour(self.collision_index, self.player, self.camera)
+                else:
+                    enemy.velocity.x = 0  # Horizontale Bewegung stoppen
+                    enemy.update_behaviour(self.collision_index)
+                batched_enemies.append(enemy)
+
+            elif not self.player.are_enemies_frozen():
+                enemy.update(self.collision_index, self.player, self.camera, dt)
+
+            else:
+                # Update wenn eingefrorene Gegner 
+                enemy.velocity.x = 0  # Horizontale Bewegung stoppen
+                enemy.update(self.collision_index, dt=dt) # Wende Schwerkraft und Kollision an
+        
+        if batched_enemies:
+            self.enemy_physics.step(batched_enemies, dt)
+
+    def _update_platforms(self):
+        """Brechende Plattformen: nur die unter dem Spieler aufwecken, dann alle aktiven updaten"""
+        # Normale und ruhende brechende Plattformen haben nichts zu tun
+        for platform, breakable in self.collision_index.query(BreakingPlatform.contact_rect(self.player)):
+            if breakable:
+                platform.wake()
+        for platform in list(self.active_platforms):
+            platform.update(self.player)
+        debug_stats.set_value("Aktive Plattformen", f"{len(self.active_platforms)} von {self.breaking_platforms}")
+
+    def _handle_collisions(self):
+        """Alle Kollisionen zwischen beweglichen Objekten (nachdem sich alles bewegt hat)"""
+        # Broadphase mit den aktuellen Positionen füllen, alle Prüfungen fragen sie ab
+        self._fill_broadphase()
+        
+        # Kollision Spieler mit Gegnern prüfen
+        if not self.player.is_invincible and self._hits(self.player, "enemy"):
+            self.player.take_damage()
+        
+        # Erweiterte Bubble-Logik
+        self._handle_bubble_mechanics()
+        
+        # Kollisionserkennung: Projektile mit Gegnern
+        boss = self.registry.singleton("boss")
+        for projectile in self.registry.get("bubble"):
+            if not projectile.captured_enemy and not projectile.is_popping:
+                for enemy in self._hits(projectile, "enemy", rect=projectile.hit_rect()):
+                    if not enemy.alive():
+                        continue  # In diesem Frame schon von einer anderen Blase gefangen
+                    if enemy is boss:
+                        enemy.take_damage()
+                        projectile.is_popping = True
+                    else:
+
+                        projectile.capture_enemy(enemy)
+                        # Die Blase wächst mit dem gefangenen Gegner (wie pop(), s.o.)
+                        self.broadphase.refresh(projectile)
+                        # Credit Points spawnen wenn Gegner gefangen wird
+                        self._spawn_creditpoint(enemy.rect.centerx, enemy.rect.centery)
+                    break
+
+        #Kollisionserkennung Spieler Boss RedPen
+        for projectile in self._hits(self.player, "pen"): #Spieler und Redpen
+            self.player.take_damage()
+            projectile.kill() #Projectile verschwindet
+            break
+
+        # Sammel-Kollisionen
+        self._handle_collection_collisions()
+    
+    def _hits(self, sprite, category, after=None, rect=None):
+        """Treffer eines Sprites in einer Kategorie: Rechteck-Vorauswahl, im präzisen Modus pixelgenau
+
+        rect: Rechteck für die Abfrage (z.B. Projectile.hit_rect()), sonst sprite.rect
+        """
+        candidates = self.broadphase.query(sprite.rect if rect is None else rect, category, after)
+        if not self.precise_collision:
+            return candidates
+        # Treffer nur über den überstrichenen Bereich (schnelle Projektile) lassen sich ohne
+        # Zwischenschritte nicht pixelgenau prüfen und zählen wie im Rechteck-Modus
+        return [other for other in candidates
+                if not other.rect.colliderect(sprite.rect) or collision_masks.overlap(sprite, other)]
+    
+    def _fill_broadphase(self):
+        """Sortiert Gegner, Blasen und Stifte mit ihren aktuellen Positionen in den Hash ein"""
+        self.broadphase.clear()
+        self.broadphase.insert_all("enemy", self.enemies)
+        self.broadphase.insert_all("bubble", self.registry.get("bubble"))
+        for pen in self.registry.get("pen"):
+            self.broadphase.insert("pen", pen, pen.hit_rect())
+    
+    def _handle_bubble_mechanics(self):
+        """Behandelt erweiterte Bubble-Mechaniken"""
+        bubbles = self.registry.get("bubble")
+        
+        for bubble in bubbles:
+            # Automatische Aufstieg-Logik
+            bubble.update_rising_logic()
+        
+        # Bubble-zu-Bubble Kollisionen über die Broadphase (nur Nachbarn statt aller Paare)
+        for bubble in bubbles:
+            if bubble.can_be_popped():
+                # Nur mit später eingefügten Blasen prüfen (vermeidet doppelte Prüfungen)
+                for other_bubble in self._hits(bubble, "bubble", after=bubble):
+                    if other_bubble.can_be_popped():
+                        
+                        # Beide Blasen platzen lassen
+                        bubble.pop()
+                        other_bubble.pop()
+                        # pop() vergrößert die Blasen: weitere Abfragen mit dem neuen Rechteck
+                        self.broadphase.refresh(bubble)
+                        self.broadphase.refresh(other_bubble)
+                        break
+    
+    def _handle_collection_collisions(self):
+        """Behandelt Kollisionen zwischen Spieler und Sammelobjekten"""
+        # PowerUp-Kollisionen (optimiert mit spritecollide)
+        collected_powerups = pygame.sprite.spritecollide(self.player, self.powerups, True)
+        for powerup in collected_powerups:
+            self.player.collect(powerup)
+        
+        # Collectible-Kollisionen (optimiert mit spritecollide)
+        collected_items = pygame.sprite.spritecollide(self.player, self.collectibles, True)
+        for collectible in collected_items:
+            self.player.collect(collectible)
+    
+    def _spawn_creditpoint(self, x, y):
+        """Spawnt einen Credit Point an der angegebenen Position"""
+        from powerups import Creditpoint
+        cp = Creditpoint(x, y)
+        self.collectibles.add(cp)
+    
+    def _spawn_powerup(self, x, y, powerup_type=None):
+        """Spawnt ein PowerUp an der angegebenen Position"""
+        from powerups import DoubleEspresso, CheatsheetScroll, SemesterbreakAura, MotivationFishBread
+        import random
+        
+        if powerup_type is None:
+            # Zufälliges PowerUp auswählen
+            powerup_classes = [DoubleEspresso, CheatsheetScroll, SemesterbreakAura, MotivationFishBread]
+            powerup_class = random.choice(powerup_classes)
+        else:
+            powerup_map = {
+                'double_espresso': DoubleEspresso,
+                'cheatsheet_scroll': CheatsheetScroll,
+                'semesterbreak_aura': SemesterbreakAura,
+                'motivation_fishbread': MotivationFishBread
+            }
+            powerup_class = powerup_map.get(powerup_type, DoubleEspresso)
+        
+        powerup = powerup_class(x, y)
+        self.powerups.add(powerup)
+    
+    @startup_profiler.profiled("Level._spawn_level_items")
+    def _spawn_level_items(self):
+        """Verteilt PowerUps und Collectibles über das gesamte Level (als Einträge ihrer Zonen)"""
+        from powerups import (DoubleEspresso, CheatsheetScroll, SemesterbreakAura, 
+                             MotivationFishBread, Creditpoint, Grade)
+        
+        # POWERUPS - Selten und abwechslungsreich platziert
+        powerup_positions = [
+            (1100, HEIGHT - 220, DoubleEspresso),               # Zone 1: Über vierter Plattform
+            
+            # Zone 3-4: Zwei PowerUps
+            (WIDTH*2 + 730, HEIGHT - 340, CheatsheetScroll),    # Über vierter Plattform (hohe Plattform)
+            (WIDTH*3 + 400, HEIGHT - 360, MotivationFishBread), # Über achter Plattform (hohe Plattform)
+            
+            # Zone 5-6: Drei PowerUps (schwerer zu erreichen)
+            (WIDTH*4 + 360, HEIGHT - 340, SemesterbreakAura),   # Über zweiter Plattform (hoch)
+            (WIDTH*4 + 650, HEIGHT - 380, DoubleEspresso),      # Über vierter Plattform (höchste)
+            (WIDTH*5 + 410, HEIGHT - 360, CheatsheetScroll),    # Über neunter Plattform (sehr hoch)
+            
+            # Zone 7-8: Sehr schwer PowerUps
+            (WIDTH*6 + 660, HEIGHT - 380, SemesterbreakAura),   # Über sehr hoher Plattform
+            (WIDTH*7 + 470, HEIGHT - 320, MotivationFishBread), # Über hoher Plattform
+            
+            # Zone 9-10: Expert PowerUps
+            (WIDTH*8 + 560, HEIGHT - 380, DoubleEspresso),      # Über sehr hoher Plattform
+            (WIDTH*9 + 200, HEIGHT - 380, CheatsheetScroll),    # Über sehr hoher Plattform
+            
+            # Zone 11-12: Nightmare PowerUps
+            (WIDTH*10 + 460, HEIGHT - 400, SemesterbreakAura),  # Über extrem hoher Plattform
+            (WIDTH*11 + 320, HEIGHT - 380, MotivationFishBread), # Über sehr hoher Plattform
+            
+            # Zone 13-14: Extreme PowerUps
+            (WIDTH*12 + 700, HEIGHT - 400, DoubleEspresso),     # Über extrem hoher Plattform
+            (WIDTH*13 + 470, HEIGHT - 340, CheatsheetScroll),   # Über hoher Plattform
+            
+            # Zone 15: Pre-Final-Boss PowerUp
+            (WIDTH*15 + 570, HEIGHT - 380, SemesterbreakAura),  # Über Boss-Arena sehr hoch
+        ]
+        
+        for x, y, powerup_class in self._spread(powerup_positions):
+            self.streamer.add("powerup", (powerup_class, x, y))
+        
+        # CREDIT POINTS - Abwechslungsreich verteilt (Boden, Luft, Plattformen)
+        # Zone 1-2: Tutorial - gemischte Platzierung
+        cp_positions_tutorial = [
+            (500, HEIGHT - 160),   # Über erste Plattform (550, HEIGHT - 200)
+            (650, HEIGHT - 100),   # Am Boden zwischen Plattformen
+            (850, HEIGHT - 180),   # Über dritte Plattform (750, HEIGHT - 140)
+            (1100, HEIGHT - 220),  # Über vierte Plattform (1000, HEIGHT - 180)
+            (1300, HEIGHT - 160),  # Über fünfte Plattform (1200, HEIGHT - 120)
+            (1550, HEIGHT - 240),  # Über sechste Plattform (1450, HEIGHT - 200)
+            (1700, HEIGHT - 100),  # Am Boden am Ende
+        ]
+        
+        # Zone 3-4: Mittlere Verteilung - mehr Abwechslung
+        cp_positions_medium = [
+            (WIDTH*2 + 100, HEIGHT - 100),   # Am Boden vor Zone
+            (WIDTH*2 + 250, HEIGHT - 220),   # Über erste Plattform (WIDTH*2 + 200, HEIGHT - 180)
+            (WIDTH*2 + 420, HEIGHT - 300),   # Über zweite Plattform (WIDTH*2 + 370, HEIGHT - 260)
+            (WIDTH*2 + 570, HEIGHT - 240),   # Über dritte Plattform (WIDTH*2 + 520, HEIGHT - 200)
+            (WIDTH*2 + 730, HEIGHT - 340),   # Über vierte Plattform (WIDTH*2 + 680, HEIGHT - 300)
+            (WIDTH*2 + 890, HEIGHT - 260),   # Über fünfte Plattform (WIDTH*2 + 840, HEIGHT - 220)
+            (WIDTH*2 + 950, HEIGHT - 100),   # Am Boden
+            (WIDTH*3 + 70, HEIGHT - 320),    # Über sechste Plattform (WIDTH*3 + 20, HEIGHT - 280)
+            (WIDTH*3 + 230, HEIGHT - 240),   # Über siebte Plattform (WIDTH*3 + 180, HEIGHT - 200)
+            (WIDTH*3 + 400, HEIGHT - 360),   # Über achte Plattform (WIDTH*3 + 350, HEIGHT - 320)
+            (WIDTH*3 + 550, HEIGHT - 280),   # Über neunte Plattform (WIDTH*3 + 500, HEIGHT - 240)
+            (WIDTH*3 + 700, HEIGHT - 100),   # Am Boden am Ende
+        ]
+        
+        # Zone 5-6: Spärliche Verteilung - herausfordernder
+        cp_positions_hard = [
+            (WIDTH*4 + 50, HEIGHT - 100),    # Am Boden vor Zone
+            (WIDTH*4 + 250, HEIGHT - 320),   # Über erste Plattform
+            (WIDTH*4 + 350, HEIGHT - 150),   # In der Luft (schwer erreichbar)
+            (WIDTH*4 + 550, HEIGHT - 420),   # Über sehr hoher Plattform
+            (WIDTH*4 + 700, HEIGHT - 100),   # Am Boden (große Lücke)
+            (WIDTH*4 + 950, HEIGHT - 240),   # Über dritter Plattform
+            (WIDTH*5 + 150, HEIGHT - 150),   # In der Luft
+            (WIDTH*5 + 350, HEIGHT - 390),   # Über höchster Plattform
+            (WIDTH*5 + 550, HEIGHT - 100),   # Am Boden
+            (WIDTH*5 + 750, HEIGHT - 260),   # Über letzter Plattform
+        ]
+        
+        # Zone 7-8: Sehr schwer - wenige, strategische CPs
+        cp_positions_very_hard = [
+            (WIDTH*6 + 150, HEIGHT - 100),   # Am Boden vor Zone
+            (WIDTH*6 + 400, HEIGHT - 340),   # Über hoher Plattform
+            (WIDTH*6 + 660, HEIGHT - 380),   # Über sehr hoher Plattform
+            (WIDTH*6 + 910, HEIGHT - 220),   # Über niedrigerer Plattform
+            (WIDTH*7 + 190, HEIGHT - 280),   # Über mittlerer Plattform
+            (WIDTH*7 + 470, HEIGHT - 320),   # Über hoher Plattform
+            (WIDTH*7 + 600, HEIGHT - 240),   # Über niedrigerer Plattform
+        ]
+        
+        # Zone 9-10: Expert - spärliche Verteilung
+        cp_positions_expert = [
+            (WIDTH*8 + 100, HEIGHT - 100),   # Am Boden vor Zone
+            (WIDTH*8 + 320, HEIGHT - 360),   # Über hoher Plattform
+            (WIDTH*8 + 560, HEIGHT - 380),   # Über sehr hoher Plattform
+            (WIDTH*8 + 790, HEIGHT - 220),   # Über niedrigerer Plattform
+            (WIDTH*8 + 920, HEIGHT - 340),   # Über hoher Plattform
+            (WIDTH*9 + 70, HEIGHT - 260),    # Über mittlerer Plattform
+            (WIDTH*9 + 200, HEIGHT - 380),   # Über sehr hoher Plattform
+            (WIDTH*9 + 430, HEIGHT - 320),   # Über hoher Plattform
+            (WIDTH*9 + 550, HEIGHT - 200),   # Über niedrigerer Plattform
+            (WIDTH*9 + 680, HEIGHT - 280),   # Über mittlerer Plattform
+        ]
+        
+        # Zone 11-12: Nightmare - sehr spärlich
+        cp_positions_nightmare = [
+            (WIDTH*10 + 50, HEIGHT - 100),   # Am Boden vor Zone
+            (WIDTH*10 + 260, HEIGHT - 360),  # Über hoher Plattform
+            (WIDTH*10 + 460, HEIGHT - 400),  # Über extrem hoher Plattform
+            (WIDTH*10 + 650, HEIGHT - 240),  # Über niedrigerer Plattform
+            (WIDTH*10 + 860, HEIGHT - 380),  # Über sehr hoher Plattform
+            (WIDTH*11 + 100, HEIGHT - 340),  # Über hoher Plattform
+            (WIDTH*11 + 320, HEIGHT - 380),  # Über sehr hoher Plattform
+            (WIDTH*11 + 520, HEIGHT - 220),  # Über niedrigerer Plattform
+            (WIDTH*11 + 640, HEIGHT - 320),  # Über hoher Plattform
+        ]
+        
+        # Zone 13-14: Extreme - minimal
+        cp_positions_extreme = [
+            (WIDTH*12 + 30, HEIGHT - 100),   # Am Boden vor Zone
+            (WIDTH*12 + 230, HEIGHT - 380),  # Über extrem hoher Plattform
+            (WIDTH*12 + 410, HEIGHT - 220),  # Über niedrigerer Plattform
+            (WIDTH*12 + 570, HEIGHT - 280),  # Über mittlerer Plattform
+            (WIDTH*12 + 700, HEIGHT - 400),  # Über extrem hoher Plattform
+            (WIDTH*12 + 870, HEIGHT - 240),  # Über niedrigerer Plattform
+            (WIDTH*13 + 90, HEIGHT - 260),   # Über mittlerer Plattform
+            (WIDTH*13 + 190, HEIGHT - 380),  # Über extrem hoher Plattform
+            (WIDTH*13 + 360, HEIGHT - 220),  # Über niedrigerer Plattform
+            (WIDTH*13 + 470, HEIGHT - 340),  # Über hoher Plattform
+        ]
+        
+        # Zone 15-16: Final Boss - strategische CPs
+        cp_positions_final_boss = [
+            (WIDTH*14 + 150, HEIGHT - 100),  # Am Boden vor Final Boss-Zone
+            (WIDTH*14 + 400, HEIGHT - 340),  # Über hoher Plattform
+            (WIDTH*14 + 700, HEIGHT - 300),  # Über mittlerer Plattform
+            (WIDTH*15 + 100, HEIGHT - 240),  # Über Boss-Arena Plattform
+            (WIDTH*15 + 320, HEIGHT - 340),  # Über hoher Boss-Arena Plattform
+            (WIDTH*15 + 570, HEIGHT - 380),  # Über sehr hoher Boss-Arena Plattform
+            (WIDTH*15 + 800, HEIGHT - 200),  # Über Boss-Arena Ende
+        ]
+        
+        # Alle Credit Points hinzufügen
+        for x, y in self._spread(cp_positions_tutorial + cp_positions_medium + cp_positions_hard +
+                                 cp_positions_very_hard + cp_positions_expert + cp_positions_nightmare +
+                                 cp_positions_extreme + cp_positions_final_boss):
+            self.streamer.add("collectible", (Creditpoint, x, y))
+        
+        # GRADES (1,0-NOTEN) - Sehr selten und schwer erreichbar (verschoben um Überlappungen zu vermeiden)
+        grade_positions = [
+            # Zone 2: Erste Note (als Belohnung für Plattform-Sprung)
+            (1300, HEIGHT - 160),  # Über fünfter Plattform (verschoben von PowerUp-Position)
+            
+            # Zone 3-4: Versteckte Noten (verschoben um PowerUp-Überlappungen zu vermeiden)
+            (WIDTH*2 + 420, HEIGHT - 300),    # Über zweiter Plattform statt vierter
+            (WIDTH*3 + 550, HEIGHT - 280),    # Über neunter Plattform statt achter
+            
+            # Zone 5-6: Schwierige Noten (verschoben)
+            (WIDTH*4 + 310, HEIGHT - 340),    # Über zweiter Plattform (andere Position)
+            (WIDTH*5 + 210, HEIGHT - 240),    # Über siebter Plattform statt neunter
+            
+            # Zone 7-8: Sehr schwer Belohnungen (verschoben)
+            (WIDTH*6 + 350, HEIGHT - 340),    # Über zweiter Plattform statt sechster
+            (WIDTH*7 + 140, HEIGHT - 280),    # Über fünfter Plattform statt achter
+            
+            # Zone 9-10: Expert Belohnungen (verschoben)
+            (WIDTH*8 + 270, HEIGHT - 360),    # Über zweiter Plattform statt zehnter
+            (WIDTH*9 + 380, HEIGHT - 320),    # Über elfter Plattform statt zehnter
+            
+            # Zone 11-12: Nightmare Belohnungen (verschoben)
+            (WIDTH*10 + 210, HEIGHT - 360),   # Über zweiter Plattform statt vierter
+            (WIDTH*11 + 160, HEIGHT - 260),   # Über elfter Plattform statt zwölfter
+            
+            # Zone 13-14: Extreme Belohnungen (verschoben)
+            (WIDTH*12 + 180, HEIGHT - 380),   # Über zweiter Plattform statt zehnter
+            (WIDTH*13 + 140, HEIGHT - 380),   # Über zwölfter Plattform statt vierzehnter
+            
+            # Zone 15-16: Final Boss Belohnungen (verschoben)
+            (WIDTH*15 + 220, HEIGHT - 340),   # Über sechster Boss-Arena Plattform statt achter
+            (WIDTH*15 + 720, HEIGHT - 200),   # Über letzter Boss-Arena Plattform (verschoben)
+        ]
+        
+        for x, y in self._spread(grade_positions):
+            self.streamer.add("collectible", (Grade, x, y))
+
+    def _remember_positions(self):
+        """Merkt sich die Positionen aller beweglichen Objekte vor dem Schritt"""
+        positions = {self.player: self.player.rect.topleft}
+        for group in (self.enemies, self.projectiles):
+            for sprite in group:
+                positions[sprite] = sprite.rect.topleft
+        self.previous_positions = positions
+        self.previous_camera = self.camera.camera_rect.topleft
+
+    @contextlib.contextmanager
+    def interpolated(self, alpha):
+        """Setzt bewegliche Objekte und Kamera für das Zeichnen zwischen die letzten beiden Schritte
+
+        alpha: Anteil des nächsten Schritts, der schon vergangen ist (0.0 = vorheriger Zustand)
+        """
+        if alpha >= 1.0 or not self.previous_positions:
+            yield
+            return
+        # Nur Rechtecke verschieben; nach dem Zeichnen gilt wieder der simulierte Zustand
+        moved = []
+        for sprite, (old_x, old_y) in self.previous_positions.items():
+            rect = sprite.rect
+            moved.append((rect, rect.topleft))
+            rect.topleft = (old_x + (rect.x - old_x) * alpha, old_y + (rect.y - old_y) * alpha)
+        camera_rect = self.camera.camera_rect
+        moved.append((camera_rect, camera_rect.topleft))
+        old_x, old_y = self.previous_camera
+        camera_rect.topleft = (old_x + (camera_rect.x - old_x) * alpha, old_y + (camera_rect.y - old_y) * alpha)
+        try:
+            yield
+        finally:
+            for rect, position in moved:
+                rect.topleft = position
+
+    def draw(self, screen, alpha=1.0):
+        """Zeichnet das Level (alpha: Interpolation zwischen den letzten beiden Simulationsschritten)"""
+        with self.interpolated(alpha):
+            self._draw(screen)
+
+    def _draw(self, screen):
+        # Hintergrund zeichnen
+        screen.fill(self.background_color)
+        
+        # Hintergrundbild mit vereinfachtem Parallax-Effekt zeichnen
+        if self.background_texture:
+            # Parallax-Offset berechnen (Hintergrund bewegt sich langsamer)
+            parallax_offset = self.camera.camera_rect.x * self.parallax_factor
+            
+            # Hintergrundbreite
+            bg_width = self.background_texture.get_width()
+            
+            # Wie viele Kopien des Hintergrunds brauchen wir?
+            tiles_needed = (self.level_width // bg_width) + 2
+            
+            # Hintergrundbild mehrfach nebeneinander zeichnen
+            for i in range(tiles_needed):
+                bg_x = i * bg_width - parallax_offset
+                
+                # Nur zeichnen wenn es auf dem Bildschirm sichtbar ist
+                if bg_x + bg_width >= 0 and bg_x <= WIDTH:
+                    screen.blit(self.background_texture, (bg_x, 0))
+        
+        # Alle Sprites mit Kamera-Offset zeichnen
+        # Statische Plattformen und Boden: höchstens zwei Chunk-Blits
+        if self.static_layer.dirty:
+            self.build_static_layer()
+        self.static_layer.draw(screen, self.camera)
+        
+        self._draw_sprites(screen)
+        
+        # Spieler zeichnen (mit Effekten)
+        self._draw_player_with_effects(screen)
+    
+    def _draw_sprites(self, screen):
+        """Zeichnet die Sprite-Ebenen (nur was im Bild liegt, siehe render_index.py)"""
+        # Brechende Plattformen einzeln (mit Shake-Effekt)
+        for platform in self._visible("platform", "Plattformen"):
+            render_rect = platform.get_render_rect()
+            screen.blit(platform.image, self.camera.apply_rect(render_rect))
+        
+        # Collectibles
+        for collectible in self._visible("collectible", "Sammelobjekte"):
+            screen.blit(collectible.image, self.camera.apply(collectible))
+        
+        # PowerUps
+        for powerup in self._visible("powerup", "PowerUps"):
+            screen.blit(powerup.image, self.camera.apply(powerup))
+        
+        # Gegner zeichnen (mit Einfrieren-Effekt), jeden genau einmal
+        frozen = self.player.are_enemies_frozen()
+        for enemy in self._visible("enemy", "Gegner"):
+            enemy_pos = self.camera.apply(enemy)
+            if frozen:
+                # Gefrorene Gegner: Bläulicher Tint (einmal pro Animationsbild, siehe transform_cache.tinted)
+                screen.blit(transform_cache.tinted(enemy.image, (100, 150, 255), 100), enemy_pos)
+            else:
+                screen.blit(enemy.image, enemy_pos)
+        
+        # Projektile
+        for projectile in self._visible("projectile", "Projektile"):
+            screen.blit(projectile.image, self.camera.apply(projectile))
+    
+    def _visible(self, layer, label):
+        """Sprites einer Zeichenebene, die das Bild (plus RENDER_MARGIN) berühren; zählt gezeichnet/gesamt"""
+        if self.render_culling:
+            view = self.camera.camera_rect.inflate(2 * RENDER_MARGIN, 2 * RENDER_MARGIN)
+            sprites = self.render_index.visible(layer, view)
+        else:
+            sprites = list(self.render_index.sources[layer])  # Zum Vergleich: alles im Level
+        debug_stats.set_value(f"Gezeichnet {label}", f"{len(sprites)} von {self.render_index.total(layer)}")
+        return sprites
+
+    def _draw_player_with_effects(self, screen):
+        """Zeichnet den Spieler mit allen aktiven visuellen Effekten"""
+        player_pos = self.camera.apply(self.player)
+        
+        # PowerUp-Effekte: Umrandung statt Overlay
+        outline_colors = []
+        if self.player.is_speed_boosted:
+            outline_colors.append((255, 255, 0))  # Gelb für Geschwindigkeit
+        
+        if self.player.has_semesterbreak_aura:
+            outline_colors.append((0, 255, 0))  # Grün für Unverwundbarkeit
+        
+        # Zeichne Umrandungen falls PowerUps aktiv sind
+        if outline_colors:
+            self._draw_player_outline(screen, player_pos, outline_colors)
+        
+        # Unverwundbarkeits-Blinken
+        if self.player.is_invincible:
+            # Blinken: Nur jede 10 Frames zeichnen
+            if (self.player.invincibility_timer.remaining() // 5) % 2 == 0:
+                screen.blit(self.player.image, player_pos)
+        else:
+            screen.blit(self.player.image, player_pos)
+
+        #Betäubung
+        if self.player.is_stunned: 
+            # Überlappung transparent blau (einmal pro Animationsbild, siehe transform_cache.overlay)
+            screen.blit(transform_cache.overlay(self.player.image, (0, 0, 150, 80)), player_pos)
+
+    
+    def _draw_player_outline(self, screen, player_pos, colors):
+        """Zeichnet eine leuchtende Umrandung um den Player (vorgezeichnet pro Animationsbild und Farben)"""
+        outline = transform_cache.outline(self.player.image, colors)
+        margin = len(colors)  # Die Umrandung ragt so weit über das Sprite hinaus
+        # Vormultipliert zusammengesetzt (siehe transform_cache.outline)
+        screen.blit(outline, (player_pos[0] - margin, player_pos[1] - margin), special_flags=pygame.BLEND_PREMULTIPLIED)
@@ -0,0 +1,113 @@
+"""
+Hintergrund-Loader für Level
+Bereitet das nächste Level vor, während das Hauptmenü animiert oder der
+Game-Over-Bildschirm angezeigt wird. Beim Drücken von Start bzw. R liegt das
+Level dann (meistens) schon fertig bereit.
+
+Der Aufbau hat zwei Teile:
+- Im Hintergrund-Thread läuft nur, was weder das Display noch geteilte Caches
+  anfasst (z.B. PNGs dekodieren, siehe assets.decode).
+- Alles andere (Konvertieren ins Displayformat, Level-Objekte, vorgezeichnete
+  Chunks) läuft im Hauptthread, als Generator in kleinen Schritten: poll()
+  führt pro Frame Schritte aus, bis das Zeitbudget aufgebraucht ist.
+"""
+
+import threading
+import time
+
+
+class LevelLoader:
+    """Baut ein Level (Hintergrund-Teil plus Schritte im Hauptthread) und meldet Fortschritt und Bereitschaft"""
+
+    def __init__(self, background, finish):
+        # background(progress_callback) -> daten (läuft im Hintergrund-Thread)
+        # finish(daten, progress_callback) -> Generator im Hauptthread, gibt am Ende das Level zurück
+        self.background = background
+        self.finish = finish
+        self.level = None
+        self.error = None
+        self.build_time = None       # Start bis fertig (Sekunden)
+        self.background_time = None  # Davon im Hintergrund-Thread
+        self.finish_time = 0.0       # Davon im Hauptthread
+        self.finish_frames = 0       # Aufrufe von poll() mit Arbeit im Hauptthread
+        self._progress = (0.0, "Warte auf Start")
+        self._data = None
+        self._steps = None
+        self._start_time = None
+        self._background_done = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Startet den Aufbau im Hintergrund (mehrfacher Aufruf ist harmlos)"""
+        if self._thread is not None:
+            return self
+        self._start_time = time.perf_counter()
+        # Daemon-Thread: Beenden des Spiels wartet nicht auf einen halb fertigen Aufbau
+        self._thread = threading.Thread(target=self._run, name="LevelLoader", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        """Läuft im Hintergrund-Thread"""
+        try:
+            self._data = self.background(self._set_progress)
+        except Exception as e:  # Fehler an den Hauptthread weiterreichen
+            self.error = e
+        self.background_time = time.perf_counter() - self._start_time
+        self._background_done.set()
+
+    def _set_progress(self, fraction, label):
+        self._progress = (fraction, label)
+
+    @property
+    def progress(self):
+        """Aktueller Fortschritt als (anteil 0..1, beschreibung)"""
+        return self._progress
+
+    def is_started(self):
+        return self._thread is not None
+
+    def is_ready(self):
+        """Prüft ohne zu blockieren, ob das Level fertig ist (oder der Aufbau fehlgeschlagen)"""
+        return self.level is not None or self.error is not None
+
+    def poll(self, budget=None):
+        """Hauptthread: baut weiter, solange budget (Sekunden) reicht (None = bis zum Ende)
+
+        Gibt zurück, ob das Level fertig ist. Vor dem Ende des Hintergrund-Teils passiert nichts.
+        """
+        if self.is_ready():
+            return True
+        if not self._background_done.is_set():
+            return False
+        start = time.perf_counter()
+        try:
+            if self._steps is None:
+                self._steps = self.finish(self._data, self._set_progress)
+            while budget is None or time.perf_counter() - start < budget:
+                next(self._steps)
+        except StopIteration as done:
+            self.level = done.value
+            self._set_progress(1.0, "Fertig")
+        except Exception as e:  # Wie im Hintergrund: Fehler erst in result() melden
+            self.error = e
+        self.finish_time += time.perf_counter() - start
+        self.finish_frames += 1
+        if self.is_ready():
+            self.build_time = time.perf_counter() - self._start_time
+        return self.is_ready()
+
+    def wait(self, timeout=None):
+        """Wartet höchstens timeout Sekunden auf den Hintergrund-Teil, baut dann im aufrufenden
+        (Haupt-)Thread fertig und gibt zurück, ob das Level fertig ist"""
+        self.start()
+        if not self._background_done.wait(timeout):
+            return False
+        return self.poll()
+
+    def result(self):
+        """Gibt das fertige Level zurück (blockiert bis zum Ende des Aufbaus)"""
+        self.wait()
+        if self.error is not None:
+            raise self.error
+        return self.level
@@ -1,46 +1,60 @@
 import pygame
+import assets
+import surface_audit
 from settings import COLOR_PLATFORM
 import random
 import math
 
 class Platform(pygame.sprite.Sprite):
+    # Statische Plattformen werden in die vorgezeichnete Ebene gebacken (siehe static_layer.py)
+    is_static = True
+
+    # Gekachelte Bilder werden pro Klasse und Größe geteilt: (klasse, breite, höhe) -> Surface
+    _tiled_images = {}
+
     def __init__(self, x, y, width, height):
         super().__init__()
         self.rect = pygame.Rect(x, y, width, height)
-        
+        self.image = self.shared_image(width, height)
+
+    @classmethod
+    def shared_image(cls, width, height):
+        """Gibt das gekachelte Bild für diese Plattformgröße zurück (einmal pro Größe erstellt)"""
+        key = (cls._create_image.__func__, width, height)
+        image = Platform._tiled_images.get(key)
+        if image is None:
+            image = cls._create_image(width, height)
+            Platform._tiled_images[key] = surface_audit.register(image, f"{cls.__name__} {width}x{height}")
+        return image
+
+    @classmethod
+    def _create_image(cls, width, height):
+        """Kachelt platforms.png auf die Plattformgröße (Fallback: einfarbige Fläche)"""
         # Erstelle zunächst immer eine sichtbare Fallback-Surface
-        self.image = pygame.Surface((width, height))
-        self.image.fill(COLOR_PLATFORM)
+        image = assets.to_display_format(pygame.Surface((width, height)), alpha=False)
+        image.fill(COLOR_PLATFORM)
         print(f"Platform-Basis erstellt: {width}x{height} mit Farbe {COLOR_PLATFORM}")
         
         # Versuche platforms.png zu laden und zu kacheln (optional)
         try:
-            platform_texture = pygame.image.load("images/platforms.png").convert_alpha()
-            tex_w, tex_h = platform_texture.get_size()
-            print(f"Platform-Sprite geladen: {tex_w}x{tex_h} Pixel")
-            
-            # Sprite verkleinern falls es zu groß ist (raus zoomen)
+            # Sprite verkleinern falls es zu groß ist (raus zoomen) - einmal pro Prozess
             max_tile_size = 64  # Maximale Kachelgröße
-            if tex_w > max_tile_size or tex_h > max_tile_size:
-                # Proportional verkleinern
-                scale_factor = min(max_tile_size / tex_w, max_tile_size / tex_h)
-                new_w = int(tex_w * scale_factor)
-                new_h = int(tex_h * scale_factor)
-                platform_texture = pygame.transform.scale(platform_texture, (new_w, new_h))
-                print(f"Sprite verkleinert von {tex_w}x{tex_h} auf {new_w}x{new_h}")
+            platform_texture = assets.load_image("images/platforms.png", max_size=max_tile_size)
             
             if platform_texture.get_width() <= 0 or platform_texture.get_height() <= 0:
                 print(f"FEHLER: Platform-Sprite hat ungültige Größe")
                 raise ValueError("Sprite-Größe ungültig")
             
-            self.image = self._create_tiled_surface(platform_texture, width, height)
+            image = cls._create_tiled_surface(platform_texture, width, height)
             print(f"Platform-Textur geladen und gekachelt: {width}x{height}")
         except (pygame.error, FileNotFoundError, ValueError) as e:
             print(f"Platform-Textur 'platforms.png' konnte nicht geladen werden: {e}")
             print(f"Verwende Fallback-Plattform mit Farbe {COLOR_PLATFORM}")
             # Fallback wird bereits oben erstellt
+        return image
     
-    def _create_tiled_surface(self, texture, target_width, target_height):
+    @staticmethod
+    def _create_tiled_surface(texture, target_width, target_height):
         """Erstellt eine gekachelte Surface aus der gegebenen Textur"""
         tex_width, tex_height = texture.get_size()
         print(f"Kachele Textur: {tex_width}x{tex_height} auf Zielgröße: {target_width}x{target_height}")
@@ -70,11 +84,20 @@ class Platform(pygame.sprite.Sprite):
         return tiled_surface
 
 class BreakingPlatform(Platform):
+    # Bild und Position ändern sich laufend - wird weiterhin einzeln gezeichnet
+    is_static = False
+
     def __init__(self, x, y, width, height):
         super().__init__(x, y, width, height)
         
         # Zustandsvariablen
         self.state = "stable"  # "stable", "cracking", "broken", "regenerating"
+        # Zustandswechsel laufen über das Timer-Rad des Levels (wird vom Level gesetzt)
+        self.timers = None
+        # Menge der aktiven brechenden Plattformen (vom Level gesetzt): nur diese werden pro
+        # Frame aktualisiert, ruhende (stabil ohne Spieler, gebrochen) kosten nichts
+        self.active_platforms = {}
+        self.state_started = 0  # Schritt, in dem der aktuelle Zustand begonnen hat
         self.break_timer = 0
         self.regenerate_timer = 0
         self.shake_offset = 0
@@ -118,6 +141,19 @@ class BreakingPlatform(Platform):
             pygame.draw.line(self.cracked_image, crack_color,
                            (x_pos, start_y), (x_pos, end_y), 1)
     
+    @staticmethod
+    def contact_rect(player):
+        """Bereich unter den Füßen des Spielers, in dem check_player_collision ihn auf einer Plattform sieht"""
+        return pygame.Rect(player.rect.left, player.rect.bottom - 10, player.rect.width, 16)
+
+    def wake(self):
+        """Nimmt die Plattform in die Menge der aktiven Plattformen auf"""
+        self.active_platforms[self] = None
+
+    def sleep(self):
+        """Nimmt die Plattform aus der Menge der aktiven Plattformen"""
+        self.active_platforms.pop(self, None)
+
     def check_player_collision(self, player):
         """Prüft ob der Spieler auf der Plattform steht"""
         # Spieler steht auf Plattform wenn:
@@ -146,16 +182,18 @@ class BreakingPlatform(Platform):
         if self.state == "stable":
             self.state = "cracking"
             self.break_timer = 0
+            self.state_started = self.timers.now
+            self.timers.schedule(self.CRACK_TIME, self.break_platform)
             print(f"Plattform bei ({self.rect.x}, {self.rect.y}) beginnt zu brechen!")
     
     def update(self, player=None):
-        """Aktualisiert den Zustand der brechenden Plattform"""
+        """Aktualisiert die Animation der brechenden Plattform (Zustandswechsel kommen vom Timer-Rad)"""
         try:
             if player:
                 self.check_player_collision(player)
             
             if self.state == "cracking":
-                self.break_timer += 1
+                self.break_timer = self.timers.now - self.state_started
                 
                 # Shake-Effekt während des Brechens
                 self.shake_intensity = min(5, self.break_timer // 10)
@@ -171,29 +209,17 @@ class BreakingPlatform(Platform):
                     alpha = int(255 * (1 - ((progress - 0.5) * 2)))
                     self.image = self.cracked_image.copy()
                     self.image.set_alpha(alpha)
-                
-                # Brechen nach Timer
-                if self.break_timer >= self.CRACK_TIME:
-                    self.break_platform()
-            
-            elif self.state == "broken":
-                self.regenerate_timer += 1
-                if self.regenerate_timer >= self.REGENERATE_TIME:
-                    self.regenerate_platform()
             
             elif self.state == "regenerating":
                 # Regenerations-Animation
+                self.regenerate_timer = self.timers.now - self.state_started
                 progress = min(1.0, self.regenerate_timer / 30)  # 0.5 Sekunden Regeneration
                 alpha = int(255 * progress)
                 self.image = self.original_image.copy()
                 self.image.set_alpha(alpha)
-                
-                self.regenerate_timer += 1
-                if self.regenerate_timer >= 30:
-                    self.state = "stable"
-                    self.image = self.original_image.copy()
-                    self.image.set_alpha(255)
-                    print(f"Plattform bei ({self.rect.x}, {self.rect.y}) ist vollständig regeneriert!")
+
+            elif self.state == "stable" and not self.player_on_platform:
+                self.sleep()  # Spieler nicht (mehr) drauf: ruhen, bis er wieder in Kontakt kommt
         except Exception as e:
             print(f"Fehler beim Update der brechenden Plattform bei ({self.rect.x}, {self.rect.y}): {e}")
             # Fallback: Stelle sicher, dass die Plattform einen gültigen Zustand hat
@@ -213,8 +239,11 @@ class BreakingPlatform(Platform):
         """Lässt die Plattform brechen"""
         self.state = "broken"
         self.regenerate_timer = 0
+        self.state_started = self.timers.now
+        self.timers.schedule(self.REGENERATE_TIME, self.regenerate_platform)
         self.shake_offset = 0
         self.player_on_platform = False
+        self.sleep()  # Gebrochen: nichts zu tun, bis das Timer-Rad die Regeneration startet
         print(f"Plattform bei ({self.rect.x}, {self.rect.y}) ist gebrochen!")
         
         # Unsichtbar machen
@@ -225,7 +254,18 @@ class BreakingPlatform(Platform):
         """Startet die Regeneration der Plattform"""
         self.state = "regenerating"
         self.regenerate_timer = 0
+        self.state_started = self.timers.now
+        self.timers.schedule(30, self._finish_regeneration)  # 0.5 Sekunden Regeneration
+        self.wake()
         print(f"Plattform bei ({self.rect.x}, {self.rect.y}) regeneriert sich!")
+
+    def _finish_regeneration(self):
+        """Beendet die Regeneration (Plattform wieder stabil)"""
+        self.state = "stable"
+        self.image = self.original_image.copy()
+        self.image.set_alpha(255)
+        self.sleep()
+        print(f"Plattform bei ({self.rect.x}, {self.rect.y}) ist vollständig regeneriert!")
     
     def can_collide(self):
         """Gibt zurück ob die Plattform kollidierbar ist"""
@@ -1,4 +1,4 @@
-import pygame
+import transform_cache
 from character import Character
 from weapons import Weapon
 from settings import PLAYER_LIVES, PLAYER_INVINCIBILITY_TIME, PLAYER_SPEED
@@ -19,7 +19,7 @@ class Player(Character):
         self.lives = PLAYER_LIVES
         self.weapon = Weapon(self)
         self.is_invincible = False
-        self.invincibility_timer = 0  # Timer für Unverwundbarkeit
+        self.invincibility_timer = None  # Timer, der die Unverwundbarkeit beendet
         
         # Score-System
         self.score = 0
@@ -30,10 +30,8 @@ class Player(Character):
         self.base_speed = PLAYER_SPEED
         self.current_speed = PLAYER_SPEED
         
-        # PowerUp-Timer (werden von PowerUps verwaltet)
-        self.double_espresso_timer = 0
-        self.cheatsheet_timer = 0
-        self.semesterbreak_timer = 0
+        # PowerUp-Timer (Name -> Timer, gestartet von den PowerUps über start_powerup_timer)
+        self.powerup_timers = {}
         
         # PowerUp-Status Flags (werden von PowerUps gesetzt)
         self.is_speed_boosted = False
@@ -83,10 +81,10 @@ class Player(Character):
             if self.lives > 0:
                 # Leben verloren, aber noch Leben übrig - kurze Unverwundbarkeit
                 self.is_invincible = True
-                self.invincibility_timer = PLAYER_INVINCIBILITY_TIME
+                self.invincibility_timer = self.timers.schedule(PLAYER_INVINCIBILITY_TIME, self._end_invincibility)
             # Wenn self.lives <= 0, wird das Game Over vom Game-Objekt behandelt
 
-    def update(self, platforms=None):
+    def update(self, platforms=None, dt=1.0):
         # facing_direction wird NUR durch Bewegung bestimmt
         old_facing_direction = self.facing_direction
         
@@ -104,17 +102,11 @@ class Player(Character):
         if old_facing_direction != self.facing_direction:
             self._apply_current_sprite()
         
-        super().update(platforms)
-        self.weapon.update()  # Weapon-Cooldown aktualisieren
-        
-        # Unverwundbarkeits-Timer verwalten
-        if self.invincibility_timer > 0:
-            self.invincibility_timer -= 1
-            if self.invincibility_timer <= 0:
-                self.is_invincible = False
-        
-        # PowerUp-Timer verwalten
-        self._update_powerup_timers()
+        super().update(platforms, dt)
+        # Cooldown, Unverwundbarkeit und PowerUps laufen über das Timer-Rad des Levels
+
+    def _end_invincibility(self):
+        self.is_invincible = False
     
     def _update_animation(self):
         """Aktualisiert die Player-Animation basierend auf dem aktuellen Zustand"""
@@ -150,7 +142,7 @@ class Player(Character):
         # Spiegelung anwenden falls nötig
         if self.facing_direction == -1:
             # Nach links: Sprite horizontal spiegeln
-            self.image = pygame.transform.flip(base_sprite, True, False)
+            self.image = transform_cache.flip(base_sprite, True, False)
         else:
             # Nach rechts: Original-Sprite verwenden
             self.image = base_sprite
@@ -159,30 +151,30 @@ class Player(Character):
         # und Position beibehalten
         self.rect = self.image.get_rect(center=old_center)
     
-    def _update_powerup_timers(self):
-        """Verwaltet alle PowerUp-Timer (minimale Timer-Logik, PowerUps setzen die Werte)"""
-        
-        # Doppelter Espresso Timer
-        if self.double_espresso_timer > 0:
-            self.double_espresso_timer -= 1
-            if self.double_espresso_timer <= 0:
-                self.is_speed_boosted = False
-                self.current_speed = self.base_speed
-                print("Doppelter Espresso-Effekt beendet!")
-        
-        # Spickzettel-Scroll Timer
-        if self.cheatsheet_timer > 0:
-            self.cheatsheet_timer -= 1
-            if self.cheatsheet_timer <= 0:
-                self.enemies_frozen = False
-                print("Spickzettel-Scroll-Effekt beendet!")
-        
-        # Semesterferien-Aura Timer
-        if self.semesterbreak_timer > 0:
-            self.semesterbreak_timer -= 1
-            if self.semesterbreak_timer <= 0:
-                self.has_semesterbreak_aura = False
-                print("Semesterferien-Aura beendet!")
+    def start_powerup_timer(self, name, duration):
+        """Startet (oder verlängert) die Dauer eines PowerUps; am Ende wird der Effekt beendet"""
+        if name in self.powerup_timers:
+            self.powerup_timers[name].cancel()
+        end_effect = getattr(self, f"_end_{name}")
+        self.powerup_timers[name] = self.timers.schedule(duration, end_effect)
+
+    def powerup_remaining(self, name):
+        """Verbleibende Frames eines PowerUps (0, wenn nicht aktiv)"""
+        timer = self.powerup_timers.get(name)
+        return timer.remaining() if timer else 0
+
+    def _end_double_espresso(self):
+        self.is_speed_boosted = False
+        self.current_speed = self.base_speed
+        print("Doppelter Espresso-Effekt beendet!")
+
+    def _end_cheatsheet(self):
+        self.enemies_frozen = False
+        print("Spickzettel-Scroll-Effekt beendet!")
+
+    def _end_semesterbreak(self):
+        self.has_semesterbreak_aura = False
+        print("Semesterferien-Aura beendet!")
     
     def get_movement_speed(self):
         """Gibt die aktuelle Bewegungsgeschwindigkeit zurück"""
@@ -198,15 +190,19 @@ class Player(Character):
                 self.enemies_frozen or 
                 self.has_semesterbreak_aura)
     
-    def get_powerup_status(self):
-        """Gibt den Status aller aktiven PowerUps zurück (für HUD)"""
-        status = []
+    def get_powerup_seconds(self):
+        """Aktive PowerUps als (Bezeichnung, angefangene Sekunden) - ändert sich nur einmal pro Sekunde"""
+        seconds = []
         if self.is_speed_boosted:
-            status.append(f"Espresso: {self.double_espresso_timer//60 + 1}s")
+            seconds.append(("Espresso", self.powerup_remaining('double_espresso') // 60 + 1))
         if self.enemies_frozen:
-            status.append(f"Spickzettel: {self.cheatsheet_timer//60 + 1}s")
+            seconds.append(("Spickzettel", self.powerup_remaining('cheatsheet') // 60 + 1))
         if self.has_semesterbreak_aura:
-            status.append(f"Aura: {self.semesterbreak_timer//60 + 1}s")
-        return status
+            seconds.append(("Aura", self.powerup_remaining('semesterbreak') // 60 + 1))
+        return seconds
+
+    def get_powerup_status(self):
+        """Gibt den Status aller aktiven PowerUps zurück (für HUD)"""
+        return [f"{label}: {seconds}s" for label, seconds in self.get_powerup_seconds()]
 
     # Kollisionen mit Plattformen prüfen (wird vom Level aufgerufen) 
\ No newline at end of file
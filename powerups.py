@@ -1,16 +1,67 @@
 import pygame
 import random
 import os
+import assets
 from settings import (COLOR_YELLOW, COLOR_RED, COLOR_BLUE, COLOR_GREEN, COLOR_PURPLE, COLOR_GOLD,
                       COLOR_WHITE, COLOR_BLACK, DOUBLE_ESPRESSO_DURATION, CHEATSHEET_DURATION, 
                       SEMESTERBREAK_DURATION, IMAGE_FOLDER)
 
-class PowerUp(pygame.sprite.Sprite):
-    def __init__(self, x, y, sprite):
+def _create_fallback_image(size, color, text=None, text_color=COLOR_WHITE, font_size=20):
+    """Erstellt ein farbiges Ersatzbild mit optionalem Text"""
+    image = pygame.Surface(size)
+    image.fill(color)
+    if text:
+        font = pygame.font.Font(None, font_size)
+        text_surface = font.render(text, True, text_color)
+        text_rect = text_surface.get_rect(center=(size[0] // 2, size[1] // 2))
+        image.blit(text_surface, text_rect)
+    return image
+
+
+class SharedImageMixin:
+    """Ein gemeinsames Bild pro Klasse (Flyweight)
+
+    Instanzen speichern nur Position und Zustand; self.image zeigt auf das
+    geteilte Bild der Klasse. Einzelne Instanzen dürfen self.image trotzdem
+    durch eine eigene Surface ersetzen (z.B. für Effekte).
+    """
+    IMAGE_FILES = []             # Kandidaten im Bilder-Ordner, der erste vorhandene gewinnt
+    IMAGE_SIZE = (30, 30)        # Zielgröße des geladenen Sprites
+    FALLBACK_SIZE = (30, 30)     # Größe des Ersatzbildes
+    FALLBACK_COLOR = COLOR_YELLOW
+    FALLBACK_TEXT = None
+    FALLBACK_TEXT_COLOR = COLOR_WHITE
+    FALLBACK_FONT_SIZE = 20
+
+    _shared_images = {}          # Klasse -> geteilte Surface
+
+    @classmethod
+    def shared_image(cls):
+        """Gibt das geteilte Bild der Klasse zurück (wird beim ersten Aufruf erstellt)"""
+        image = SharedImageMixin._shared_images.get(cls)
+        if image is None:
+            image = cls._create_shared_image()
+            SharedImageMixin._shared_images[cls] = image
+        return image
+
+    @classmethod
+    def _create_shared_image(cls):
+        """Lädt das Sprite der Klasse oder erstellt das Ersatzbild"""
+        image_paths = [os.path.join(IMAGE_FOLDER, filename) for filename in cls.IMAGE_FILES]
+        sprite, _ = assets.load_first(image_paths, cls.IMAGE_SIZE)
+        if sprite is not None:
+            return sprite
+        if image_paths:
+            print(f"{cls.__name__}-Sprite nicht gefunden ({', '.join(cls.IMAGE_FILES)}), verwende Fallback")
+        return _create_fallback_image(cls.FALLBACK_SIZE, cls.FALLBACK_COLOR, cls.FALLBACK_TEXT,
+                                      cls.FALLBACK_TEXT_COLOR, cls.FALLBACK_FONT_SIZE)
+
+
+class PowerUp(SharedImageMixin, pygame.sprite.Sprite):
+    def __init__(self, x, y, sprite=None):
         super().__init__()
-        self.image = sprite or pygame.Surface((30, 30))
-        if sprite is None:
-            self.image.fill(COLOR_YELLOW)  # Nur als Fallback
+        # Ohne eigenes Sprite das geteilte Bild der Klasse verwenden
+        self.image = sprite or self.shared_image()
         self.rect = self.image.get_rect(topleft=(x, y))
         self.type = random.choice(['health', 'ammo'])
     
@@ -19,156 +70,71 @@ class PowerUp(pygame.sprite.Sprite):
         pass  # Wird von Unterklassen überschrieben
 
 class DoubleEspresso(PowerUp):
+    IMAGE_FILES = ["doppelter_espresso.png"]
+    IMAGE_SIZE = (40, 40)  # Etwas größer für bessere Sichtbarkeit
+    FALLBACK_SIZE = (40, 40)
+    FALLBACK_COLOR = COLOR_RED
+
     def __init__(self, x, y):
-        # Versuche das Bild zu laden
-        image_path = os.path.join(IMAGE_FOLDER, "doppelter_espresso.png")
-        sprite = None
-        if os.path.exists(image_path):
-            try:
-                sprite = pygame.image.load(image_path).convert_alpha()
-                sprite = pygame.transform.scale(sprite, (40, 40))  # Etwas größer für bessere Sichtbarkeit
-                print(f"Espresso-Sprite geladen: {image_path}")
-            except pygame.error as e:
-                print(f"Fehler beim Laden des Espresso-Sprites: {e}")
-                sprite = None
-        else:
-            print(f"Espresso-Sprite nicht gefunden: {image_path}")
-        
-        # Initialisiere mit None, dann setze das richtige Bild
-        super().__init__(x, y, None)
-        
-        # Setze das richtige Bild
-        if sprite is not None:
-            self.image = sprite
-        else:
-            # Fallback: Rotes Rechteck
-            self.image = pygame.Surface((40, 40))
-            self.image.fill(COLOR_RED)
-        
+        super().__init__(x, y)
         self.type = 'double_espresso'
     
     def apply(self, player):
         """Doppelter Espresso: Verdoppelt die Geschwindigkeit für 5 Sekunden"""
-        player.double_espresso_timer = DOUBLE_ESPRESSO_DURATION
+        player.start_powerup_timer('double_espresso', DOUBLE_ESPRESSO_DURATION)
         player.is_speed_boosted = True
         player.current_speed = player.base_speed * 2
         player.score += 20  # Bonus für PowerUp-Nutzung
         print("Doppelter Espresso! Geschwindigkeit verdoppelt für 5 Sekunden!")
 
 class CheatsheetScroll(PowerUp):
+    IMAGE_FILES = ["cheatsheet_scroll.png"]
+    IMAGE_SIZE = (40, 40)  # Etwas größer für bessere Sichtbarkeit
+    FALLBACK_SIZE = (40, 40)
+    FALLBACK_COLOR = COLOR_BLUE
+    FALLBACK_TEXT = "CS"
+    FALLBACK_FONT_SIZE = 24
+
     def __init__(self, x, y):
-        # Versuche das Bild zu laden
-        image_path = os.path.join(IMAGE_FOLDER, "cheatsheet_scroll.png")
-        sprite = None
-        if os.path.exists(image_path):
-            try:
-                sprite = pygame.image.load(image_path).convert_alpha()
-                sprite = pygame.transform.scale(sprite, (40, 40))  # Etwas größer für bessere Sichtbarkeit
-                print(f"Cheatsheet-Scroll-Sprite geladen: {image_path}")
-            except pygame.error as e:
-                print(f"Fehler beim Laden des Cheatsheet-Scroll-Sprites: {e}")
-                sprite = None
-        else:
-            print(f"Cheatsheet-Scroll-Sprite nicht gefunden: {image_path}")
-        
-        # Initialisiere mit None, dann setze das richtige Bild
-        super().__init__(x, y, None)
-        
-        # Setze das richtige Bild
-        if sprite is not None:
-            self.image = sprite
-        else:
-            # Fallback: Blaues Rechteck mit Text
-            self.image = pygame.Surface((40, 40))
-            self.image.fill(COLOR_BLUE)
-            # Text auf dem PowerUp
-            font = pygame.font.Font(None, 24)
-            text = font.render("CS", True, COLOR_WHITE)
-            text_rect = text.get_rect(center=(20, 20))
-            self.image.blit(text, text_rect)
-        
+        super().__init__(x, y)
         self.type = 'cheatsheet_scroll'
     
     def apply(self, player):
         """Spickzettel-Scroll: Friert alle Gegner für 3 Sekunden ein"""
-        player.cheatsheet_timer = CHEATSHEET_DURATION
+        player.start_powerup_timer('cheatsheet', CHEATSHEET_DURATION)
         player.enemies_frozen = True
         player.score += 30  # Bonus für PowerUp-Nutzung
         print("Spickzettel! Alle Gegner eingefroren für 3 Sekunden!")
 
 class SemesterbreakAura(PowerUp):
+    IMAGE_FILES = ["semesterbreak_aura.png"]
+    IMAGE_SIZE = (40, 40)  # Etwas größer für bessere Sichtbarkeit
+    FALLBACK_SIZE = (40, 40)
+    FALLBACK_COLOR = COLOR_GREEN
+    FALLBACK_TEXT = "SB"
+    FALLBACK_FONT_SIZE = 20
+
     def __init__(self, x, y):
-        # Versuche das Bild zu laden
-        image_path = os.path.join(IMAGE_FOLDER, "semesterbreak_aura.png")
-        sprite = None
-        if os.path.exists(image_path):
-            try:
-                sprite = pygame.image.load(image_path).convert_alpha()
-                sprite = pygame.transform.scale(sprite, (40, 40))  # Etwas größer für bessere Sichtbarkeit
-                print(f"Semesterbreak-Aura-Sprite geladen: {image_path}")
-            except pygame.error as e:
-                print(f"Fehler beim Laden des Semesterbreak-Aura-Sprites: {e}")
-                sprite = None
-        else:
-            print(f"Semesterbreak-Aura-Sprite nicht gefunden: {image_path}")
-        
-        # Initialisiere mit None, dann setze das richtige Bild
-        super().__init__(x, y, None)
-        
-        # Setze das richtige Bild
-        if sprite is not None:
-            self.image = sprite
-        else:
-            # Fallback: Grünes Rechteck mit Text
-            self.image = pygame.Surface((40, 40))
-            self.image.fill(COLOR_GREEN)
-            # Text auf dem PowerUp
-            font = pygame.font.Font(None, 20)
-            text = font.render("SB", True, COLOR_WHITE)
-            text_rect = text.get_rect(center=(20, 20))
-            self.image.blit(text, text_rect)
-        
+        super().__init__(x, y)
         self.type = 'semesterbreak_aura'
     
     def apply(self, player):
         """Semesterferien-Aura: Macht unverwundbar für 5 Sekunden"""
-        player.semesterbreak_timer = SEMESTERBREAK_DURATION
+        player.start_powerup_timer('semesterbreak', SEMESTERBREAK_DURATION)
         player.has_semesterbreak_aura = True
         player.score += 25  # Bonus für PowerUp-Nutzung
         print("Semesterferien-Aura! Unverwundbar für 5 Sekunden!")
 
 class MotivationFishBread(PowerUp):
+    IMAGE_FILES = ["motivation_fishbread.png"]
+    IMAGE_SIZE = (40, 40)  # Etwas größer für bessere Sichtbarkeit
+    FALLBACK_SIZE = (40, 40)
+    FALLBACK_COLOR = COLOR_PURPLE
+    FALLBACK_TEXT = "FB"
+    FALLBACK_FONT_SIZE = 18
+
     def __init__(self, x, y):
-        # Versuche das Bild zu laden
-        image_path = os.path.join(IMAGE_FOLDER, "motivation_fishbread.png")
-        sprite = None
-        if os.path.exists(image_path):
-            try:
-                sprite = pygame.image.load(image_path).convert_alpha()
-                sprite = pygame.transform.scale(sprite, (40, 40))  # Etwas größer für bessere Sichtbarkeit
-                print(f"Motivation-Fishbread-Sprite geladen: {image_path}")
-            except pygame.error as e:
-                print(f"Fehler beim Laden des Motivation-Fishbread-Sprites: {e}")
-                sprite = None
-        else:
-            print(f"Motivation-Fishbread-Sprite nicht gefunden: {image_path}")
-        
-        # Initialisiere mit None, dann setze das richtige Bild
-        super().__init__(x, y, None)
-        
-        # Setze das richtige Bild
-        if sprite is not None:
-            self.image = sprite
-        else:
-            # Fallback: Lila Rechteck mit Text
-            self.image = pygame.Surface((40, 40))
-            self.image.fill(COLOR_PURPLE)
-            # Text auf dem PowerUp
-            font = pygame.font.Font(None, 18)
-            text = font.render("FB", True, COLOR_WHITE)
-            text_rect = text.get_rect(center=(20, 20))
-            self.image.blit(text, text_rect)
-        
+        super().__init__(x, y)
         self.type = 'motivation_fishbread'
     
     def apply(self, player):
@@ -177,12 +143,14 @@ class MotivationFishBread(PowerUp):
         player.score += 50  # Bonus-Punkte für Extra-Leben
         print("Motivations-Fischbrötchen! +1 Leben!")
 
-class Collectible(pygame.sprite.Sprite):
-    def __init__(self, x, y, sprite):
+class Collectible(SharedImageMixin, pygame.sprite.Sprite):
+    FALLBACK_SIZE = (20, 20)
+    FALLBACK_COLOR = COLOR_PURPLE
+
+    def __init__(self, x, y, sprite=None):
         super().__init__()
-        self.image = sprite or pygame.Surface((20, 20))
-        if sprite is None:
-            self.image.fill(COLOR_PURPLE)  # Nur als Fallback
+        # Ohne eigenes Sprite das geteilte Bild der Klasse verwenden
+        self.image = sprite or self.shared_image()
         self.rect = self.image.get_rect(topleft=(x, y))
         self.type = random.choice(['coin', 'gem'])
 
@@ -194,44 +162,16 @@ class Collectible(pygame.sprite.Sprite):
         pass
 
 class Creditpoint(Collectible):
+    IMAGE_FILES = ["cp.png", "Cp.png"]  # Sowohl cp.png als auch Cp.png
+    IMAGE_SIZE = (30, 30)  # Etwas größer für bessere Sichtbarkeit
+    FALLBACK_SIZE = (25, 25)
+    FALLBACK_COLOR = COLOR_GOLD
+    FALLBACK_TEXT = "CP"
+    FALLBACK_TEXT_COLOR = COLOR_BLACK
+    FALLBACK_FONT_SIZE = 18
+
     def __init__(self, x, y):
-        # Versuche das Bild zu laden (sowohl cp.png als auch Cp.png)
-        image_paths = [
-            os.path.join(IMAGE_FOLDER, "cp.png"),
-            os.path.join(IMAGE_FOLDER, "Cp.png")
-        ]
-        sprite = None
-        
-        for image_path in image_paths:
-            if os.path.exists(image_path):
-                try:
-                    sprite = pygame.image.load(image_path).convert_alpha()
-                    sprite = pygame.transform.scale(sprite, (30, 30))  # Etwas größer für bessere Sichtbarkeit
-                    print(f"CP-Sprite geladen: {image_path}")
-                    break
-                except pygame.error as e:
-                    print(f"Fehler beim Laden des CP-Sprites: {e}")
-                    sprite = None
-        
-        if sprite is None:
-            print("CP-Sprite nicht gefunden (cp.png oder Cp.png)")
-        
-        # Initialisiere mit None, dann setze das richtige Bild
-        super().__init__(x, y, None)
-        
-        # Setze das richtige Bild
-        if sprite is not None:
-            self.image = sprite
-        else:
-            # Fallback: Goldenes Rechteck mit Text
-            self.image = pygame.Surface((25, 25))
-            self.image.fill(COLOR_GOLD)
-            # Text auf dem Collectible
-            font = pygame.font.Font(None, 18)
-            text = font.render("CP", True, COLOR_BLACK)
-            text_rect = text.get_rect(center=(12, 12))
-            self.image.blit(text, text_rect)
-        
+        super().__init__(x, y)
         self.type = 'CP'
     
     def collect(self, player):
@@ -246,46 +186,14 @@ class Creditpoint(Collectible):
             print(f"{player.credit_points} CP erreicht! Extra Leben erhalten!")
 
 class Grade(Collectible):
+    IMAGE_FILES = ["1,0_Note.png", "1,0_ Note.png", "grade.png", "note.png"]
+    IMAGE_SIZE = (35, 35)  # Etwas größer für bessere Sichtbarkeit
+    FALLBACK_SIZE = (30, 30)
+    FALLBACK_COLOR = COLOR_BLUE
+    FALLBACK_TEXT = "1.0"
+
     def __init__(self, x, y):
-        # Versuche das Bild zu laden (verschiedene Varianten)
-        image_paths = [
-            os.path.join(IMAGE_FOLDER, "1,0_Note.png"),
-            os.path.join(IMAGE_FOLDER, "1,0_ Note.png"),
-            os.path.join(IMAGE_FOLDER, "grade.png"),
-            os.path.join(IMAGE_FOLDER, "note.png")
-        ]
-        sprite = None
-        
-        for image_path in image_paths:
-            if os.path.exists(image_path):
-                try:
-                    sprite = pygame.image.load(image_path).convert_alpha()
-                    sprite = pygame.transform.scale(sprite, (35, 35))  # Etwas größer für bessere Sichtbarkeit
-                    print(f"Grade-Sprite geladen: {image_path}")
-                    break
-                except pygame.error as e:
-                    print(f"Fehler beim Laden des Grade-Sprites: {e}")
-                    sprite = None
-        
-        if sprite is None:
-            print("Grade-Sprite nicht gefunden (1,0_Note.png, grade.png oder note.png)")
-        
-        # Initialisiere mit None, dann setze das richtige Bild
-        super().__init__(x, y, None)
-        
-        # Setze das richtige Bild
-        if sprite is not None:
-            self.image = sprite
-        else:
-            # Fallback: Blaues Rechteck mit Text
-            self.image = pygame.Surface((30, 30))
-            self.image.fill(COLOR_BLUE)
-            # Text für die Note
-            font = pygame.font.Font(None, 20)
-            text = font.render("1.0", True, COLOR_WHITE)
-            text_rect = text.get_rect(center=(15, 15))
-            self.image.blit(text, text_rect)
-        
+        super().__init__(x, y)
         self.type = 'grade'
     
     def collect(self, player):
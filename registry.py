@@ -0,0 +1,93 @@
+"""
+Entity-Registry eines Levels
+Statt in jedem Frame die Sprite-Gruppen mit isinstance zu durchsuchen (Boss
+finden, Blasen und Stifte unter den Projektilen heraussuchen), führt die
+Registry pro Art eine Menge der lebenden Objekte und benannte Einzelobjekte
+(Spieler, Boss). Die Gruppen des Levels melden Zu- und Abgänge selbst
+(RegistryGroup), auch kill() - die Registry ist also immer aktuell.
+
+Mengen behalten die Einfüge-Reihenfolge (wie die Sprite-Gruppen), damit bei
+mehreren Treffern weiterhin dasselbe Objekt gewinnt.
+"""
+
+import pygame
+
+
+class RegistryGroup(pygame.sprite.Group):
+    """Sprite-Gruppe, die Zu- und Abgänge an die Registry meldet (und an weitere Beobachter)"""
+
+    def __init__(self, registry, *sprites):
+        self.registry = registry
+        self.observers = []  # Weitere Empfänger von added/removed (z.B. der RenderIndex)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.registry.added(sprite)
+        for observer in self.observers:
+            observer.added(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.registry.removed(sprite)
+        for observer in self.observers:
+            observer.removed(sprite)
+
+
+class EntityRegistry:
+    """Lebende Objekte eines Levels nach Art (z.B. "bubble", "boss") und benannte Einzelobjekte"""
+
+    def __init__(self):
+        self.kinds = []           # (name, klasse, einzeln) in Anmelde-Reihenfolge
+        self.members = {}         # name -> {sprite: None} (geordnete Menge)
+        self.singletons = {}      # name -> sprite (z.B. "player", "boss")
+        self.spawned = {}         # name -> Anzahl je hinzugefügter Objekte (z.B. "gab es einen Boss?")
+        self._kinds_by_class = {}  # klasse -> passende Namen (einmal pro Klasse per isinstance)
+
+    def register(self, name, cls, singleton=False):
+        """Meldet eine Art an: alle Instanzen von cls (auch Unterklassen) landen unter name"""
+        self.kinds.append((name, cls, singleton))
+        self.members[name] = {}
+        self.spawned[name] = 0
+        self._kinds_by_class.clear()
+
+    def group(self, *sprites):
+        """Neue Sprite-Gruppe, deren Inhalt in dieser Registry geführt wird"""
+        return RegistryGroup(self, *sprites)
+
+    def _kinds_for(self, sprite):
+        cls = type(sprite)
+        kinds = self._kinds_by_class.get(cls)
+        if kinds is None:
+            kinds = [(name, singleton) for name, kind, singleton in self.kinds if issubclass(cls, kind)]
+            self._kinds_by_class[cls] = kinds
+        return kinds
+
+    def added(self, sprite):
+        for name, singleton in self._kinds_for(sprite):
+            self.members[name][sprite] = None
+            self.spawned[name] += 1
+            if singleton:
+                self.singletons[name] = sprite
+
+    def removed(self, sprite):
+        for name, singleton in self._kinds_for(sprite):
+            self.members[name].pop(sprite, None)
+            if singleton and self.singletons.get(name) is sprite:
+                # Nächstes Objekt der Art übernehmen (falls es mehrere gab)
+                self.singletons[name] = next(iter(self.members[name]), None)
+
+    def set_singleton(self, name, sprite):
+        """Setzt ein benanntes Objekt, das in keiner Gruppe steckt (z.B. den Spieler)"""
+        self.singletons[name] = sprite
+
+    def get(self, name):
+        """Lebende Objekte einer Art in Einfüge-Reihenfolge (Momentaufnahme, darf beim Entfernen iteriert werden)"""
+        return tuple(self.members[name])
+
+    def singleton(self, name):
+        """Benanntes Objekt oder None (z.B. wenn der Boss besiegt ist)"""
+        return self.singletons.get(name)
+
+    def count(self, name):
+        return len(self.members[name])
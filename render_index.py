@@ -0,0 +1,129 @@
+"""
+Sichtbarkeits-Abfrage für das Zeichnen
+Level._draw_sprites zeichnet pro Ebene (brechende Plattformen, Sammelobjekte,
+PowerUps, Gegner, Projektile) nur die Sprites, die das Kamera-Rechteck plus
+RENDER_MARGIN berühren. Dafür liegt jede Ebene in einem eigenen Raster
+(RENDER_CELL_SIZE), das nachgeführt statt pro Frame neu gefüllt wird:
+
+- Zu- und Abgänge meldet die Sprite-Gruppe selbst (RegistryGroup-Beobachter),
+  auch kill(), Einsammeln und Zonen-Streaming.
+- Bewegungen meldet Level.update nur für die Sprites, die im Schritt gelaufen
+  sind (schlafende Gegner kosten nichts); ein Sprite wechselt nur dann die
+  Zellen, wenn es eine Zellgrenze überschreitet.
+
+Die Kosten des Zeichnens hängen so von den Objekten im Bild ab, nicht von allen
+im Level. Der Rand deckt Interpolation zwischen zwei Schritten und den
+Shake-Effekt brechender Plattformen ab.
+"""
+
+from settings import RENDER_CELL_SIZE
+
+
+class SpriteGrid:
+    """Raster einer Zeichenebene: Zelle -> Sprites, Treffer in Einfüge-Reihenfolge"""
+
+    def __init__(self, cell_size=RENDER_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}     # (spalte, zeile) -> {sprite: None}
+        self.placed = {}    # sprite -> (reihenfolge, zellbereich)
+        self.next_order = 0
+        self.moves = 0      # Zellwechsel seit dem Start (für Benchmarks)
+
+    def _span(self, rect):
+        size = self.cell_size
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    def _link(self, sprite, span):
+        for column in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                self.cells.setdefault((column, row), {})[sprite] = None
+
+    def _unlink(self, sprite, span):
+        for column in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                cell = self.cells[(column, row)]
+                del cell[sprite]
+                if not cell:
+                    del self.cells[(column, row)]
+
+    def added(self, sprite):
+        span = self._span(sprite.rect)
+        self.placed[sprite] = (self.next_order, span)
+        self.next_order += 1
+        self._link(sprite, span)
+
+    def removed(self, sprite):
+        entry = self.placed.pop(sprite, None)
+        if entry is not None:
+            self._unlink(sprite, entry[1])
+
+    def move(self, sprite):
+        """Nach einer Bewegung: Zellen nur anpassen, wenn sich der Zellbereich geändert hat"""
+        entry = self.placed.get(sprite)
+        if entry is None:
+            return
+        span = self._span(sprite.rect)
+        if span != entry[1]:
+            self._unlink(sprite, entry[1])
+            self._link(sprite, span)
+            self.placed[sprite] = (entry[0], span)
+            self.moves += 1
+
+    def reset(self, sprites):
+        """Ersetzt den Inhalt (für Ebenen, die als Liste statt als Gruppe vorliegen)"""
+        self.cells = {}
+        self.placed = {}
+        for sprite in sprites:
+            self.added(sprite)
+
+    def query(self, rect):
+        """Sprites, deren aktuelles Rechteck rect berührt (in Einfüge-Reihenfolge)"""
+        left, top, right, bottom = self._span(rect)
+        found = {}
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    found.update(cell)
+        placed = self.placed
+        return sorted((sprite for sprite in found if sprite.rect.colliderect(rect)),
+                      key=lambda sprite: placed[sprite][0])
+
+    def __len__(self):
+        return len(self.placed)
+
+
+class RenderIndex:
+    """Ein SpriteGrid pro Zeichenebene"""
+
+    def __init__(self, cell_size=RENDER_CELL_SIZE):
+        self.cell_size = cell_size
+        self.layers = {}    # ebene -> SpriteGrid
+        self.sources = {}   # ebene -> Sprites der Ebene (Gruppe oder Liste)
+
+    def track(self, layer, group):
+        """Führt eine Ebene nach den Zu- und Abgängen einer RegistryGroup"""
+        grid = SpriteGrid(self.cell_size)
+        grid.reset(group)
+        group.observers.append(grid)
+        self.layers[layer] = grid
+        self.sources[layer] = group
+
+    def set_layer(self, layer, sprites):
+        """Legt den Inhalt einer Ebene fest, die nicht als Gruppe vorliegt (z.B. eine Plattform-Liste)"""
+        grid = self.layers.setdefault(layer, SpriteGrid(self.cell_size))
+        grid.reset(sprites)
+        self.sources[layer] = sprites
+
+    def moved(self, layer, sprites):
+        """Meldet Sprites einer Ebene, die sich bewegt haben könnten"""
+        move = self.layers[layer].move
+        for sprite in sprites:
+            move(sprite)
+
+    def total(self, layer):
+        return len(self.layers[layer])
+
+    def visible(self, layer, rect):
+        """Sprites der Ebene, die rect berühren (in Reihenfolge der Ebene)"""
+        return self.layers[layer].query(rect)
@@ -5,11 +5,35 @@
 WIDTH = 800       # Breite des Bildschirms in Pixeln
 HEIGHT = 600      # Höhe des Bildschirms in Pixeln
 FPS = 60          # Frames per Second (30 oder 60 FPS sind üblicher Standard)
+SIMULATION_RATE = 60         # Simulationsschritte pro Sekunde (Zeiten in Frames gelten weiter bei 60 FPS)
+MAX_STEPS_PER_FRAME = 5      # Höchstens so viele Schritte nachholen, wenn ein Bild zu lange gedauert hat
+RENDER_FPS = 144             # Obergrenze für gezeichnete Bilder pro Sekunde (0 = unbegrenzt, mit VSync gibt das Display die Rate vor)
+INTERPOLATION = True         # Positionen zwischen den letzten beiden Simulationsschritten zeichnen
 USE_SCALED = True # Pygame SCALED für Retro-Pixel-Effekt
+STATIC_CHUNK_WIDTH = 800  # Breite der vorgezeichneten Chunks für statische Plattformen (= eine Zone)
+LEVEL_SCREENS = 16        # Level-Breite in Bildschirmen (breitere Levels wiederholen die mittleren Abschnitte)
+ZONE_WIDTH = 800          # Breite einer Zone in Level.load (= ein Bildschirm)
+ZONE_STREAMING = True     # Gegner, PowerUps und Sammelobjekte nur in Zonen nahe der Kamera erzeugen
+ZONE_STREAM_DISTANCE = 800  # Zonen bis zu diesem Abstand (in Pixeln) links und rechts der Kamera laden
+
+# Debug-Einstellungen
+SURFACE_AUDIT = False     # Jeden Blit auf ungünstige Pixelformate prüfen (langsamer, nur zum Debuggen)
+DEBUG_STATS = False       # Debug-Statistiken beim Start einblenden (umschalten mit F3)
 
 # Physik-Einstellungen
 GRAVITY = 0.8     # Schwerkraftskonstante
 MAX_FALL_SPEED = 15  # Maximale Fallgeschwindigkeit
+COLLISION_CELL_SIZE = 128  # Rastergröße des Kollisions-Index für Plattformen (in Pixeln)
+BROADPHASE_CELL_SIZE = 64  # Zellgröße der Broadphase für Spieler, Gegner und Projektile (in Pixeln)
+PRECISE_COLLISION = False  # Treffer pixelgenau prüfen (Masken werden pro Sprite einmal berechnet)
+NUMPY_ENEMY_PHYSICS = False  # Gegner-Physik gebündelt mit NumPy (lohnt erst bei sehr vielen Gegnern)
+ENEMY_LOD = True           # Gegner abseits der Kamera seltener bzw. gar nicht simulieren
+LOD_NEAR_MARGIN = 200      # Rand um die Kamera (in Pixeln): Gegner darin laufen jeden Schritt
+LOD_MIDDLE_MARGIN = 1200   # Rand um die Kamera (in Pixeln): Gegner darin laufen seltener, dahinter schlafen sie
+LOD_MIDDLE_INTERVAL = 4    # Mittlerer Ring: nur jeder n-te Schritt, dafür n-fach lang
+RENDER_CULLING = True      # Nur Sprites im Bild (plus RENDER_MARGIN) zeichnen, per räumlichem Hash
+RENDER_MARGIN = 32         # Rand um die Kamera beim Zeichnen (in Pixeln, deckt Interpolation und Shake ab)
+RENDER_CELL_SIZE = 128     # Zellgröße des Hashes für die Zeichenebenen (in Pixeln)
 
 # Spieler-Einstellungen
 PLAYER_LIVES = 3                  # Anzahl Leben
@@ -35,7 +59,7 @@ ENEMY_SPEED = 1                    # Standard-Geschwindigkeit der Gegner
 ENEMY_HEALTH = 3                 # Standard-Gesundheit
 BOSS_HEALTH = 5                  # Gesundheit des Bosses
 BOSS_ATTACK_COOLDOWN = 1200             # Cooldown zwischen Boss-Angriffen (in Frames)
-BOSS_ATTACK_COOLDOWN_SYNTAXSCREAM = 3000*5
+BOSS_ATTACK_COOLDOWN_SYNTAXSCREAM = 15 * FPS  # Cooldown des Syntax-Schreis (in Frames, 15 Sekunden)
 BOSS_SHOOTING_RADIUS = 400
 PLAYER_SCREAM_DURATION = 2 * FPS  # Dauer des Player-Screams (in Frames, 2 Sekunden bei 60 FPS)
 BOSS_SCREAM_RADIUS = 100 #Boss Schrei bei Spieler Nähe
@@ -62,4 +86,10 @@ COLOR_BACKGROUND = COLOR_BLACK
 
 # Pfade
 IMAGE_FOLDER = "images"
-SOUND_FOLDER = "sounds" 
\ No newline at end of file
+SOUND_FOLDER = "sounds"
+ASSET_PACK_FILE = "images/assets.pack"  # Vorgebackene Sprites (python asset_pack.py)
+USE_ASSET_PACK = True                   # Asset-Pack verwenden, falls vorhanden und aktuell
+ASSET_LOADER_THREADS = None             # Threads zum Vorladen der Bilder (None = Anzahl CPU-Kerne)
+LEVEL_BUILD_BUDGET = 0.004              # Sekunden pro Frame für den Level-Aufbau im Hauptthread (ein Schritt kann länger dauern)
+TRANSFORM_CACHE_BYTES = 8 * 1024 * 1024  # Budget für gespiegelte/skalierte Sprite-Varianten (LRU)
+STARTUP_PROFILE_FILE = "startup_profile.json"  # Ausgabe des Start-Profilers (--profile-startup)
@@ -0,0 +1,189 @@
+"""
+Start-Profiler
+Zeigt, wohin die Startzeit geht: Importzeit pro Modul, Ladezeit pro Asset,
+Phasen von Game/Level und die Zeit bis zum ersten pygame.display.flip.
+Die Tabelle wird beim ersten Frame ausgegeben und als JSON gespeichert; alles,
+was danach noch passiert (z.B. der Level-Aufbau im Hintergrund), wird beim
+Beenden nachgetragen.
+
+Einschalten: FDF_PROFILE_STARTUP=1 oder python pygame_FoerdeDerFurcht.py --profile-startup
+Ohne Aktivierung kosten die Messpunkte nur einen Funktionsaufruf.
+"""
+
+import atexit
+import builtins
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from settings import STARTUP_PROFILE_FILE
+
+ENV_VAR = "FDF_PROFILE_STARTUP"
+CLI_FLAG = "--profile-startup"
+
+# Zeitpunkt Null: Import dieses Moduls (als erstes im Hauptmodul)
+_start = time.perf_counter()
+_enabled = False
+_events = []        # Alle Messungen in zeitlicher Reihenfolge (siehe _record)
+_reported = 0       # Anzahl der Messungen, die schon in einer Tabelle ausgegeben wurden
+_first_flip_ms = None
+_original_import = None
+_lock = threading.Lock()
+_import_depth = threading.local()  # Verschachtelungstiefe der Importe pro Thread
+
+
+def _now_ms():
+    return (time.perf_counter() - _start) * 1000
+
+
+def _record(kind, name, start_ms, duration_ms, **extra):
+    event = {
+        "kind": kind,
+        "name": name,
+        "start_ms": round(start_ms, 2),
+        "duration_ms": round(duration_ms, 2),
+        "thread": threading.current_thread().name,
+    }
+    event.update(extra)
+    with _lock:
+        _events.append(event)
+
+
+def enable():
+    """Schaltet den Profiler ein und misst ab jetzt auch alle Modul-Importe"""
+    global _enabled, _original_import
+    if _enabled:
+        return
+    _enabled = True
+    _original_import = builtins.__import__
+    builtins.__import__ = _profiled_import
+    atexit.register(_report_remaining)
+
+
+def enable_from_environment():
+    """Schaltet den Profiler ein, falls Umgebungsvariable oder CLI-Flag gesetzt sind"""
+    if CLI_FLAG in sys.argv:
+        sys.argv.remove(CLI_FLAG)
+        enable()
+    elif os.environ.get(ENV_VAR, "") not in ("", "0"):
+        enable()
+    return _enabled
+
+
+def is_enabled():
+    return _enabled
+
+
+def _profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """Ersatz für __import__: misst nur den ersten (echten) Import eines Moduls"""
+    if level != 0 or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+    depth = getattr(_import_depth, "value", 0)
+    _import_depth.value = depth + 1
+    start_ms = _now_ms()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _import_depth.value = depth
+        # Inklusive aller Module, die dabei zum ersten Mal mitgeladen wurden
+        _record("import", name, start_ms, _now_ms() - start_ms, depth=depth)
+
+
+@contextmanager
+def phase(name):
+    """Misst einen Abschnitt: with startup_profiler.phase("Fonts"): ..."""
+    if not _enabled:
+        yield
+        return
+    start_ms = _now_ms()
+    try:
+        yield
+    finally:
+        _record("phase", name, start_ms, _now_ms() - start_ms)
+
+
+def profiled(name):
+    """Dekorator-Variante von phase() für ganze Methoden"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_asset(path, seconds, source):
+    """Trägt die Ladezeit eines Bildes ein (source: "png", "pack", ...)"""
+    if _enabled:
+        duration_ms = seconds * 1000
+        _record("asset", path, _now_ms() - duration_ms, duration_ms, source=source)
+
+
+def first_flip():
+    """Beim ersten pygame.display.flip aufrufen: gibt die Tabelle aus und schreibt das JSON"""
+    global _first_flip_ms
+    if not _enabled or _first_flip_ms is not None:
+        return
+    _first_flip_ms = _now_ms()
+    _record("mark", "Erster Frame (display.flip)", _first_flip_ms, 0.0)
+    print_report("Startprofil bis zum ersten Frame")
+    save()
+
+
+def _report_remaining():
+    """Beim Beenden: Messungen nach dem ersten Frame nachtragen"""
+    if _reported < len(_events):
+        print_report("Startprofil nach dem ersten Frame")
+    save()
+
+
+def print_report(title):
+    """Gibt alle noch nicht ausgegebenen Messungen als Tabelle aus"""
+    global _reported
+    with _lock:
+        events = _events[_reported:]
+        _reported = len(_events)
+
+    print(f"\n== {title} ==")
+    sections = (("import", "Importe"), ("asset", "Assets"), ("phase", "Phasen"), ("mark", "Marken"))
+    for kind, label in sections:
+        rows = [e for e in events if e["kind"] == kind]
+        if not rows:
+            continue
+        print(f"  {label}:")
+        if kind == "import":
+            # Importe nach Dauer sortieren - die teuersten zuerst
+            rows = sorted(rows, key=lambda e: -e["duration_ms"])[:15]
+        for e in rows:
+            extra = f" [{e['source']}]" if "source" in e else ""
+            thread = "" if e["thread"] == "MainThread" else f" ({e['thread']})"
+            print(f"    {e['start_ms']:8.1f} ms  {e['duration_ms']:8.1f} ms  {e['name']}{extra}{thread}")
+    if _first_flip_ms is not None:
+        print(f"  Zeit bis zum ersten Frame: {_first_flip_ms:.0f} ms")
+
+
+def get_report():
+    """Gibt alle Messungen als Dictionary zurück (Inhalt der JSON-Datei)"""
+    with _lock:
+        events = list(_events)
+    return {
+        "first_flip_ms": _first_flip_ms,
+        # Nur äußerste Importe zählen, verschachtelte stecken schon darin
+        "import_ms_total": round(sum(e["duration_ms"] for e in events
+                                     if e["kind"] == "import" and e["depth"] == 0), 2),
+        "events": events,
+    }
+
+
+def save(path=None):
+    """Speichert das Profil als JSON"""
+    path = path or STARTUP_PROFILE_FILE
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(get_report(), f, indent=2, ensure_ascii=False)
+    print(f"Startprofil gespeichert: {path}")
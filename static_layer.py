@@ -0,0 +1,129 @@
+"""
+Statische Geometrie-Ebene
+Alle unbeweglichen Plattformen und der Boden werden beim Laden des Levels in
+Chunks fester Breite (STATIC_CHUNK_WIDTH, passend zu den Zonen in Level.load)
+vorgezeichnet. Pro Frame sind dann höchstens zwei Blits für die gesamte
+statische Geometrie nötig - unabhängig von der Anzahl der Plattformen.
+Brechende Plattformen bleiben dynamisch und werden weiterhin einzeln gezeichnet.
+
+Bei sehr breiten Levels (Zonen-Streaming, siehe zones.py) werden nur die Chunks
+um die Kamera vorgehalten (retain); die übrigen werden erst bei Bedarf gezeichnet.
+"""
+
+import pygame
+import assets
+import surface_audit
+from settings import STATIC_CHUNK_WIDTH
+
+
+class StaticLayer:
+    """Vorgezeichnete Chunks der statischen Plattformen eines Levels"""
+
+    def __init__(self, level_width, chunk_width=STATIC_CHUNK_WIDTH):
+        self.level_width = level_width
+        self.chunk_width = chunk_width
+        # Pro Chunk: (surface, zielposition im Level) oder None (leer bzw. noch nicht gezeichnet)
+        self.chunks = []
+        self.chunk_platforms = []  # Pro Chunk: die statischen Plattformen darin
+        self.colorkey = None
+        self.dirty = True
+
+    @staticmethod
+    def is_static(platform):
+        """Statisch sind alle Plattformen, die sich nie verändern"""
+        return getattr(platform, "is_static", False)
+
+    def build(self, platforms, eager=True):
+        """Ordnet die statischen Plattformen den Chunks zu (bei Level-Änderung erneut aufrufen)
+
+        eager: alle Chunks sofort zeichnen, sonst erst bei retain() bzw. beim Zeichnen
+        """
+        static_platforms = [p for p in platforms if self.is_static(p)]
+        chunk_count = max(1, -(-self.level_width // self.chunk_width))  # Aufrunden
+        self.chunk_platforms = [[] for _ in range(chunk_count)]
+        for platform in static_platforms:
+            first = max(0, platform.rect.left // self.chunk_width)
+            last = min(chunk_count - 1, (platform.rect.right - 1) // self.chunk_width)
+            for index in range(first, last + 1):
+                self.chunk_platforms[index].append(platform)
+
+        # Deckende Plattformen ergeben Chunks mit harten Kanten: Colorkey mit RLE, das
+        # überspringt die leeren Bereiche beim Blitten. Die Farbe wird einmal für alle
+        # Plattformbilder gesucht, nicht pro Chunk.
+        images = list({id(p.image): p.image for p in static_platforms}.values())
+        self.colorkey = None
+        if not any(surface_audit.has_pixel_alpha(image) for image in images):
+            self.colorkey = assets.find_colorkey(images)
+
+        self.chunks = [None] * chunk_count
+        if eager:
+            for index in range(chunk_count):
+                self._render_chunk(index)
+
+        self.dirty = False
+        used = sum(1 for chunk_platforms in self.chunk_platforms if chunk_platforms)
+        print(f"Statische Ebene gebaut: {len(static_platforms)} Plattformen in {used} Chunks "
+              f"à {self.chunk_width} px")
+
+    def _render_chunk(self, index):
+        """Zeichnet einen Chunk vor (leere Chunks bleiben None)"""
+        chunk_platforms = self.chunk_platforms[index]
+        if not chunk_platforms:
+            return
+        chunk_x = index * self.chunk_width
+        colorkey = self.colorkey
+
+        # Chunk nur so hoch wie die enthaltene Geometrie (spart Speicher)
+        top = min(p.rect.top for p in chunk_platforms)
+        bottom = max(p.rect.bottom for p in chunk_platforms)
+        size = (self.chunk_width, bottom - top)
+        if colorkey is not None:
+            surface = pygame.Surface(size).convert()
+            surface.fill(colorkey)
+        else:
+            surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        for platform in chunk_platforms:
+            surface.blit(platform.image, (platform.rect.x - chunk_x, platform.rect.y - top))
+        if colorkey is not None:
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        else:
+            surface.set_alpha(255, pygame.RLEACCEL)
+        self.chunks[index] = (surface, (chunk_x, top))
+
+    def retain(self, left, right):
+        """Hält nur die Chunks zwischen left und right (Level-Koordinaten) vorgezeichnet"""
+        first = max(0, left // self.chunk_width)
+        last = min(len(self.chunks) - 1, (right - 1) // self.chunk_width)
+        for index in range(len(self.chunks)):
+            if first <= index <= last:
+                if self.chunks[index] is None:
+                    self._render_chunk(index)
+            else:
+                self.chunks[index] = None
+
+    def rendered_bytes(self):
+        """Speicher der gerade vorgezeichneten Chunks (für Benchmarks)"""
+        return sum(surface.get_bytesize() * surface.get_width() * surface.get_height()
+                   for surface, _ in filter(None, self.chunks))
+
+    def invalidate(self):
+        """Markiert die Chunks als veraltet (z.B. nach Änderung der Plattformen)"""
+        self.dirty = True
+
+    def draw(self, screen, camera):
+        """Zeichnet die sichtbaren Chunks (bei Chunkbreite >= Bildschirmbreite höchstens zwei)"""
+        view = camera.camera_rect
+        first = max(0, view.left // self.chunk_width)
+        last = min(len(self.chunks) - 1, (view.right - 1) // self.chunk_width)
+        blits = 0
+        for index in range(first, last + 1):
+            chunk = self.chunks[index]
+            if chunk is None:
+                if not self.chunk_platforms[index]:
+                    continue
+                self._render_chunk(index)  # Außerhalb der vorgehaltenen Chunks: jetzt zeichnen
+                chunk = self.chunks[index]
+            surface, (x, y) = chunk
+            screen.blit(surface, (x - view.x, y - view.y))
+            blits += 1
+        return blits
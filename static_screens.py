@@ -0,0 +1,63 @@
+"""
+Vorgezeichnete Bildschirme für Hauptmenü, Optionen, Game Over und Level-Sieg
+Diese Bildschirme ändern sich pro Frame kaum: Hintergrund, Panels, Schatten
+und die meisten Texte bleiben gleich, nur der Button unter der Maus, das
+hereinfahrende Menü-Panel und die Endwerte (Punkte, CP, ...) sind dynamisch.
+Der statische Teil wird deshalb einmal in eine bildschirmgroße Surface
+gezeichnet (beim ersten Anzeigen bzw. nach einer Änderung der Auflösung) und
+danach pro Frame nur noch geblittet; die dynamischen Teile kommen darüber.
+
+Gerenderte Texte der dynamischen Teile liegen ebenfalls hier, damit auch
+Hover und Endwerte ohne font.render pro Frame auskommen.
+"""
+
+import pygame
+import assets
+import debug_stats
+
+MAX_TEXTS = 64  # Gerenderte Texte, bevor der Text-Cache geleert wird (z.B. viele verschiedene Endstände)
+
+
+class StaticScreens:
+    """Vorgezeichnete Hintergründe nach Name und Bildschirmgröße, dazu gerenderte Texte"""
+
+    def __init__(self):
+        self.surfaces = {}  # (name, größe) -> Surface
+        self.texts = {}     # (font, text, farbe, alpha) -> Surface
+        self.builds = 0     # Neu gezeichnete Hintergründe seit dem Start (für Benchmarks)
+
+    def get(self, name, size, build):
+        """Hintergrund name in der Größe size; build(surface) zeichnet ihn beim ersten Aufruf"""
+        key = (name, size)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            # Wie Game.draw auf Schwarz beginnen, damit halbtransparente Ebenen gleich aussehen
+            surface = assets.to_display_format(pygame.Surface(size), alpha=False)
+            surface.fill((0, 0, 0))
+            build(surface)
+            self.surfaces[key] = surface
+            self.builds += 1
+            debug_stats.count("Bildschirm-Neuaufbau")
+        return surface
+
+    def text(self, font, text, color, alpha=None):
+        """font.render(text, True, color), optional mit Surface-Alpha (z.B. für Textschatten)"""
+        key = (font, text, color, alpha)
+        surface = self.texts.get(key)
+        if surface is None:
+            if len(self.texts) >= MAX_TEXTS:
+                self.texts.clear()
+            surface = font.render(text, True, color)
+            if alpha is not None:
+                surface.set_alpha(alpha)
+            self.texts[key] = surface
+        return surface
+
+    def invalidate(self, name=None):
+        """Hintergründe neu zeichnen lassen (alle oder nur die eines Bildschirms)"""
+        if name is None:
+            self.surfaces.clear()
+            self.texts.clear()
+        else:
+            for key in [key for key in self.surfaces if key[0] == name]:
+                del self.surfaces[key]
@@ -0,0 +1,119 @@
+"""
+Surface-Auditor (Debug)
+Prüft im Debug-Modus jeden Blit auf den Bildschirm: Quell-Surfaces, deren
+Pixelformat vom Display abweicht oder die einen Alpha-Kanal ohne durchsichtige
+Pixel tragen, werden einmal pro Erzeuger gemeldet. Solche Surfaces muss SDL bei
+jedem Blit Pixel für Pixel umrechnen bzw. mischen.
+
+Einschalten: SURFACE_AUDIT = True in settings.py oder FDF_SURFACE_AUDIT=1
+"""
+
+import os
+import sys
+import weakref
+import pygame
+from settings import SURFACE_AUDIT
+
+ENV_VAR = "FDF_SURFACE_AUDIT"
+
+_enabled = SURFACE_AUDIT or os.environ.get(ENV_VAR, "") not in ("", "0")
+
+# Surface -> Beschreibung des Erzeugers (z.B. Bildpfad), nur im Debug-Modus gefüllt
+_creators = weakref.WeakKeyDictionary()
+
+# Surface -> gefundene Probleme (jede Surface wird nur einmal untersucht)
+_verdicts = weakref.WeakKeyDictionary()
+
+# Bereits gemeldete (erzeuger, problem)-Paare
+_reported = set()
+
+
+def is_enabled():
+    return _enabled
+
+
+def has_pixel_alpha(surface):
+    """Prüft, ob eine Surface einen Alpha-Kanal pro Pixel hat (set_alpha() zählt nicht)"""
+    return surface.get_masks()[3] != 0
+
+
+def has_used_alpha(surface):
+    """Prüft, ob eine Surface tatsächlich (teil-)durchsichtige Pixel hat"""
+    if not has_pixel_alpha(surface):
+        return False
+    width, height = surface.get_size()
+    # Maske mit Schwelle 254: gesetzt sind nur vollständig deckende Pixel
+    return pygame.mask.from_surface(surface, 254).count() != width * height
+
+
+def describe_format(surface):
+    """Kurzbeschreibung des Pixelformats für Meldungen"""
+    alpha = "+Alpha" if has_pixel_alpha(surface) else ""
+    masks = "/".join(f"{mask:x}" for mask in surface.get_masks()[:3])
+    return f"{surface.get_bitsize()} Bit {masks}{alpha}"
+
+
+def find_problems(source, target):
+    """Gibt die Gründe zurück, warum source nicht ohne Umrechnung auf target geblittet wird"""
+    problems = []
+    if (source.get_bytesize() != target.get_bytesize()
+            or source.get_masks()[:3] != target.get_masks()[:3]):
+        problems.append(f"Pixelformat {describe_format(source)} statt {describe_format(target)}")
+    if has_pixel_alpha(source) and not has_used_alpha(source):
+        problems.append("Alpha-Kanal ohne durchsichtige Pixel (convert() statt convert_alpha())")
+    return tuple(problems)
+
+
+def register(surface, creator):
+    """Merkt sich den Erzeuger einer Surface für spätere Meldungen (nur im Debug-Modus)"""
+    if _enabled:
+        _creators[surface] = creator
+    return surface
+
+
+def audit(source, target, frame):
+    """Prüft einen Blit und meldet jedes Problem einmal pro Erzeuger"""
+    problems = _verdicts.get(source)
+    if problems is None:
+        problems = find_problems(source, target)
+        _verdicts[source] = problems
+    if not problems:
+        return
+
+    creator = _creators.get(source)
+    if creator is None:
+        # Unbekannte Surface: Stelle des Blits als Erzeuger angeben
+        code = frame.f_code
+        creator = f"{os.path.basename(code.co_filename)}:{frame.f_lineno} ({code.co_name})"
+    for problem in problems:
+        if (creator, problem) not in _reported:
+            _reported.add((creator, problem))
+            print(f"Surface-Audit: {creator} [{source.get_width()}x{source.get_height()}]: {problem}")
+
+
+def get_report():
+    """Alle bisher gemeldeten (erzeuger, problem)-Paare"""
+    return sorted(_reported)
+
+
+class AuditSurface(pygame.Surface):
+    """Zeichenfläche im Displayformat, die jeden Blit prüft (ersetzt im Debug-Modus den Bildschirm)"""
+
+    def __init__(self, display):
+        super().__init__(display.get_size(), 0, display)
+        self.display = display
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        audit(source, self, sys._getframe(1))
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        frame = sys._getframe(1)
+        for item in blit_sequence:
+            audit(item[0], self, frame)
+        return super().blits(blit_sequence, doreturn)
+
+    def present(self):
+        """Überträgt das fertige Bild auf das echte Display"""
+        self.display.blit(self, (0, 0))
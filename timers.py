@@ -0,0 +1,107 @@
+"""
+Hierarchisches Timer-Rad für alle Spiel-Timer
+Statt dass jedes Objekt in jedem Frame seine Zähler herunterzählt, meldet es
+beim Start einer Dauer (Unverwundbarkeit, PowerUp, Betäubung, Cooldown, ...)
+einen Callback an, der nach der Dauer aufgerufen wird. Objekte ohne laufende
+Dauer kosten so nichts pro Frame.
+
+Die Zeit zählt in Simulationsschritten zu einem Frame bei 60 FPS (wie alle
+Zeiten in settings.py). Das Level schiebt das Rad in Level.update weiter:
+im Menü oder bei Game Over steht die Zeit still, und mit advance(n) lassen
+sich alle Dauern gleichmäßig vorspulen.
+
+Aufbau: LEVELS Ebenen mit je SLOTS Fächern; Ebene k fasst Timer, die in
+weniger als SLOTS**(k+1) Schritten ablaufen. Läuft die untere Ebene einmal
+um, werden die Timer des nächsten Fachs der Ebene darüber neu einsortiert.
+"""
+
+import math
+
+SLOTS = 64
+LEVELS = 4   # 64**4 Schritte = gut 77 Stunden bei 60 FPS, längere Timer werden neu einsortiert
+
+
+class Timer:
+    """Handle eines angemeldeten Timers (zum Abbrechen und für die Restzeit)"""
+    __slots__ = ("wheel", "expires", "callback", "cancelled")
+
+    def __init__(self, wheel, expires, callback):
+        self.wheel = wheel
+        self.expires = expires
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        """Bricht den Timer ab (der Callback wird nicht mehr aufgerufen)"""
+        if not self.cancelled and self.expires > self.wheel.now:
+            self.wheel.pending -= 1
+        self.cancelled = True
+
+    def active(self):
+        """Läuft der Timer noch?"""
+        return not self.cancelled and self.expires > self.wheel.now
+
+    def remaining(self):
+        """Verbleibende Schritte (0, wenn abgelaufen oder abgebrochen)"""
+        return self.expires - self.wheel.now if self.active() else 0
+
+
+class TimerWheel:
+    """Timer-Rad eines Levels (Zeit in Schritten zu einem Frame bei 60 FPS)"""
+
+    def __init__(self):
+        self.now = 0          # Aktueller Schritt
+        self.fraction = 0.0   # Angefangener Schritt (bei dt, das kein ganzer Schritt ist)
+        self.pending = 0      # Angemeldete, noch nicht abgelaufene Timer
+        self.fired = 0        # Beim letzten advance() aufgerufene Callbacks
+        self.wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+
+    def schedule(self, delay, callback):
+        """Ruft callback() nach delay Schritten auf (mindestens im nächsten Schritt)"""
+        timer = Timer(self, self.now + max(1, math.ceil(delay)), callback)
+        self._insert(timer)
+        self.pending += 1
+        return timer
+
+    def _insert(self, timer):
+        """Sortiert einen Timer in das Fach seiner Ablaufzeit ein"""
+        delta = timer.expires - self.now
+        for level in range(LEVELS):
+            if delta < SLOTS ** (level + 1):
+                self.wheels[level][(timer.expires // SLOTS ** level) % SLOTS].append(timer)
+                return
+        # Weiter als das ganze Rad: ins entfernteste Fach, wird beim Umlauf neu einsortiert
+        level = LEVELS - 1
+        self.wheels[level][(self.now // SLOTS ** level - 1) % SLOTS].append(timer)
+
+    def advance(self, dt=1.0):
+        """Schiebt die Zeit um dt Schritte weiter und ruft alle fälligen Callbacks auf"""
+        self.fired = 0
+        self.fraction += dt
+        while self.fraction >= 1.0:
+            self.fraction -= 1.0
+            self._step()
+        return self.fired
+
+    def _step(self):
+        self.now += 1
+        # Obere Ebenen zuerst: ihre Timer landen evtl. im gerade umlaufenden Fach darunter
+        for level in range(LEVELS - 1, 0, -1):
+            if self.now % SLOTS ** level == 0:
+                slot = (self.now // SLOTS ** level) % SLOTS
+                timers, self.wheels[level][slot] = self.wheels[level][slot], []
+                for timer in timers:
+                    if not timer.cancelled:
+                        self._insert(timer)
+
+        slot = self.now % SLOTS
+        timers, self.wheels[0][slot] = self.wheels[0][slot], []
+        for timer in timers:
+            if timer.cancelled:
+                continue
+            if timer.expires > self.now:
+                self._insert(timer)  # Über das Rad hinaus angemeldet, noch nicht fällig
+                continue
+            self.pending -= 1
+            self.fired += 1
+            timer.callback()
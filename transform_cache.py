@@ -0,0 +1,183 @@
+"""
+Transform-Cache für abgeleitete Sprites
+Gespiegelte, skalierte oder anders abgeleitete Varianten eines Sprites werden
+einmal erzeugt und danach geteilt. Schlüssel ist (quell-surface, operation,
+parameter); verdrängt wird nach LRU, sobald die Varianten zusammen mehr als
+TRANSFORM_CACHE_BYTES belegen. Im laufenden Spiel fallen so keine
+pygame.transform-Aufrufe mehr an (siehe python benchmark.py transform_cache).
+
+Effekt-Varianten (Einfrier-Tint der Gegner, PowerUp-Umrandung und
+Betäubungs-Overlay des Spielers) hängen genauso an der Quelle: pro
+(Animationsbild, Effekt, Farben) einmal erzeugt, bis das Bild wechselt. Die
+Umrandung wird vormultipliert zusammengesetzt und mit BLEND_PREMULTIPLIED
+gezeichnet, alle anderen Varianten mit einem normalen Blit.
+"""
+
+import threading
+from collections import OrderedDict
+import pygame
+import debug_stats
+from settings import TRANSFORM_CACHE_BYTES
+
+# (quelle, operation, parameter) -> abgeleitete Surface, älteste zuerst
+_cache = OrderedDict()
+_bytes = 0
+_budget = TRANSFORM_CACHE_BYTES
+
+# Der LevelLoader baut Level im Hauptthread fertig; die Sperre sichert trotzdem jeden Zugriff ab
+_lock = threading.RLock()
+
+# Statistiken zur Kontrolle (z.B. 0 Fehlschläge im laufenden Spiel)
+_stats = {
+    "hits": 0,
+    "misses": 0,        # = Anzahl der tatsächlich ausgeführten Transformationen
+    "evictions": 0,
+    "evicted_bytes": 0,
+}
+
+
+def surface_bytes(surface):
+    """Speicherbedarf der Pixeldaten einer Surface"""
+    return surface.get_pitch() * surface.get_height()
+
+
+def get(source, operation, params, create):
+    """Gibt die abgeleitete Surface zurück; create() wird nur beim ersten Mal aufgerufen"""
+    global _bytes
+    key = (source, operation, params)
+    with _lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return result
+
+        _stats["misses"] += 1
+        debug_stats.count("Neue Sprite-Varianten")
+        result = create()
+        size = surface_bytes(result)
+        if size > _budget:
+            return result  # Größer als das ganze Budget: nicht cachen
+        _cache[key] = result
+        _bytes += size
+        _evict()
+        return result
+
+
+def _evict():
+    """Verdrängt die am längsten nicht benutzten Varianten, bis das Budget passt"""
+    global _bytes
+    while _bytes > _budget and _cache:
+        _, surface = _cache.popitem(last=False)
+        size = surface_bytes(surface)
+        _bytes -= size
+        _stats["evictions"] += 1
+        _stats["evicted_bytes"] += size
+
+
+def flip(surface, flip_x, flip_y):
+    """Gespiegelte Variante (wie pygame.transform.flip)"""
+    return get(surface, "flip", (flip_x, flip_y),
+               lambda: pygame.transform.flip(surface, flip_x, flip_y))
+
+
+def scale(surface, size):
+    """Skalierte Variante (wie pygame.transform.scale)"""
+    size = tuple(size)
+    return get(surface, "scale", size, lambda: pygame.transform.scale(surface, size))
+
+
+def smoothscale(surface, size):
+    """Weich skalierte Variante (wie pygame.transform.smoothscale)"""
+    size = tuple(size)
+    return get(surface, "smoothscale", size, lambda: pygame.transform.smoothscale(surface, size))
+
+
+def _tint(surface, color, alpha):
+    """Legt color mit Deckkraft alpha über die sichtbaren Pixel, das Alpha der Quelle bleibt
+
+    Pro Farbkanal: rgb * (1 - alpha) + color * alpha.
+    """
+    keep = 255 - alpha
+    result = surface.copy()
+    result.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+    result.fill([channel * alpha // 255 for channel in color[:3]], special_flags=pygame.BLEND_RGB_ADD)
+    return result
+
+
+def tinted(surface, color, alpha):
+    """Mit einer Farbe überzogene Variante (z.B. eingefrorene Gegner)"""
+    return get(surface, "tint", (tuple(color), alpha), lambda: _tint(surface, color, alpha))
+
+
+def outline(surface, colors):
+    """Leuchtende Umrandung (ohne das Sprite selbst), eine Farbe pro Ring von innen nach außen
+
+    Ring i liegt i+1 Pixel um die Maske des Sprites (8 Richtungen) mit Deckkraft 120 - i*20.
+    Die Surface ist um len(colors) Pixel pro Seite größer: an Position - len(colors) zeichnen.
+    Die Pixel sind vormultipliert: mit special_flags=pygame.BLEND_PREMULTIPLIED zeichnen.
+    """
+    colors = tuple(tuple(color) for color in colors)
+
+    def create():
+        margin = len(colors)
+        width, height = surface.get_size()
+        result = pygame.Surface((width + 2 * margin, height + 2 * margin), pygame.SRCALPHA)
+        result.fill((0, 0, 0, 0))
+        mask = pygame.mask.from_surface(surface)
+        # Vormultipliert übereinanderlegen: ergibt dasselbe wie die einzelnen Ringe direkt auf dem Bild
+        for i, color in enumerate(colors):
+            alpha = 120 - i * 20  # Mehrere Umrandungen werden schwächer
+            ring = mask.to_surface(setcolor=[channel * alpha // 255 for channel in color[:3]] + [alpha],
+                                   unsetcolor=(0, 0, 0, 0))
+            offset = i + 1
+            for dx in (-offset, 0, offset):
+                for dy in (-offset, 0, offset):
+                    if dx or dy:
+                        result.blit(ring, (margin + dx, margin + dy), special_flags=pygame.BLEND_PREMULTIPLIED)
+        return result
+    return get(surface, "outline", colors, create)
+
+
+def overlay(surface, color):
+    """Einfarbige, halbtransparente Fläche in der Größe des Sprites (z.B. Betäubung)"""
+    color = tuple(color)
+
+    def create():
+        result = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        result.fill(color)
+        return result
+    return get(surface, "overlay", color, create)
+
+
+def set_budget(budget):
+    """Ändert das Byte-Budget (verdrängt sofort, falls nötig)"""
+    global _budget
+    with _lock:
+        _budget = budget
+        _evict()
+
+
+def get_stats():
+    """Gibt eine Kopie der Statistiken zurück"""
+    with _lock:
+        stats = dict(_stats)
+        stats["cached_surfaces"] = len(_cache)
+        stats["cached_bytes"] = _bytes
+        stats["budget_bytes"] = _budget
+    return stats
+
+
+def reset_stats():
+    """Setzt die Zähler zurück (der Cache selbst bleibt erhalten)"""
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def clear():
+    """Leert den Cache (z.B. nach einem Wechsel des Display-Formats)"""
+    global _bytes
+    with _lock:
+        _cache.clear()
+        _bytes = 0
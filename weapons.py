@@ -1,4 +1,6 @@
 import pygame
+import assets
+import transform_cache
 from settings import (WIDTH, HEIGHT, WEAPON_COOLDOWN, BUBBLE_SPEED, BUBBLE_LIFETIME, 
                       COLOR_BLUE, COLOR_BUBBLE, BUBBLE_RISE_SPEED, BUBBLE_AUTO_RISE_DELAY,
                       BUBBLE_SPAWN_DISTANCE)
@@ -6,11 +8,11 @@ from settings import (WIDTH, HEIGHT, WEAPON_COOLDOWN, BUBBLE_SPEED, BUBBLE_LIFET
 class Weapon:
     def __init__(self, owner):
         self.owner = owner
-        self.cooldown = 0
+        self.ready = True  # Wird nach dem Schuss vom Timer-Rad des Besitzers zurückgesetzt
         self.max_cooldown = WEAPON_COOLDOWN
 
     def fire(self, projectiles_group):
-        if self.cooldown <= 0:
+        if self.ready:
             # Schießrichtung vom Player übernehmen (falls verfügbar)
             if hasattr(self.owner, 'shoot_direction'):
                 direction = self.owner.shoot_direction
@@ -32,14 +34,14 @@ class Weapon:
                 level_width=self.owner.level_width  # Level-Breite übergeben
             )
             projectiles_group.add(bubble)
-            self.cooldown = self.max_cooldown
+            self.ready = False
+            self.owner.timers.schedule(self.max_cooldown, self._reload)
             return bubble
         return None
     
-    def update(self):
-        # Cooldown verringern
-        if self.cooldown > 0:
-            self.cooldown -= 1
+    def _reload(self):
+        # Cooldown abgelaufen
+        self.ready = True
 
 class Projectile(pygame.sprite.Sprite):
     def __init__(self, x, y, sprite):
@@ -48,32 +50,36 @@ class Projectile(pygame.sprite.Sprite):
         if sprite is None:
             self.image.fill(COLOR_BLUE)
         self.rect = self.image.get_rect(center=(x, y))
+        self.previous_rect = self.rect.copy()  # Position vor dem letzten Schritt (für hit_rect)
         self.velocity = pygame.math.Vector2(0, -5)
 
+    def hit_rect(self):
+        """Rechteck für Treffer: bei Schritten größer als das Projektil der überstrichene Bereich"""
+        # Sonst könnte ein schnelles Projektil (oder ein Schritt bei 30 Hz) über ein Ziel hinwegspringen
+        previous = self.previous_rect
+        if abs(self.rect.x - previous.x) > self.rect.width or abs(self.rect.y - previous.y) > self.rect.height:
+            return self.rect.union(previous)
+        return self.rect
+
     def update(self, *args, **kwargs):
         # Die Logik zum Entfernen außerhalb des Bildschirms wird jetzt
         # von der Bubble-Klasse selbst gehandhabt, da diese die Kamera
         # berücksichtigen muss.
+        self.previous_rect = self.rect.copy()
         self.rect.move_ip(self.velocity)
         # HINWEIS: Das Entfernen des Projektils außerhalb des Levels
         # (nicht nur des Bildschirms) wird jetzt in der Bubble-Klasse gemacht.
 
 class Bubble(Projectile):
+    # Geteilte Bilder aller Blasen: (normale Blase, große Blase als Basis für Gefangene)
+    _shared_images = None
+    _pop_image = None
+
     def __init__(self, x, y, direction=1, captured_enemy=None, level_width=WIDTH):
         super().__init__(x, y, None)
         
-        # Versuche bubble.png zu laden
-        try:
-            self.base_image = pygame.image.load("images/bubble.png").convert_alpha()
-            # Skaliere auf passende Größe (20x20 für normale Blase)
-            self.image = pygame.transform.scale(self.base_image, (20, 20))
-            print("Bubble-Sprite geladen: images/bubble.png")
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"Bubble-Sprite 'bubble.png' konnte nicht geladen werden: {e}")
-            # Fallback: Gezeichnete Blase
-            self.base_image = None
-            self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, COLOR_BUBBLE, (10, 10), 10, 2)
+        # Bilder werden von allen Blasen geteilt, auch das Fang-Bild (siehe transform_cache)
+        self.image, self.base_image = self.shared_images()
         
         self.rect = self.image.get_rect(center=(x, y))
         self.velocity = pygame.math.Vector2(direction * BUBBLE_SPEED, 0)  # Horizontale Bewegung
@@ -84,24 +90,53 @@ class Bubble(Projectile):
         self.is_popping = False  # Flag für Platzen-Zustand
         self.level_width = level_width
         
-    def update(self, camera=None):
+    @classmethod
+    def shared_images(cls):
+        """Lädt die Blasen-Bilder einmal für alle Blasen"""
+        if Bubble._shared_images is None:
+            try:
+                # Skaliere auf passende Größe (20x20 für normale Blase, 30x30 mit Gegner)
+                base_image = assets.load_image("images/bubble.png", (30, 30))
+                image = assets.load_image("images/bubble.png", (20, 20))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Bubble-Sprite 'bubble.png' konnte nicht geladen werden: {e}")
+                # Fallback: Gezeichnete Blase
+                base_image = None
+                image = pygame.Surface((20, 20), pygame.SRCALPHA)
+                pygame.draw.circle(image, COLOR_BUBBLE, (10, 10), 10, 2)
+            Bubble._shared_images = (image, base_image)
+        return Bubble._shared_images
+
+    @classmethod
+    def pop_image(cls):
+        """Bild der platzenden Blase (einmal gezeichnet, von allen Blasen geteilt)"""
+        if Bubble._pop_image is None:
+            image = pygame.Surface((40, 40), pygame.SRCALPHA)
+            # Platzen-Effekt zeichnen
+            pygame.draw.circle(image, (255, 255, 255, 100), (20, 20), 20, 3)
+            pygame.draw.circle(image, (200, 200, 255, 150), (20, 20), 15, 2)
+            Bubble._pop_image = image
+        return Bubble._pop_image
+
+    def update(self, camera=None, dt=1.0):
+        self.previous_rect = self.rect.copy()
         if self.is_popping:
-            self._handle_popping()
+            self._handle_popping(dt)
             return
             
         # Normale Bewegung
         if not self.rising:
             # Horizontale Bewegung (normal)
-            self.rect.x += self.velocity.x
+            self.rect.x += self.velocity.x * dt
         else:
             # Aufstieg-Bewegung (mit gefangenem Gegner)
-            self.rect.y -= BUBBLE_RISE_SPEED  # Langsam nach oben steigen
+            self.rect.y -= BUBBLE_RISE_SPEED * dt  # Langsam nach oben steigen
             # Gefangenen Gegner mitbewegen
             if self.captured_enemy:
                 self.captured_enemy.rect.center = self.rect.center
         
         # Lebensdauer verringern
-        self.lifetime -= 1
+        self.lifetime -= dt
         
         # Bildschirmgrenzen und Lebensdauer prüfen und ggf. platzen
         if self._should_be_removed(camera):
@@ -152,17 +187,13 @@ class Bubble(Projectile):
             
             # Blase wird größer mit gefangenem Gegner
             if self.base_image:
-                # Verwende Sprite-Textur, größer skaliert
-                self.image = pygame.transform.scale(self.base_image, (30, 30))
-                # Gegner in der Blase zeichnen (kleiner)
-                enemy_mini = pygame.transform.scale(enemy.image, (20, 20))
-                self.image.blit(enemy_mini, (5, 5))
+                self.image = self.capture_image(enemy.image)
             else:
                 # Fallback: Gezeichnete Blase
                 self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
                 pygame.draw.circle(self.image, COLOR_BUBBLE, (15, 15), 15, 2)
                 # Gegner in der Blase zeichnen (kleiner)
-                enemy_mini = pygame.transform.scale(enemy.image, (20, 20))
+                enemy_mini = transform_cache.scale(enemy.image, (20, 20))
                 self.image.blit(enemy_mini, (5, 5))
             
             self.rect = self.image.get_rect(center=self.rect.center)
@@ -173,6 +204,20 @@ class Bubble(Projectile):
             # Nach kurzer Zeit beginnt die Blase zu steigen
             self.lifetime = max(self.lifetime, 120)  # Mindest-Lebensdauer für Aufstieg
             
+    @classmethod
+    def capture_image(cls, enemy_image):
+        """Blase mit Gegner darin: einmal pro (Blasen-Sprite, Gegner-Sprite), danach geteilt"""
+        _, base_image = cls.shared_images()
+        if base_image is None:
+            return None
+
+        def create():
+            image = base_image.copy()
+            # Gegner kleiner in die Blase zeichnen
+            image.blit(transform_cache.scale(enemy_image, (20, 20)), (5, 5))
+            return image
+        return transform_cache.get(base_image, "capture", enemy_image, create)
+
     def start_rising(self):
         """Startet den Aufstieg der Blase (automatisch nach Gegner-Fang)"""
         if self.captured_enemy:
@@ -186,10 +231,7 @@ class Bubble(Projectile):
             self.pop_timer = 30  # 0.5 Sekunden bei 60 FPS
             
             # Platzen-Animation: Blase wird größer und transparenter
-            self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
-            # Platzen-Effekt zeichnen
-            pygame.draw.circle(self.image, (255, 255, 255, 100), (20, 20), 20, 3)
-            pygame.draw.circle(self.image, (200, 200, 255, 150), (20, 20), 15, 2)
+            self.image = self.pop_image()
             self.rect = self.image.get_rect(center=self.rect.center)
             
             # Punkte geben falls Gegner gefangen war
@@ -201,9 +243,9 @@ class Bubble(Projectile):
                 self.captured_enemy.kill()
                 self.captured_enemy = None
     
-    def _handle_popping(self):
+    def _handle_popping(self, dt=1.0):
         """Behandelt die Platzen-Animation"""
-        self.pop_timer -= 1
+        self.pop_timer -= dt
         if self.pop_timer <= 0:
             self.kill()
     
@@ -227,18 +269,11 @@ class Bubble(Projectile):
             self.captured_enemy = None 
 
 class RedPen(Projectile):
-    def __init__(self, x, y, target_player):
-        #Lade das Sprite (oder erstelle ein Fallback-Rechteck)
-        sprite = None
-        try:
-            sprite = pygame.image.load("images/red_pen.png").convert_alpha()
-            sprite = pygame.transform.scale(sprite, (30, 15))
-        except (pygame.error, FileNotFoundError):
-            print("Fehler: 'red_pen.png' konnte nicht geladen werden. Nutze Fallback.")
-            sprite = pygame.Surface((15, 5))
-            sprite.fill((255, 50, 50))
+    # Geteiltes Bild aller Stifte
+    _shared_image = None
 
-        super().__init__(x, y, sprite)
+    def __init__(self, x, y, target_player):
+        super().__init__(x, y, self.shared_image())
 
         #Berechne die Geschwindigkeit und speichere sie in dieser Instanz
         direction = pygame.math.Vector2(target_player.rect.centerx - self.rect.centerx,
@@ -249,9 +284,22 @@ class RedPen(Projectile):
         speed = 8
         self.velocity = direction * speed # Speichere den Geschwindigkeitsvektor
 
-    def update(self, camera=None):
+    @classmethod
+    def shared_image(cls):
+        """Lädt das Stift-Sprite einmal für alle Stifte (oder erstellt ein Fallback-Rechteck)"""
+        if RedPen._shared_image is None:
+            try:
+                RedPen._shared_image = assets.load_image("images/red_pen.png", (30, 15))
+            except (pygame.error, FileNotFoundError):
+                print("Fehler: 'red_pen.png' konnte nicht geladen werden. Nutze Fallback.")
+                RedPen._shared_image = pygame.Surface((15, 5))
+                RedPen._shared_image.fill((255, 50, 50))
+        return RedPen._shared_image
+
+    def update(self, camera=None, dt=1.0):
         #Update Methode bewegt Projektil
-        self.rect.move_ip(self.velocity)
+        self.previous_rect = self.rect.copy()
+        self.rect.move_ip(self.velocity * dt)
 
         #Lösche das Projektil, wenn es weit außerhalb des Bildschirms ist
         if camera and not camera.camera_rect.colliderect(self.rect):
@@ -0,0 +1,126 @@
+"""
+Zonen-Streaming für lange Levels
+Das Level ist in Zonen fester Breite (ZONE_WIDTH, eine Zone = ein Bildschirm
+wie in Level.load) aufgeteilt. Gegner, PowerUps und Sammelobjekte einer Zone
+existieren nur als kompakte Einträge (klasse, x, y, ...), solange die Kamera
+weiter als ZONE_STREAM_DISTANCE entfernt ist. Kommt sie näher, werden die
+Sprites der Zone erzeugt; entfernt sie sich wieder, werden die übrigen
+(nicht eingesammelten, nicht gefangenen) Sprites wieder zu Einträgen.
+
+Sprite-Gruppen, Zeichnen und Kollisionen sehen so nur die Zonen um die Kamera,
+egal wie breit das Level ist. Plattformen bleiben als Kollisionsgeometrie im
+Level (wenige Bytes pro Plattform); nur ihre vorgezeichneten Chunks und die
+einzeln gezeichneten brechenden Plattformen folgen den geladenen Zonen.
+
+Der Boss wird nicht gestreamt (Level.is_boss_defeated hängt daran, dass er
+nur durch einen Sieg verschwindet).
+"""
+
+from settings import ZONE_WIDTH, ZONE_STREAM_DISTANCE, ZONE_STREAMING
+from static_layer import StaticLayer
+
+
+class ZoneStreamer:
+    """Erzeugt und entfernt die Objekte der Zonen je nach Abstand zur Kamera"""
+
+    KINDS = ("enemy", "powerup", "collectible")
+
+    def __init__(self, level, zone_width=ZONE_WIDTH, distance=ZONE_STREAM_DISTANCE, enabled=ZONE_STREAMING):
+        self.level = level
+        self.zone_width = zone_width
+        self.distance = distance
+        self.enabled = enabled
+        self.zone_count = max(1, -(-level.level_width // zone_width))  # Aufrunden
+        # Pro Zone und Art: Einträge der gerade nicht erzeugten Objekte
+        self.stored = [{kind: [] for kind in self.KINDS} for _ in range(self.zone_count)]
+        self.loaded = range(0)  # Geladene Zonen (zusammenhängend um die Kamera)
+        self.materialized = 0   # Seit dem Start erzeugte bzw. weggeräumte Objekte (für Benchmarks)
+        self.retired = 0
+
+    def zone_of(self, x):
+        """Index der Zone, in der die x-Koordinate liegt"""
+        return min(self.zone_count - 1, max(0, int(x) // self.zone_width))
+
+    def add(self, kind, entry):
+        """Legt einen Eintrag (klasse, x, y, ...) in der Zone seiner Position ab
+
+        Maßgeblich ist x wie im Konstruktor, also die linke Kante (rect.x) - die Größe des
+        Sprites steht nicht im Eintrag. _retire legt zurückgestellte Sprites ebenfalls hierüber ab.
+        """
+        self.stored[self.zone_of(entry[1])][kind].append(entry)
+
+    def stored_count(self):
+        return sum(len(entries) for zone in self.stored for entries in zone.values())
+
+    def update(self, camera_rect):
+        """Lädt bzw. entfernt Zonen, wenn sich der Bereich um die Kamera geändert hat"""
+        if self.enabled:
+            wanted = range(self.zone_of(camera_rect.left - self.distance),
+                           self.zone_of(camera_rect.right + self.distance) + 1)
+        else:
+            wanted = range(self.zone_count)
+        if wanted == self.loaded:
+            return
+        new = [index for index in wanted if index not in self.loaded]
+        self.loaded = wanted
+        self._retire()
+        self._materialize(new)
+        self.refresh_platforms()
+
+    def set_enabled(self, enabled, camera_rect):
+        """Schaltet das Streaming um (aus: alle Zonen laden, wie ohne Streaming)"""
+        self.enabled = enabled
+        self.update(camera_rect)
+
+    def _materialize(self, zones):
+        """Erzeugt die Objekte der Zonen (nach Art sortiert, wie beim Laden des Levels)"""
+        level = self.level
+        for kind in self.KINDS:
+            for index in zones:
+                entries, self.stored[index][kind] = self.stored[index][kind], []
+                for entry in entries:
+                    if kind == "enemy":
+                        cls, x, y, velocity_x, velocity_y = entry
+                        enemy = level.create_enemy(cls, x, y)
+                        enemy.velocity.update(velocity_x, velocity_y)
+                        level.enemies.add(enemy)
+                    elif kind == "powerup":
+                        cls, x, y = entry
+                        level.powerups.add(cls(x, y))
+                    else:
+                        cls, x, y = entry
+                        level.collectibles.add(cls(x, y))
+                self.materialized += len(entries)
+
+    def _retire(self):
+        """Macht alle Objekte außerhalb der geladenen Zonen wieder zu Einträgen"""
+        level = self.level
+        boss = level.get_boss()
+        for kind, group in (("enemy", level.enemies), ("powerup", level.powerups),
+                            ("collectible", level.collectibles)):
+            for sprite in list(group):
+                # Gleicher Anker wie in add(): die linke Kante
+                if self.zone_of(sprite.rect.x) in self.loaded or sprite is boss:
+                    continue
+                if kind == "enemy":
+                    entry = (type(sprite), sprite.rect.x, sprite.rect.y, sprite.velocity.x, sprite.velocity.y)
+                else:
+                    entry = (type(sprite), sprite.rect.x, sprite.rect.y)
+                self.add(kind, entry)
+                sprite.kill()
+                self.retired += 1
+
+    def refresh_platforms(self):
+        """Vorgezeichnete Chunks und einzeln gezeichnete Plattformen nur für die geladenen Zonen"""
+        level = self.level
+        dynamic = [p for p in level.platforms if not StaticLayer.is_static(p)]
+        if not self.enabled:
+            level.static_layer.retain(0, level.level_width)
+            level.dynamic_platforms = dynamic
+            level.render_index.set_layer("platform", dynamic)
+            return
+        left = self.loaded.start * self.zone_width
+        right = self.loaded.stop * self.zone_width
+        level.static_layer.retain(left, right)
+        level.dynamic_platforms = [p for p in dynamic if p.rect.right > left and p.rect.left < right]
+        level.render_index.set_layer("platform", level.dynamic_platforms)